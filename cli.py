@@ -1,45 +1,618 @@
 import asyncio
+import time
 import typer
+import orjson
+from datetime import datetime
 from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import select, update
 
 from core.database import AsyncSessionLocal, init_db
 from core.config import settings
-from core.cerebras import CerebrasClient
-from features.job_processing.services.evaluator import JobEvaluator
+from core.backends import BACKEND_PROFILES, create_backend
+from core.llm_replay import RecordingClient, ReplayClient
+from features.job_processing.models.job import Job
+from features.job_processing.services.evaluator import JobEvaluator, load_default_expertise
+from features.job_processing.services.decomposed import DecomposedEvaluator
+from features.job_processing.services.drop_watcher import DropWatcher
+from features.job_processing.services.fan_out import FanOutEvaluator, load_active_profiles
 from features.job_processing.services.ingestion import JobIngestionService
+from features.job_processing.services.prompt_benchmark import (
+    PromptBenchmark,
+    render_markdown,
+    sample_jobs,
+)
+from features.job_processing.services.reevaluation import ReevaluationScheduler
+from features.job_processing.services.relevance_filter import RelevanceFilter
+from features.job_processing.services.task_queue import EvaluationTaskQueue
+from features.job_processing.services.telemetry import TelemetryWriter
+from features.job_processing.services.worker import EvaluationWorker
+from features.job_processing.utils.tech_extractor import extract_tech
+
+app = typer.Typer(help="Upwork job processing commands.")
+
+
+EVALUATION_MODES = ("single", "decomposed")
+
+
+def open_backend(name: str):
+    """LLM client for a backend name, reported as a CLI parameter error if unknown."""
+    if name not in BACKEND_PROFILES:
+        raise typer.BadParameter(f"--backend must be one of {', '.join(BACKEND_PROFILES)}")
+    return create_backend(name)
+
+
+async def build_evaluator(
+    llm_client,
+    fan_out: bool = False,
+    mode: str = settings.evaluation_mode,
+) -> JobEvaluator:
+    """Evaluator for the chosen mode, or a fan-out evaluator over all active profiles.
+
+    Single and decomposed evaluators score against the stored "default" profile.
+    """
+    if mode not in EVALUATION_MODES:
+        raise typer.BadParameter(f"--mode must be one of {', '.join(EVALUATION_MODES)}")
+    if fan_out and mode != "single":
+        raise typer.BadParameter("--fan-out only supports --mode single")
+    if not fan_out:
+        async with AsyncSessionLocal() as db:
+            expertise = await load_default_expertise(db)
+        if mode == "decomposed":
+            return DecomposedEvaluator(llm_client, expertise=expertise)
+        return JobEvaluator(llm_client, expertise=expertise)
+
+    async with AsyncSessionLocal() as db:
+        profiles = await load_active_profiles(db)
+    if not profiles:
+        raise typer.BadParameter("--fan-out needs at least one active profile")
+    print(f"Fan-out over profiles: {', '.join(p.id for p in profiles)}")
+    return FanOutEvaluator(llm_client, profiles)
 
 
-async def ingest(file_path: Path):
+async def ingest(
+    file_path: Path,
+    enqueue: bool = False,
+    prefilter: bool = False,
+    record: Optional[Path] = None,
+    replay: Optional[Path] = None,
+    replay_latency: str = "recorded",
+    fan_out: bool = False,
+    mode: str = settings.evaluation_mode,
+    order: str = settings.evaluation_order,
+    backend: str = settings.llm_backend,
+    parse_workers: int = settings.ingest_parse_workers,
+    force: bool = False,
+):
     await init_db()
 
     async with AsyncSessionLocal() as db:
-        cerebras_client = CerebrasClient()
-        evaluator = JobEvaluator(cerebras_client)
-        ingestion_service = JobIngestionService(evaluator)
+        reference_time = None
+        concurrency = 1
+        if replay:
+            llm_client = ReplayClient(replay, latency=replay_latency)
+            reference_time = llm_client.reference_time
+        else:
+            llm_client = open_backend(backend)
+            concurrency = llm_client.profile.concurrency
+            print(f"LLM backend: {backend} ({llm_client.model}, concurrency {concurrency})")
+            if record:
+                reference_time = datetime.utcnow()
+                llm_client = RecordingClient(llm_client, record, reference_time)
+
+        evaluator = await build_evaluator(llm_client, fan_out, mode)
+        ingestion_service = JobIngestionService(
+            evaluator,
+            queue=EvaluationTaskQueue() if enqueue else None,
+            relevance_filter=RelevanceFilter.load() if prefilter else None,
+            reference_time=reference_time,
+            order=order,
+            concurrency=concurrency,
+            parse_workers=parse_workers,
+        )
+        telemetry = TelemetryWriter()
+        if not replay:
+            # Replayed calls would only duplicate the recorded run's telemetry
+            telemetry.attach(evaluator)
 
         try:
-            results = await ingestion_service.ingest_apify_json(
-                file_path,
-                db,
-                checkpoint_interval=settings.checkpoint_interval,
-            )
+            started = time.perf_counter()
+            async with telemetry:
+                results = await ingestion_service.ingest_apify_json(
+                    file_path,
+                    db,
+                    checkpoint_interval=settings.checkpoint_interval,
+                    force=force,
+                )
+            elapsed = time.perf_counter() - started
+
+            if results["already_completed"]:
+                print(
+                    f"Already ingested by run {results['run_id']} "
+                    f"({results['total_jobs']} jobs); use --force to ingest it again"
+                )
+                return
 
             print("\n=== Ingestion Complete ===")
+            print(f"Run: {results['run_id']}")
+            if results["resumed_from"]:
+                print(f"Resumed after record: {results['resumed_from']}")
+                resumed = results["resumed"]
+                print(
+                    f"Earlier records still unevaluated: {resumed['evaluated']} evaluated, "
+                    f"{resumed['enqueued']} enqueued, {resumed['errors']} errors "
+                    "(not included below)"
+                )
             print(f"Total jobs: {results['total_jobs']}")
-            print(f"Ingested: {results['ingested']}")
+            print(
+                f"Ingested: {results['ingested']} "
+                f"({results['inserted']} new, {results['updated']} updated, "
+                f"{results['unchanged']} unchanged)"
+            )
             print(f"Evaluated: {results['evaluated']}")
             print(f"AI-related: {results['ai_related']}")
             print(f"Not AI-related: {results['not_ai_related']}")
+            if enqueue:
+                print(f"Enqueued for workers: {results['enqueued']}")
+            if prefilter:
+                print(f"LLM calls saved by classifier: {results['llm_skipped']}")
             print(f"Errors: {results['errors']}")
+            print(
+                f"Elapsed: {elapsed:.2f}s "
+                f"({results['total_jobs'] / elapsed if elapsed else 0:.1f} jobs/s)"
+            )
 
         finally:
-            await cerebras_client.close()
+            await llm_client.close()
 
 
-if __name__ == "__main__":
-    import sys
+async def bulk_load(file_path: Path, enqueue: bool, order: str):
+    await init_db()
+
+    async with AsyncSessionLocal() as db:
+        ingestion_service = JobIngestionService(
+            None,
+            queue=EvaluationTaskQueue() if enqueue else None,
+            order=order,
+        )
+        started = time.perf_counter()
+        results = await ingestion_service.bulk_load_apify_json(file_path, db)
+        elapsed = time.perf_counter() - started
+
+    print("\n=== Bulk Load Complete ===")
+    print(f"Total jobs: {results['total_jobs']}")
+    print(
+        f"Ingested: {results['ingested']} "
+        f"({results['inserted']} new, {results['updated']} updated, "
+        f"{results['unchanged']} unchanged)"
+    )
+    print(f"Without evaluation: {results['unevaluated']}")
+    if enqueue:
+        print(f"Enqueued for workers: {results['enqueued']}")
+    print(f"Errors: {results['errors']}")
+    print(
+        f"Elapsed: {elapsed:.2f}s "
+        f"({results['total_jobs'] / elapsed if elapsed else 0:.1f} jobs/s)"
+    )
+
+
+async def watch(
+    directory: Path,
+    archive: Optional[Path],
+    poll_interval: float,
+    drain: bool,
+    enqueue: bool = False,
+    prefilter: bool = False,
+    fan_out: bool = False,
+    mode: str = settings.evaluation_mode,
+    order: str = settings.evaluation_order,
+    backend: str = settings.llm_backend,
+):
+    await init_db()
+
+    # One LLM client, evaluator and telemetry writer for all files; sessions
+    # come from the shared engine pool
+    llm_client = open_backend(backend)
+    print(f"LLM backend: {backend} ({llm_client.model}, concurrency {llm_client.profile.concurrency})")
+    evaluator = await build_evaluator(llm_client, fan_out, mode)
+    ingestion_service = JobIngestionService(
+        evaluator,
+        queue=EvaluationTaskQueue() if enqueue else None,
+        relevance_filter=RelevanceFilter.load() if prefilter else None,
+        order=order,
+        concurrency=llm_client.profile.concurrency,
+    )
+
+    async def ingest_file(path: Path) -> dict:
+        async with AsyncSessionLocal() as db:
+            return await ingestion_service.ingest_apify_json(
+                path, db, checkpoint_interval=settings.checkpoint_interval
+            )
+
+    watcher = DropWatcher(directory, ingest_file, archive_dir=archive, poll_interval=poll_interval)
+    try:
+        print(f"Watching {directory} (every {poll_interval:g}s)")
+        async with TelemetryWriter() as telemetry:
+            telemetry.attach(evaluator)
+            results = await watcher.run(drain=drain)
+
+        print("\n=== Watch Finished ===")
+        print(f"Files ingested: {results['files']}")
+        print(f"Files failed: {results['failed']}")
+        print(f"Total jobs: {results['total_jobs']}")
+        print(f"Evaluated: {results['evaluated']}")
+        print(f"Errors: {results['errors']}")
+    finally:
+        await llm_client.close()
+
+
+async def work(
+    concurrency: int,
+    drain: bool,
+    fan_out: bool = False,
+    mode: str = settings.evaluation_mode,
+    backend: str = settings.llm_backend,
+):
+    await init_db()
+
+    llm_client = open_backend(backend)
+    evaluator = await build_evaluator(llm_client, fan_out, mode)
+    worker = EvaluationWorker(evaluator, EvaluationTaskQueue(), concurrency=concurrency)
+
+    try:
+        print(f"Worker {worker.worker_id} started with {concurrency} evaluators")
+        async with TelemetryWriter() as telemetry:
+            telemetry.attach(evaluator)
+            results = await worker.run(drain=drain)
+
+        print("\n=== Worker Finished ===")
+        print(f"Evaluated: {results['evaluated']}")
+        print(f"AI-related: {results['ai_related']}")
+        print(f"Not AI-related: {results['not_ai_related']}")
+        print(f"Errors: {results['errors']}")
+    finally:
+        await llm_client.close()
+
+
+async def tag_jobs(batch_size: int):
+    await init_db()
+
+    tagged = 0
+    last_id = ""
+    async with AsyncSessionLocal() as db:
+        while True:
+            result = await db.execute(
+                select(Job.id, Job.title, Job.description)
+                .where(Job.id > last_id)
+                .order_by(Job.id)
+                .limit(batch_size)
+            )
+            rows = result.all()
+            if not rows:
+                break
+
+            updates = []
+            for job_id, title, description in rows:
+                detected_tech, detected_expertise_ids = extract_tech(f"{title}\n{description}")
+                updates.append({
+                    "id": job_id,
+                    "detected_tech": detected_tech,
+                    "detected_expertise_ids": detected_expertise_ids,
+                })
+            # ORM bulk UPDATE by primary key: one executemany per batch
+            await db.execute(update(Job), updates)
+            await db.commit()
+
+            tagged += len(rows)
+            last_id = rows[-1].id
+            print(f"Tagged {tagged} jobs")
 
-    def _main(file_path: Path):
-        asyncio.run(ingest(file_path))
+    print(f"\nDone: {tagged} jobs tagged")
 
-    typer.run(_main)
\ No newline at end of file
+
+async def train_classifier(output: Path, threshold: float):
+    await init_db()
+
+    async with AsyncSessionLocal() as db:
+        relevance_filter, report = await RelevanceFilter.train_from_db(db, skip_threshold=threshold)
+
+    relevance_filter.save(output)
+
+    print("\n=== Relevance Classifier (holdout) ===")
+    print(f"Train samples: {report['train_samples']}, holdout samples: {report['samples']}")
+    print(f"Accuracy: {report['accuracy']:.3f}")
+    print(f"Brier score: {report['brier_score']:.4f}, log loss: {report['log_loss']:.4f}")
+    print("Calibration (predicted → observed AI-related rate):")
+    for bin_ in report["reliability"]:
+        print(
+            f"  {bin_['range']}: {bin_['mean_predicted']:.2f} → {bin_['observed_rate']:.2f} "
+            f"(n={bin_['count']})"
+        )
+    print(
+        f"At threshold {threshold}: {report['llm_calls_saved']:.1%} of LLM calls saved, "
+        f"{report['positives_skipped']} AI-related jobs skipped "
+        f"(recall kept {report['positive_recall_kept']:.1%})"
+    )
+    print(f"Model saved to {output} (version {relevance_filter.version})")
+
+
+async def reevaluate(
+    rate: int,
+    limit: Optional[int],
+    interval: float,
+    fan_out: bool = False,
+    mode: str = settings.evaluation_mode,
+    backend: str = settings.llm_backend,
+):
+    await init_db()
+
+    async with AsyncSessionLocal() as db:
+        llm_client = open_backend(backend)
+        evaluator = await build_evaluator(llm_client, fan_out, mode)
+        scheduler = ReevaluationScheduler(
+            evaluator,
+            rate_per_minute=rate,
+            batch_size=settings.reevaluate_batch_size,
+        )
+
+        try:
+            async with TelemetryWriter() as telemetry:
+                telemetry.attach(evaluator)
+                if interval > 0:
+                    await scheduler.run_forever(db, interval)
+                else:
+                    results = await scheduler.run_once(db, limit=limit)
+
+                    print("\n=== Re-evaluation Complete ===")
+                    print(f"Stale at start: {results['stale']}")
+                    print(f"Re-evaluated: {results['reevaluated']}")
+                    print(f"Errors: {results['errors']}")
+                    print(f"Remaining: {results['remaining']}")
+        finally:
+            await llm_client.close()
+
+
+async def bench_prompts(
+    variants: list[str],
+    sample: int,
+    seed: int,
+    output: Path,
+    backend: str = settings.llm_backend,
+):
+    await init_db()
+
+    async with AsyncSessionLocal() as db:
+        jobs = await sample_jobs(db, sample, seed)
+        expertise = await load_default_expertise(db)
+
+    llm_client = open_backend(backend)
+    benchmark = PromptBenchmark(llm_client, variants, expertise=expertise)
+
+    try:
+        print(f"Benchmarking {', '.join(benchmark.variants)} on {len(jobs)} jobs")
+        report = await benchmark.run(jobs)
+    finally:
+        await llm_client.close()
+
+    report["seed"] = seed
+    report["model"] = llm_client.model
+    report["backend"] = backend
+    output.parent.mkdir(parents=True, exist_ok=True)
+    json_path = output.with_suffix(".json")
+    markdown_path = output.with_suffix(".md")
+    json_path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    markdown_path.write_text(render_markdown(report))
+
+    print(render_markdown(report))
+    print(f"Report written to {json_path} and {markdown_path}")
+
+
+@app.command("ingest")
+def ingest_command(
+    file_path: Path,
+    enqueue: bool = typer.Option(
+        False, help="Only queue new jobs for 'cli.py worker' instead of evaluating inline"
+    ),
+    prefilter: bool = typer.Option(
+        False, help="Skip the LLM for jobs the local classifier rules out"
+    ),
+    record: Optional[Path] = typer.Option(
+        None, help="Record every LLM request/response with timings to this file"
+    ),
+    replay: Optional[Path] = typer.Option(
+        None, help="Serve LLM responses from a recording instead of the API"
+    ),
+    replay_latency: str = typer.Option(
+        "recorded", help="With --replay: 'recorded' latencies or 'zero'"
+    ),
+    fan_out: bool = typer.Option(
+        False, help="Score each job against all active profiles in one LLM call"
+    ),
+    mode: str = typer.Option(
+        settings.evaluation_mode,
+        help="'single' prompt, or 'decomposed' into three concurrent prompts (faster, more tokens)",
+    ),
+    order: str = typer.Option(
+        settings.evaluation_order,
+        help="'value' evaluates the most promising jobs first, 'file' keeps file order",
+    ),
+    backend: str = typer.Option(
+        settings.llm_backend, help="LLM backend: cerebras, ollama or llamacpp"
+    ),
+    parse_workers: int = typer.Option(
+        settings.ingest_parse_workers, help="Processes parsing records (0 = a single thread)"
+    ),
+    force: bool = typer.Option(
+        False, help="Ingest from the first record even if this file was already ingested"
+    ),
+):
+    """Ingest an Apify export (JSON array or NDJSON, optionally .gz/.zst) and evaluate new jobs."""
+    if record and replay:
+        raise typer.BadParameter("--record and --replay are mutually exclusive")
+    asyncio.run(
+        ingest(
+            file_path,
+            enqueue=enqueue,
+            prefilter=prefilter,
+            record=record,
+            replay=replay,
+            replay_latency=replay_latency,
+            fan_out=fan_out,
+            mode=mode,
+            order=order,
+            backend=backend,
+            parse_workers=parse_workers,
+            force=force,
+        )
+    )
+
+
+@app.command("bulk-load")
+def bulk_load_command(
+    file_path: Path,
+    enqueue: bool = typer.Option(
+        True, help="Queue jobs without an evaluation for 'cli.py worker'"
+    ),
+    order: str = typer.Option(
+        settings.evaluation_order,
+        help="'value' queues the most promising jobs first, 'file' keeps file order",
+    ),
+):
+    """Load a large Apify export via COPY and a set-based merge, without evaluating."""
+    asyncio.run(bulk_load(file_path, enqueue, order))
+
+
+@app.command("watch")
+def watch_command(
+    directory: Path = typer.Argument(..., exists=True, file_okay=False),
+    archive: Optional[Path] = typer.Option(
+        None, help="Where ingested files are moved (default: DIRECTORY/processed)"
+    ),
+    poll_interval: float = typer.Option(
+        settings.watch_poll_interval, help="Seconds between directory scans"
+    ),
+    drain: bool = typer.Option(False, help="Exit once no files are waiting"),
+    enqueue: bool = typer.Option(
+        False, help="Only queue new jobs for 'cli.py worker' instead of evaluating inline"
+    ),
+    prefilter: bool = typer.Option(
+        False, help="Skip the LLM for jobs the local classifier rules out"
+    ),
+    fan_out: bool = typer.Option(
+        False, help="Score each job against all active profiles in one LLM call"
+    ),
+    mode: str = typer.Option(
+        settings.evaluation_mode,
+        help="'single' prompt, or 'decomposed' into three concurrent prompts (faster, more tokens)",
+    ),
+    order: str = typer.Option(
+        settings.evaluation_order,
+        help="'value' evaluates the most promising jobs first, 'file' keeps file order",
+    ),
+    backend: str = typer.Option(
+        settings.llm_backend, help="LLM backend: cerebras, ollama or llamacpp"
+    ),
+):
+    """Ingest Apify exports dropped into DIRECTORY as they arrive, then archive them."""
+    asyncio.run(
+        watch(
+            directory,
+            archive,
+            poll_interval,
+            drain,
+            enqueue=enqueue,
+            prefilter=prefilter,
+            fan_out=fan_out,
+            mode=mode,
+            order=order,
+            backend=backend,
+        )
+    )
+
+
+@app.command("worker")
+def worker_command(
+    concurrency: int = typer.Option(
+        settings.worker_concurrency, help="Concurrent evaluators in this process"
+    ),
+    drain: bool = typer.Option(False, help="Exit once the queue is empty"),
+    fan_out: bool = typer.Option(
+        False, help="Score each job against all active profiles in one LLM call"
+    ),
+    mode: str = typer.Option(
+        settings.evaluation_mode,
+        help="'single' prompt, or 'decomposed' into three concurrent prompts (faster, more tokens)",
+    ),
+    backend: str = typer.Option(
+        settings.llm_backend, help="LLM backend: cerebras, ollama or llamacpp"
+    ),
+):
+    """Evaluate jobs from the shared evaluation queue."""
+    asyncio.run(work(concurrency, drain, fan_out, mode, backend))
+
+
+@app.command("tag-jobs")
+def tag_jobs_command(
+    batch_size: int = typer.Option(500, help="Jobs per UPDATE batch"),
+):
+    """Re-run the local tech dictionary over all stored jobs."""
+    asyncio.run(tag_jobs(batch_size))
+
+
+@app.command("train-classifier")
+def train_classifier_command(
+    output: Path = typer.Option(Path(settings.relevance_model_path), help="Model file"),
+    threshold: float = typer.Option(
+        settings.relevance_skip_threshold,
+        help="Skip the LLM when p(AI-related) is at or below this",
+    ),
+):
+    """Train the local relevance classifier from stored evaluations."""
+    asyncio.run(train_classifier(output, threshold))
+
+
+@app.command("reevaluate")
+def reevaluate_command(
+    rate: int = typer.Option(
+        settings.reevaluate_rate_per_minute, help="Maximum re-evaluations per minute"
+    ),
+    limit: Optional[int] = typer.Option(None, help="Stop after this many re-evaluations"),
+    interval: float = typer.Option(
+        0, help="Keep running, polling for stale rows every N seconds (0 = single pass)"
+    ),
+    fan_out: bool = typer.Option(
+        False, help="Score each job against all active profiles in one LLM call"
+    ),
+    mode: str = typer.Option(
+        settings.evaluation_mode,
+        help="'single' prompt, or 'decomposed' into three concurrent prompts (faster, more tokens)",
+    ),
+    backend: str = typer.Option(
+        settings.llm_backend, help="LLM backend: cerebras, ollama or llamacpp"
+    ),
+):
+    """Re-evaluate evaluations produced by an older prompt/model version."""
+    asyncio.run(reevaluate(rate, limit, interval, fan_out, mode, backend))
+
+
+@app.command("bench-prompts")
+def bench_prompts_command(
+    variant: list[str] = typer.Option(
+        ["compact"], help="Prompt variant to compare against the baseline (repeatable)"
+    ),
+    sample: int = typer.Option(100, help="Number of stored jobs to evaluate"),
+    seed: int = typer.Option(0, help="Sample seed; the same seed selects the same jobs"),
+    output: Path = typer.Option(
+        Path("reports/prompt_benchmark"), help="Report path without extension (.json and .md)"
+    ),
+    backend: str = typer.Option(
+        settings.llm_backend, help="LLM backend: cerebras, ollama or llamacpp"
+    ),
+):
+    """Compare prompt variants on tokens, latency, parse failures and score agreement."""
+    asyncio.run(bench_prompts(variant, sample, seed, output, backend))
+
+
+if __name__ == "__main__":
+    app()
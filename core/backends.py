@@ -0,0 +1,53 @@
+from typing import Callable, Dict
+
+from core.cerebras import CerebrasClient, cerebras_profile
+from core.config import settings
+from core.llm import BackendProfile
+from core.openai_compatible import OpenAICompatibleClient
+
+
+def ollama_profile() -> BackendProfile:
+    """Local Ollama server (OpenAI-compatible /v1 API)."""
+    return BackendProfile(
+        name="ollama",
+        base_url=settings.ollama_base_url,
+        model=settings.ollama_model,
+        concurrency=settings.ollama_concurrency,
+        timeout=settings.local_llm_timeout,
+    )
+
+
+def llamacpp_profile() -> BackendProfile:
+    """Local llama.cpp server; start it with --parallel >= LLAMACPP_CONCURRENCY."""
+    return BackendProfile(
+        name="llamacpp",
+        base_url=settings.llamacpp_base_url,
+        model=settings.llamacpp_model,
+        concurrency=settings.llamacpp_concurrency,
+        timeout=settings.local_llm_timeout,
+    )
+
+
+BACKEND_PROFILES: Dict[str, Callable[[], BackendProfile]] = {
+    "cerebras": cerebras_profile,
+    "ollama": ollama_profile,
+    "llamacpp": llamacpp_profile,
+}
+
+
+def create_backend(name: str = settings.llm_backend) -> OpenAICompatibleClient:
+    """Create the client for a named backend profile.
+
+    Args:
+        name: One of BACKEND_PROFILES
+
+    Returns:
+        Client configured with the backend's concurrency, pacing and timeout
+    """
+    if name not in BACKEND_PROFILES:
+        raise ValueError(
+            f"Unknown LLM backend {name!r}; available: {', '.join(BACKEND_PROFILES)}"
+        )
+    if name == "cerebras":
+        return CerebrasClient()
+    return OpenAICompatibleClient(BACKEND_PROFILES[name]())
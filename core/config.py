@@ -3,13 +3,41 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     database_url: str
-    cerebras_api_key: str
+    cerebras_api_key: str = ""
     cerebras_model: str = "zai-glm-4.7"
     rate_limit_requests: int = 2
     rate_limit_concurrent: int = 2
+    rate_limit_reserved: int = 1
     api_timeout: int = 30
+    cerebras_input_cost_per_mtok: float = 2.25
+    cerebras_output_cost_per_mtok: float = 2.75
+    llm_backend: str = "cerebras"
+    ollama_base_url: str = "http://localhost:11434/v1"
+    ollama_model: str = "qwen2.5:7b-instruct"
+    ollama_concurrency: int = 4
+    llamacpp_base_url: str = "http://localhost:8080/v1"
+    llamacpp_model: str = "local"
+    llamacpp_concurrency: int = 8
+    local_llm_timeout: float = 120.0
     filter_budget_min: int = 500
     checkpoint_interval: int = 10
+    ingest_batch_size: int = 500
+    ingest_queue_size: int = 1000
+    ingest_parse_workers: int = 0
+    watch_poll_interval: float = 5.0
+    evaluation_batch_size: int = 50
+    evaluation_flush_interval: float = 2.0
+    worker_concurrency: int = 4
+    queue_lease_seconds: int = 300
+    queue_poll_interval: float = 2.0
+    relevance_model_path: str = "artifacts/relevance_classifier.npz"
+    relevance_skip_threshold: float = 0.03
+    reevaluate_rate_per_minute: int = 30
+    reevaluate_batch_size: int = 20
+    evaluation_mode: str = "single"
+    evaluation_order: str = "value"
+    telemetry_batch_size: int = 200
+    telemetry_flush_interval: float = 5.0
     log_level: str = "INFO"
 
     class Config:
@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+from typing import Any, Generic, Protocol, TypeVar, runtime_checkable
+
+from pydantic import BaseModel
+
+T = TypeVar("T", bound=BaseModel)
+
+
+@dataclass
+class ChatCompletionResult(Generic[T]):
+    """Validated response plus per-call usage and timing."""
+
+    response: T
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency: float = 0.0  # Seconds from first request to validated response, retries included
+    queue_wait: float = 0.0  # Seconds spent waiting for a concurrency/rate-limit slot
+    attempts: int = 1
+    parse_failures: int = 0  # Attempts whose content was not valid JSON for response_model
+    model: str = ""
+    backend: str = ""  # BackendProfile name, or "replay"
+    cost_usd: float = 0.0  # From the profile's per-token prices
+
+
+class LLMCallError(Exception):
+    """Raised when an LLM call failed on every attempt.
+
+    `result` reports the failed call like a successful one (attempts, parse
+    failures, timing) with response=None; the last attempt's error is the
+    exception's __cause__.
+    """
+
+    def __init__(self, message: str, result: ChatCompletionResult):
+        super().__init__(message)
+        self.result = result
+
+
+@dataclass(frozen=True)
+class BackendProfile:
+    """Connection and throughput settings of one OpenAI-compatible LLM server."""
+
+    name: str
+    base_url: str
+    model: str
+    api_key: str = ""
+    concurrency: int = 2  # Requests in flight; also how many jobs a run evaluates at once
+    requests_per_second: float = 0.0  # Pacing between request starts, 0 = unpaced
+    reserved: int = 1  # Extra slots kept free for interactive requests
+    timeout: float = 30.0
+    json_mode: bool = True  # Send response_format={"type": "json_object"}
+    input_cost_per_mtok: float = 0.0  # USD per million prompt tokens
+    output_cost_per_mtok: float = 0.0  # USD per million completion tokens
+
+    def cost(self, prompt_tokens: int, completion_tokens: int) -> float:
+        """USD cost of one call."""
+        return (
+            prompt_tokens * self.input_cost_per_mtok
+            + completion_tokens * self.output_cost_per_mtok
+        ) / 1_000_000
+
+
+@runtime_checkable
+class LLMBackend(Protocol):
+    """What evaluators need from an LLM client."""
+
+    model: str
+
+    async def chat_completion(
+        self,
+        messages: list[dict[str, Any]],
+        response_model: type[T],
+    ) -> T: ...
+
+    async def chat_completion_result(
+        self,
+        messages: list[dict[str, Any]],
+        response_model: type[T],
+    ) -> ChatCompletionResult[T]: ...
+
+    async def close(self) -> None: ...
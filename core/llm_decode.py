@@ -0,0 +1,42 @@
+from functools import lru_cache
+from typing import Any, Dict, Tuple, TypeVar
+
+import orjson
+from pydantic import TypeAdapter
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=None)
+def response_adapter(response_model: type[T]) -> TypeAdapter[T]:
+    """TypeAdapter for a response model, built once per model."""
+    return TypeAdapter(response_model)
+
+
+def decode_envelope(body: bytes) -> Tuple[Any, Dict[str, Any]]:
+    """Extract message content and usage from a chat completions response body.
+
+    Args:
+        body: Raw HTTP response body
+
+    Returns:
+        (content, usage); content is usually the model's JSON as a string
+    """
+    data = orjson.loads(body)
+    return data["choices"][0]["message"]["content"], data.get("usage") or {}
+
+
+def decode_content(content: Any, response_model: type[T]) -> T:
+    """Validate message content into response_model.
+
+    JSON strings are parsed and validated in one pass by pydantic-core, without
+    an intermediate dict.
+
+    Raises:
+        ValueError: Content is not valid JSON or does not match response_model
+            (pydantic ValidationError)
+    """
+    adapter = response_adapter(response_model)
+    if isinstance(content, (str, bytes)):
+        return adapter.validate_json(content)
+    return adapter.validate_python(content)
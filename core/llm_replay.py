@@ -0,0 +1,163 @@
+import asyncio
+import hashlib
+import time
+from collections import defaultdict, deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, TypeVar
+
+import orjson
+from pydantic import BaseModel
+
+from core.llm import ChatCompletionResult
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class ReplayMissError(LookupError):
+    """Raised when a replayed request was never recorded."""
+
+
+def request_fingerprint(
+    model: str,
+    messages: list[dict[str, Any]],
+    response_model: type[BaseModel],
+) -> str:
+    """Stable hash identifying a chat completion request."""
+    payload = orjson.dumps(
+        {"model": model, "messages": messages, "response_model": response_model.__name__},
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+class RecordingClient:
+    """Wraps an LLM client and records every completion to a JSONL file.
+
+    The first line is a header with the model and the reference time used for
+    job ages; each following line holds a request fingerprint, the validated
+    response, the call latency and token usage.
+    """
+
+    def __init__(self, client, path: Path, reference_time: datetime):
+        """Initialize recorder.
+
+        Args:
+            client: LLM backend to wrap (any LLMBackend)
+            path: Recording file (overwritten)
+            reference_time: Pinned "now" the ingestion run uses for job ages
+        """
+        self.client = client
+        self.model = client.model
+        self.reference_time = reference_time
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "wb")
+        self._write({
+            "kind": "header",
+            "model": self.model,
+            "reference_time": reference_time.isoformat(),
+        })
+
+    def _write(self, entry: Dict[str, Any]):
+        self._file.write(orjson.dumps(entry) + b"\n")
+        self._file.flush()
+
+    async def chat_completion(
+        self,
+        messages: list[dict[str, Any]],
+        response_model: type[T],
+    ) -> T:
+        result = await self.chat_completion_result(messages, response_model)
+        return result.response
+
+    async def chat_completion_result(
+        self,
+        messages: list[dict[str, Any]],
+        response_model: type[T],
+    ) -> ChatCompletionResult[T]:
+        started = time.perf_counter()
+        result = await self.client.chat_completion_result(messages, response_model)
+        self._write({
+            "kind": "call",
+            "fingerprint": request_fingerprint(self.model, messages, response_model),
+            "response": result.response.model_dump(mode="json"),
+            "latency": time.perf_counter() - started,
+            "prompt_tokens": result.prompt_tokens,
+            "completion_tokens": result.completion_tokens,
+            "attempts": result.attempts,
+            "parse_failures": result.parse_failures,
+        })
+        return result
+
+    async def close(self):
+        self._file.close()
+        await self.client.close()
+
+
+class ReplayClient:
+    """Serves completions from a RecordingClient file instead of calling an LLM.
+
+    Responses are matched by request fingerprint. Latency is either replayed as
+    recorded or dropped entirely to benchmark the pipeline alone.
+    """
+
+    def __init__(self, path: Path, latency: str = "recorded"):
+        """Load a recording.
+
+        Args:
+            path: File written by RecordingClient
+            latency: "recorded" to sleep for the recorded latency, "zero" to return at once
+        """
+        if latency not in ("recorded", "zero"):
+            raise ValueError(f"latency must be 'recorded' or 'zero', got {latency!r}")
+        self.latency = latency
+        self.calls = 0
+        self._entries: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+
+        with open(path, "rb") as f:
+            header = orjson.loads(f.readline())
+            for line in f:
+                entry = orjson.loads(line)
+                self._entries[entry["fingerprint"]].append(entry)
+
+        self.model = header["model"]
+        self.reference_time = datetime.fromisoformat(header["reference_time"])
+
+    async def chat_completion(
+        self,
+        messages: list[dict[str, Any]],
+        response_model: type[T],
+    ) -> T:
+        result = await self.chat_completion_result(messages, response_model)
+        return result.response
+
+    async def chat_completion_result(
+        self,
+        messages: list[dict[str, Any]],
+        response_model: type[T],
+    ) -> ChatCompletionResult[T]:
+        fingerprint = request_fingerprint(self.model, messages, response_model)
+        entries = self._entries.get(fingerprint)
+        if not entries:
+            raise ReplayMissError(f"No recorded response for request {fingerprint[:12]}")
+
+        # Repeated identical requests replay in recorded order; the last one repeats
+        entry = entries.popleft() if len(entries) > 1 else entries[0]
+        if self.latency == "recorded":
+            await asyncio.sleep(entry["latency"])
+
+        self.calls += 1
+        return ChatCompletionResult(
+            response=response_model.model_validate(entry["response"]),
+            prompt_tokens=entry.get("prompt_tokens", 0),
+            completion_tokens=entry.get("completion_tokens", 0),
+            latency=entry["latency"] if self.latency == "recorded" else 0.0,
+            attempts=entry.get("attempts", 1),
+            parse_failures=entry.get("parse_failures", 0),
+            model=self.model,
+            backend="replay",
+        )
+
+    async def close(self):
+        pass
@@ -0,0 +1,200 @@
+import asyncio
+import time
+import httpx
+import orjson
+from typing import Any, TypeVar
+from pydantic import BaseModel
+
+from core.llm import BackendProfile, ChatCompletionResult, LLMCallError
+from core.llm_decode import decode_content, decode_envelope
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class OpenAICompatibleClient:
+    """Client for any OpenAI-compatible chat completions API with rate limiting.
+
+    Handles chat completions with automatic retry logic and respects the
+    concurrency, pacing and timeout of its BackendProfile.
+    """
+
+    def __init__(self, profile: BackendProfile):
+        """Initialize client.
+
+        Args:
+            profile: Server URL, model and throughput settings
+        """
+        self.profile = profile
+        self.api_key = profile.api_key
+        self.model = profile.model
+        self.base_url = profile.base_url
+        self._http_client: httpx.AsyncClient | None = None
+
+        self._semaphore = asyncio.Semaphore(profile.concurrency)
+        # Extra slot for interactive requests so they never queue behind batch work
+        self._reserved_semaphore = asyncio.Semaphore(profile.reserved)
+        self._request_lock = asyncio.Lock()
+        self._min_request_interval = (
+            1.0 / profile.requests_per_second if profile.requests_per_second else 0.0
+        )
+        self._last_request_time = 0.0
+        self._loop = asyncio.get_event_loop()
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get or create HTTP client with authorization header."""
+        if self._http_client is None:
+            headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+            self._http_client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=headers,
+                timeout=self.profile.timeout,
+            )
+        return self._http_client
+
+    async def _rate_limit(self):
+        """Enforce rate limiting between API requests."""
+        if not self._min_request_interval:
+            return
+        async with self._request_lock:
+            elapsed = self._loop.time() - self._last_request_time
+            if elapsed < self._min_request_interval:
+                await asyncio.sleep(self._min_request_interval - elapsed)
+            self._last_request_time = self._loop.time()
+
+    async def chat_completion(
+        self,
+        messages: list[dict[str, Any]],
+        response_model: type[T],
+    ) -> T:
+        """Send chat completion request with retry logic.
+
+        Args:
+            messages: Chat messages for the model
+            response_model: Pydantic type to validate response
+
+        Returns:
+            Validated response matching response_model
+
+        Raises:
+            LLMCallError: After 3 failed attempts
+        """
+        result = await self.chat_completion_result(messages, response_model)
+        return result.response
+
+    async def chat_completion_result(
+        self,
+        messages: list[dict[str, Any]],
+        response_model: type[T],
+        reserved: bool = False,
+    ) -> ChatCompletionResult[T]:
+        """Like chat_completion, but also report token usage, latency and retries.
+
+        Args:
+            messages: Chat messages for the model
+            response_model: Pydantic type to validate response
+            reserved: Use the reserved interactive slot instead of the shared
+                pool; skips request pacing
+
+        Returns:
+            ChatCompletionResult wrapping the validated response
+
+        Raises:
+            LLMCallError: After 3 failed attempts, with their counts in `result`
+        """
+        queued = time.perf_counter()
+        async with self._reserved_semaphore if reserved else self._semaphore:
+            if not reserved:
+                await self._rate_limit()
+            client = await self._get_client()
+            started = time.perf_counter()
+            parse_failures = 0
+            payload = {
+                "model": self.model,
+                "messages": messages,
+                "temperature": 0.1,
+            }
+            if self.profile.json_mode:
+                payload["response_format"] = {"type": "json_object"}
+            body = orjson.dumps(payload)
+
+            for attempt in range(3):
+                try:
+                    response = await client.post(
+                        "/chat/completions",
+                        content=body,
+                        headers={"Content-Type": "application/json"},
+                    )
+                    response.raise_for_status()
+                    content, usage = decode_envelope(response.content)
+
+                    try:
+                        validated = decode_content(content, response_model)
+                    except ValueError:
+                        # Invalid JSON and schema mismatches (pydantic ValidationError)
+                        parse_failures += 1
+                        raise
+
+                    prompt_tokens = usage.get("prompt_tokens", 0)
+                    completion_tokens = usage.get("completion_tokens", 0)
+                    return ChatCompletionResult(
+                        response=validated,
+                        prompt_tokens=prompt_tokens,
+                        completion_tokens=completion_tokens,
+                        latency=time.perf_counter() - started,
+                        queue_wait=started - queued,
+                        attempts=attempt + 1,
+                        parse_failures=parse_failures,
+                        model=self.model,
+                        backend=self.profile.name,
+                        cost_usd=self.profile.cost(prompt_tokens, completion_tokens),
+                    )
+                except Exception as e:
+                    if attempt == 2:
+                        raise LLMCallError(
+                            f"LLM call failed after 3 attempts: {e!r}",
+                            ChatCompletionResult(
+                                response=None,
+                                latency=time.perf_counter() - started,
+                                queue_wait=started - queued,
+                                attempts=attempt + 1,
+                                parse_failures=parse_failures,
+                                model=self.model,
+                                backend=self.profile.name,
+                            ),
+                        ) from e
+                    await asyncio.sleep(2 ** attempt)
+
+    async def close(self):
+        """Close HTTP client connection."""
+        if self._http_client:
+            await self._http_client.aclose()
+
+
+class ReservedSlotClient:
+    """View of an OpenAICompatibleClient whose requests always use its reserved slot.
+
+    Lets an unchanged JobEvaluator serve interactive requests without waiting
+    for batch evaluations sharing the same client.
+    """
+
+    def __init__(self, client: OpenAICompatibleClient):
+        self.client = client
+        self.model = client.model
+
+    async def chat_completion(
+        self,
+        messages: list[dict[str, Any]],
+        response_model: type[T],
+    ) -> T:
+        result = await self.chat_completion_result(messages, response_model)
+        return result.response
+
+    async def chat_completion_result(
+        self,
+        messages: list[dict[str, Any]],
+        response_model: type[T],
+    ) -> ChatCompletionResult[T]:
+        return await self.client.chat_completion_result(messages, response_model, reserved=True)
+
+    async def close(self):
+        """No-op: the wrapped client is shared and closed by its owner."""
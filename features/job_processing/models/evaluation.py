@@ -37,4 +37,7 @@ class JobEvaluation(Base):
     priority = Column(String, nullable=False)
     evaluated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
+    # Hash of system prompt + model + score weights that produced this row (NULL = legacy)
+    evaluation_version = Column(String(16), nullable=True, index=True)
+
     job = relationship("Job", back_populates="evaluation")
\ No newline at end of file
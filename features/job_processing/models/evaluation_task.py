@@ -0,0 +1,42 @@
+from datetime import datetime
+from sqlalchemy import Column, String, Integer, BigInteger, Text, DateTime, ForeignKey, Index
+
+from core.database import Base
+
+
+class EvaluationTask(Base):
+    """Queued evaluation of a single job.
+
+    Workers claim tasks with FOR UPDATE SKIP LOCKED and hold them under a lease;
+    a task whose lease expires (worker crashed or hung) becomes claimable again.
+    """
+    __tablename__ = "evaluation_tasks"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    job_id = Column(
+        String, ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False, unique=True
+    )
+
+    # Task state: pending, running, done, failed
+    state = Column(String(20), nullable=False, default="pending")
+    priority = Column(Integer, nullable=False, default=0)  # Higher is claimed first
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+
+    # Lease held by the worker currently evaluating the task
+    locked_by = Column(String(100), nullable=True)  # e.g., "host:pid"
+    lease_expires_at = Column(DateTime, nullable=True)
+
+    last_error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(
+        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    __table_args__ = (
+        Index("idx_evaluation_tasks_claim", "state", "priority", "id"),
+    )
+
+    def __repr__(self):
+        return f"<EvaluationTask(id={self.id}, job_id='{self.job_id}', state='{self.state}')>"
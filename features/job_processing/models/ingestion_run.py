@@ -0,0 +1,40 @@
+from datetime import datetime
+from sqlalchemy import Column, String, Integer, BigInteger, Text, DateTime, Index
+from sqlalchemy.dialects.postgresql import JSONB
+
+from core.database import Base
+
+
+class IngestionRun(Base):
+    """One ingestion of an export file, tracked so a crashed run can resume.
+
+    Runs are keyed by the SHA-256 of the file content. records_committed is
+    the number of leading records whose jobs are stored and routed; a rerun of
+    the same file continues from there, and a completed file is skipped unless
+    forced.
+    """
+    __tablename__ = "ingestion_runs"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    file_path = Column(Text, nullable=False)
+    file_sha256 = Column(String(64), nullable=False)
+
+    # Run status: running, completed, failed
+    status = Column(String(20), nullable=False, default="running")
+    records_committed = Column(Integer, nullable=False, default=0)
+    counters = Column(JSONB, nullable=False, default=dict)  # Ingestion results so far
+    resumes = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+
+    started_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(
+        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+    finished_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("idx_ingestion_runs_file_sha256", "file_sha256", "id"),
+    )
+
+    def __repr__(self):
+        return f"<IngestionRun(id={self.id}, status='{self.status}', records={self.records_committed})>"
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Numeric, Text, Integer, Boolean
+from sqlalchemy import Column, String, DateTime, Numeric, Text, Integer, Boolean, SmallInteger
 from sqlalchemy.dialects.postgresql import JSONB, ARRAY as PGArray
 from sqlalchemy.orm import relationship
 
@@ -52,6 +52,14 @@ class Job(Base):
     # URLs found in description
     description_urls = Column(JSONB, nullable=False, default=list)
 
+    # Technologies and expertise areas found by the local dictionary (utils/tech_extractor.py)
+    detected_tech = Column(JSONB, nullable=False, default=list)
+    detected_expertise_ids = Column(PGArray(SmallInteger), nullable=False, default=list)
+
+    # Hash of the metadata refreshed on re-ingestion (services/job_upsert.py);
+    # unchanged jobs are not rewritten
+    metadata_hash = Column(String(32), nullable=True)
+
     # Metadata
     source = Column(String, nullable=False, default="apify")
     scraped_at = Column(DateTime, nullable=True)
@@ -0,0 +1,53 @@
+from datetime import datetime
+from sqlalchemy import Column, String, Boolean, Text, DateTime, ForeignKey, SmallInteger, Index
+from sqlalchemy.dialects.postgresql import JSONB, ARRAY as PGArray
+
+from core.database import Base
+
+
+class FreelancerProfile(Base):
+    """A freelancer whose expertise jobs can be scored against."""
+    __tablename__ = "profiles"
+
+    id = Column(String(50), primary_key=True)
+    name = Column(String, nullable=False)
+    role = Column(String, nullable=False)
+
+    # [{"id": 1, "name": "RAG Systems", "level": "Advanced", "keywords": ["RAG", ...]}, ...]
+    expertise = Column(JSONB, nullable=False, default=list)
+
+    active = Column(Boolean, nullable=False, default=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(
+        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+
+class JobProfileEvaluation(Base):
+    """Profile-specific part of a fan-out evaluation.
+
+    Budget, client, clarity and timeline scores are shared and stay on
+    job_evaluations; only tech fit, and therefore total and priority, differ
+    per profile.
+    """
+    __tablename__ = "job_profile_evaluations"
+
+    job_id = Column(
+        String, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True
+    )
+    profile_id = Column(
+        String(50), ForeignKey("profiles.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    matched_expertise_ids = Column(PGArray(SmallInteger), nullable=False, default=list)
+    score_tech_fit = Column(SmallInteger, nullable=False)
+    reason_tech_fit = Column(Text, nullable=False)
+    score_total = Column(SmallInteger, nullable=False)
+    priority = Column(String, nullable=False)
+
+    evaluated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    evaluation_version = Column(String(16), nullable=True)
+
+    __table_args__ = (
+        Index("idx_job_profile_evaluations_ranking", "profile_id", "score_total"),
+    )
@@ -0,0 +1,43 @@
+from datetime import datetime
+from sqlalchemy import Column, String, Integer, BigInteger, SmallInteger, Float, Boolean, DateTime, Index
+
+from core.database import Base
+
+
+class EvaluationTelemetry(Base):
+    """Usage and timing of one LLM call made while evaluating a job.
+
+    Single-prompt evaluations produce one row per evaluation, decomposed ones
+    three. Calls that failed on every attempt are recorded too, with failed set
+    and no tokens. Rows are append-only and survive re-evaluation, so cost per job is
+    the sum over its rows. No foreign key: telemetry is written in bulk off the
+    hot path and must not fail on ordering with the job insert.
+    """
+    __tablename__ = "evaluation_telemetry"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    job_id = Column(String, nullable=False)
+
+    evaluation_version = Column(String(16), nullable=True)
+    prompt_variant = Column(String(30), nullable=False)
+    model = Column(String, nullable=False)
+    backend = Column(String(30), nullable=False)
+
+    prompt_tokens = Column(Integer, nullable=False, default=0)
+    completion_tokens = Column(Integer, nullable=False, default=0)
+    latency = Column(Float, nullable=False)  # Seconds, retries included
+    queue_wait = Column(Float, nullable=False, default=0.0)  # Seconds waiting for a client slot
+    attempts = Column(SmallInteger, nullable=False, default=1)
+    parse_failures = Column(SmallInteger, nullable=False, default=0)
+    cost_usd = Column(Float, nullable=False, default=0.0)
+    failed = Column(Boolean, nullable=False, default=False)  # No valid response after all attempts
+
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("idx_evaluation_telemetry_created_at", "created_at"),
+        Index("idx_evaluation_telemetry_job_id", "job_id"),
+    )
+
+    def __repr__(self):
+        return f"<EvaluationTelemetry(id={self.id}, job_id='{self.job_id}', latency={self.latency:.2f})>"
@@ -1,11 +1,35 @@
-from fastapi import APIRouter, Depends
+from datetime import datetime
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import aliased
 
 from core.database import get_db
 from features.job_processing.models.job import Job
 from features.job_processing.models.evaluation import JobEvaluation
+from features.job_processing.models.profile import FreelancerProfile, JobProfileEvaluation
+from features.job_processing.models.ingestion_run import IngestionRun
+from features.job_processing.services.ingestion import JobIngestionService
+from features.job_processing.services.ingestion_runs import list_runs, run_summary
+from features.job_processing.services.job_upsert import upsert_jobs
+from features.job_processing.services.on_demand import get_on_demand_evaluator
+from features.job_processing.services.score_cache import score_matrix_cache
+from features.job_processing.services.task_queue import EvaluationTaskQueue
+from features.job_processing.services.telemetry import (
+    TELEMETRY_GROUPS,
+    cost_summary,
+    latency_summary,
+    slowest_jobs,
+)
 from features.job_processing.schemas.evaluation import JobEvaluationListResponse
+from features.job_processing.schemas.profile import ProfileSchema
+from features.job_processing.utils.score_ranking import (
+    priorities,
+    resolve_weights,
+    top_k,
+    weighted_totals,
+)
 from features.job_processing.utils.url_parser import calculate_job_age
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
@@ -16,34 +40,109 @@ async def get_ranked_jobs(
     limit: int = 50,
     min_score: int = 50,
     priority: str | None = None,
+    w_budget: float | None = Query(None, ge=0),
+    w_client: float | None = Query(None, ge=0),
+    w_clarity: float | None = Query(None, ge=0),
+    w_tech_fit: float | None = Query(None, ge=0),
+    w_timeline: float | None = Query(None, ge=0),
+    profile_id: str | None = None,
     db: AsyncSession = Depends(get_db),
 ) -> list[JobEvaluationListResponse]:
+    overrides = {
+        "budget": w_budget,
+        "client": w_client,
+        "clarity": w_clarity,
+        "tech_fit": w_tech_fit,
+        "timeline": w_timeline,
+    }
+    if any(weight is not None for weight in overrides.values()):
+        return await _rank_with_weights(overrides, limit, min_score, priority, profile_id, db)
+
+    # Per-profile fan-out rows carry their own tech fit, total and priority
+    fit = aliased(JobProfileEvaluation) if profile_id else JobEvaluation
     query = (
-        select(Job, JobEvaluation)
+        select(Job, JobEvaluation, fit)
         .join(JobEvaluation, Job.id == JobEvaluation.job_id)
         .where(JobEvaluation.is_ai_related == 1)
-        .where(JobEvaluation.score_total >= min_score)
+        .where(fit.score_total >= min_score)
     )
+    if profile_id:
+        query = query.join(fit, fit.job_id == Job.id).where(fit.profile_id == profile_id)
 
     if priority:
-        query = query.where(JobEvaluation.priority == priority)
+        query = query.where(fit.priority == priority)
 
-    query = query.order_by(JobEvaluation.score_total.desc()).limit(limit)
+    query = query.order_by(fit.score_total.desc()).limit(limit)
 
     result = await db.execute(query)
-    jobs = result.all()
+    return _ranked_response(
+        (job, evaluation, fit_row, fit_row.score_total, fit_row.priority)
+        for job, evaluation, fit_row in result.all()
+    )
+
+
+async def _rank_with_weights(
+    overrides: dict[str, float | None],
+    limit: int,
+    min_score: int,
+    priority: str | None,
+    profile_id: str | None,
+    db: AsyncSession,
+) -> list[JobEvaluationListResponse]:
+    """Re-rank stored component scores with custom weights (no LLM calls)."""
+    try:
+        weights = resolve_weights(overrides)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    # Caches are kept per profile for the life of the process
+    if profile_id and await db.get(FreelancerProfile, profile_id) is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+    job_ids, scores = await score_matrix_cache(profile_id).get(db)
+    totals = weighted_totals(scores, weights)
+    labels = priorities(totals)
 
+    mask = totals >= min_score
+    if priority:
+        mask &= labels == priority
+    selected = top_k(totals, mask, limit)
+    if not len(selected):
+        return []
+
+    reranked = {
+        job_ids[i]: (int(totals[i]), labels[i]) for i in selected
+    }
+    fit = aliased(JobProfileEvaluation) if profile_id else JobEvaluation
+    query = (
+        select(Job, JobEvaluation, fit)
+        .join(JobEvaluation, Job.id == JobEvaluation.job_id)
+        .where(Job.id.in_(list(reranked)))
+    )
+    if profile_id:
+        query = query.join(fit, fit.job_id == Job.id).where(fit.profile_id == profile_id)
+
+    result = await db.execute(query)
+    return _ranked_response(
+        (job, evaluation, fit_row, *reranked[job.id])
+        for job, evaluation, fit_row in result.all()
+    )
+
+
+def _ranked_response(rows) -> list[JobEvaluationListResponse]:
     job_list = [
         {
             "job": job,
             "evaluation": evaluation,
+            "fit": fit,
+            "score_total": score_total,
+            "priority": priority,
             "age_hours": calculate_job_age(job.ts_publish)[0],
             "age_string": calculate_job_age(job.ts_publish)[1],
         }
-        for job, evaluation in jobs
+        for job, evaluation, fit, score_total, priority in rows
     ]
 
-    job_list.sort(key=lambda x: (x["age_hours"], -x["evaluation"].score_total))
+    job_list.sort(key=lambda x: (x["age_hours"], -x["score_total"]))
 
     return [
         JobEvaluationListResponse(
@@ -55,11 +154,11 @@ async def get_ranked_jobs(
             duration_weeks=float(item["job"].fixed_duration_weeks)
             if item["job"].fixed_duration_weeks
             else None,
-            score_total=item["evaluation"].score_total,
-            priority=item["evaluation"].priority,
+            score_total=item["score_total"],
+            priority=item["priority"],
             project_type=item["evaluation"].project_type,
             tech_stack=item["evaluation"].tech_stack,
-            matched_expertise_ids=item["evaluation"].matched_expertise_ids,
+            matched_expertise_ids=item["fit"].matched_expertise_ids,
             reasoning_summary=_summarize_reasoning(item["evaluation"]),
             applicant_count=item["job"].applicant_count,
             interviewing_count=item["job"].interviewing_count,
@@ -78,7 +177,7 @@ async def get_ranked_jobs(
             job_age_string=item["age_string"],
             description_urls=item["job"].description_urls or [],
             reason_budget=item["evaluation"].reason_budget,
-            reason_tech_fit=item["evaluation"].reason_tech_fit,
+            reason_tech_fit=item["fit"].reason_tech_fit,
             reason_clarity=item["evaluation"].reason_clarity,
             reason_client=item["evaluation"].reason_client,
             reason_timeline=item["evaluation"].reason_timeline,
@@ -87,6 +186,36 @@ async def get_ranked_jobs(
     ]
 
 
+@router.post("/evaluate")
+async def evaluate_job(
+    response: Response,
+    job_data: dict = Body(..., description="One job object from an Apify export"),
+    db: AsyncSession = Depends(get_db),
+) -> JobEvaluationListResponse:
+    """Store and evaluate a single job synchronously.
+
+    The X-Evaluation-Source header tells whether the evaluation was reused
+    ("existing"), shared with a concurrent request ("coalesced") or freshly
+    produced ("evaluated").
+    """
+    try:
+        job = JobIngestionService(None)._parse_job_data(job_data)
+    except (KeyError, TypeError, ValueError) as e:
+        raise HTTPException(status_code=422, detail=f"Invalid job object: {e!r}")
+
+    # Same metadata-only refresh as ingestion, so metadata_hash stays current
+    await upsert_jobs(db, [job])
+    await db.commit()
+    job = await db.get(Job, job.id)
+
+    evaluator = await get_on_demand_evaluator(db)
+    evaluation, source = await evaluator.evaluate(job, db)
+    response.headers["X-Evaluation-Source"] = source
+    return _ranked_response(
+        [(job, evaluation, evaluation, evaluation.score_total, evaluation.priority)]
+    )[0]
+
+
 @router.get("/stats")
 async def get_evaluation_stats(db: AsyncSession = Depends(get_db)) -> dict:
     total_jobs = await db.scalar(select(func.count(Job.id)))
@@ -103,6 +232,10 @@ async def get_evaluation_stats(db: AsyncSession = Depends(get_db)) -> dict:
     jobs_with_urls = await db.scalar(
         select(func.count(Job.id)).where(func.jsonb_array_length(Job.description_urls) > 0)
     )
+    version_counts = await db.execute(
+        select(JobEvaluation.evaluation_version, func.count(JobEvaluation.job_id))
+        .group_by(JobEvaluation.evaluation_version)
+    )
 
     return {
         "total_jobs": total_jobs or 0,
@@ -110,9 +243,92 @@ async def get_evaluation_stats(db: AsyncSession = Depends(get_db)) -> dict:
         "high_priority_jobs": high_priority or 0,
         "ai_related_percentage": (ai_related / total_jobs * 100) if total_jobs else 0,
         "jobs_with_urls": jobs_with_urls or 0,
+        "evaluation_versions": {
+            version or "unversioned": count for version, count in version_counts.all()
+        },
     }
 
 
+@router.get("/queue")
+async def get_queue_stats(db: AsyncSession = Depends(get_db)) -> dict:
+    counts = await EvaluationTaskQueue().counts(db)
+    return {state: counts.get(state, 0) for state in ("pending", "running", "done", "failed")}
+
+
+@router.get("/ingestion-runs")
+async def get_ingestion_runs(
+    limit: int = Query(50, ge=1, le=500),
+    db: AsyncSession = Depends(get_db),
+) -> list[dict]:
+    """Ingestion run history, most recent first."""
+    return await list_runs(db, limit)
+
+
+@router.get("/ingestion-runs/{run_id}")
+async def get_ingestion_run(run_id: int, db: AsyncSession = Depends(get_db)) -> dict:
+    run = await db.get(IngestionRun, run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Ingestion run not found")
+    return run_summary(run)
+
+
+@router.get("/telemetry/cost")
+async def get_telemetry_cost(
+    group_by: str = Query("day", pattern=f"^({'|'.join(TELEMETRY_GROUPS)})$"),
+    days: int = Query(30, ge=1),
+    db: AsyncSession = Depends(get_db),
+) -> list[dict]:
+    """Tokens and LLM cost per day, priority or project type."""
+    return await cost_summary(db, group_by, days)
+
+
+@router.get("/telemetry/latency")
+async def get_telemetry_latency(
+    group_by: str = Query("day", pattern=f"^({'|'.join(TELEMETRY_GROUPS)})$"),
+    days: int = Query(30, ge=1),
+    db: AsyncSession = Depends(get_db),
+) -> list[dict]:
+    """LLM call latency, queue wait percentiles and retry rate per group."""
+    return await latency_summary(db, group_by, days)
+
+
+@router.get("/telemetry/slowest")
+async def get_slowest_jobs(
+    days: int = Query(7, ge=1),
+    limit: int = Query(20, ge=1, le=500),
+    db: AsyncSession = Depends(get_db),
+) -> list[dict]:
+    """Jobs that spent the most time in LLM calls."""
+    return await slowest_jobs(db, days, limit)
+
+
+@router.get("/profiles")
+async def list_profiles(db: AsyncSession = Depends(get_db)) -> list[ProfileSchema]:
+    result = await db.execute(select(FreelancerProfile).order_by(FreelancerProfile.id))
+    return [ProfileSchema.model_validate(p, from_attributes=True) for p in result.scalars()]
+
+
+@router.put("/profiles/{profile_id}")
+async def upsert_profile(
+    profile_id: str,
+    profile: ProfileSchema,
+    db: AsyncSession = Depends(get_db),
+) -> ProfileSchema:
+    if profile.id != profile_id:
+        raise HTTPException(status_code=422, detail="Profile id does not match the URL")
+
+    values = profile.model_dump()
+    statement = insert(FreelancerProfile).values(**values)
+    await db.execute(
+        statement.on_conflict_do_update(
+            index_elements=[FreelancerProfile.id],
+            set_={**{k: statement.excluded[k] for k in values if k != "id"}, "updated_at": datetime.utcnow()},
+        )
+    )
+    await db.commit()
+    return profile
+
+
 def _summarize_reasoning(evaluation: JobEvaluation) -> str:
     return f"""Budget: {evaluation.reason_budget}
 Tech Fit: {evaluation.reason_tech_fit}
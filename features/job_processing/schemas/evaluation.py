@@ -3,8 +3,33 @@ from pydantic import BaseModel, Field, computed_field
 from typing import List, Optional, Dict, Any
 
 
+# Weights of the component scores in score_total (must match the system prompt)
+SCORE_WEIGHTS = {
+    "budget": 0.25,
+    "client": 0.15,
+    "clarity": 0.20,
+    "tech_fit": 0.30,
+    "timeline": 0.10,
+}
+
+# Minimum score_total per priority, highest first (must match the system prompt)
+PRIORITY_THRESHOLDS = (("High", 80), ("Medium", 50))
+
+
+def weighted_score_total(scores: Dict[str, float]) -> int:
+    """Weighted 0-100 total of 0-10 component scores."""
+    return round(sum(scores[c] * w for c, w in SCORE_WEIGHTS.items()) * 10)
+
+
+def priority_for_score(score_total: float) -> str:
+    for label, minimum in PRIORITY_THRESHOLDS:
+        if score_total >= minimum:
+            return label
+    return "Low"
+
+
 class ExpertiseMatch(BaseModel):
-    expertise_id: int = Field(..., ge=1, le=8)
+    expertise_id: int = Field(..., ge=1)
     match_reason: str = Field(...)
 
 
@@ -44,6 +69,10 @@ class JobEvaluationRequest(BaseModel):
     # URLs in description
     description_urls: List[str] = Field(default_factory=list)
 
+    # Local dictionary matches, for the model to confirm
+    detected_tech: List[str] = Field(default_factory=list)
+    detected_expertise_ids: List[int] = Field(default_factory=list)
+
 
 class JobEvaluationResponse(BaseModel):
     is_ai_related: bool = Field(...)
@@ -78,11 +107,74 @@ class JobEvaluationResponse(BaseModel):
         if self.score_total is not None:
             return self.score_total
         if all(x is not None for x in [self.score_budget, self.score_client, self.score_clarity, self.score_tech_fit, self.score_timeline]):
-            return (self.score_budget * 0.25 + self.score_client * 0.15 +
-                    self.score_clarity * 0.20 + self.score_tech_fit * 0.30 + self.score_timeline * 0.10) * 100 / 10
+            return (self.score_budget * SCORE_WEIGHTS["budget"] + self.score_client * SCORE_WEIGHTS["client"] +
+                    self.score_clarity * SCORE_WEIGHTS["clarity"] + self.score_tech_fit * SCORE_WEIGHTS["tech_fit"] +
+                    self.score_timeline * SCORE_WEIGHTS["timeline"]) * 100 / 10
         return 0.0
 
 
+class ProfileFit(BaseModel):
+    profile_id: str
+    matched_expertise_ids: List[int] = Field(default_factory=list)
+    score_tech_fit: int = 0
+    reason_tech_fit: str = ""
+
+
+class FanOutEvaluationResponse(BaseModel):
+    """One completion scoring a job for several profiles.
+
+    Profile-independent scores appear once; tech fit is given per profile.
+    """
+    is_ai_related: bool = Field(...)
+    filter_reason: Optional[str] = None
+
+    tech_stack: str | List[str] = ""
+    project_type: Optional[str] = None
+    complexity: Optional[str] = None
+
+    score_budget: Optional[int] = None
+    reason_budget: Optional[str] = None
+
+    score_client: Optional[int] = None
+    reason_client: Optional[str] = None
+
+    score_clarity: Optional[int] = None
+    reason_clarity: Optional[str] = None
+
+    score_timeline: Optional[int] = None
+    reason_timeline: Optional[str] = None
+
+    profile_fits: List[ProfileFit] = Field(default_factory=list)
+
+
+class RelevanceResponse(BaseModel):
+    """Decomposed mode: relevance and job classification."""
+    is_ai_related: bool = Field(...)
+    filter_reason: Optional[str] = None
+    tech_stack: str | List[str] = ""
+    project_type: Optional[str] = None
+    complexity: Optional[str] = None
+
+
+class TechFitResponse(BaseModel):
+    """Decomposed mode: expertise matches and tech fit."""
+    matched_expertise: List[ExpertiseMatch] = Field(default_factory=list)
+    score_tech_fit: int = 0
+    reason_tech_fit: str = ""
+
+
+class RubricResponse(BaseModel):
+    """Decomposed mode: clarity plus the budget, client and competition scores."""
+    score_clarity: int = 0
+    reason_clarity: str = ""
+    score_budget: int = 0
+    reason_budget: str = ""
+    score_client: int = 0
+    reason_client: str = ""
+    score_timeline: int = 0
+    reason_timeline: str = ""
+
+
 class JobEvaluationListResponse(BaseModel):
     job_id: str
     title: str
@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+from typing import List
+
+
+class ExpertiseAreaSchema(BaseModel):
+    id: int = Field(..., ge=1)
+    name: str
+    level: str
+    keywords: List[str] = Field(default_factory=list)
+
+
+class ProfileSchema(BaseModel):
+    id: str = Field(..., max_length=50, pattern=r"^[a-z0-9_-]+$")
+    name: str
+    role: str
+    expertise: List[ExpertiseAreaSchema] = Field(..., min_length=1)
+    active: bool = True
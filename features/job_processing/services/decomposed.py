@@ -0,0 +1,157 @@
+import asyncio
+from datetime import datetime
+from typing import Callable, Optional
+
+from core.llm import ChatCompletionResult, LLMBackend
+from ..models.job import Job
+from ..models.evaluation import JobEvaluation
+from ..schemas.evaluation import (
+    RelevanceResponse,
+    RubricResponse,
+    TechFitResponse,
+    priority_for_score,
+    weighted_score_total,
+)
+from .evaluator import JobEvaluator
+from .prompt_variants import ExpertiseAreas, format_expertise
+
+RELEVANCE_PROMPT = """Classify an Upwork job for an AI Systems Engineer. Reply with JSON only.
+
+is_ai_related: true if the work involves building or integrating AI/LLM/ML systems
+filter_reason: one sentence, only when is_ai_related=false
+tech_stack: technologies the job mentions
+project_type: short label, e.g. "RAG chatbot", "AI agent", "voice assistant"
+complexity: Low, Medium or High
+
+FIELDS: is_ai_related, filter_reason, tech_stack, project_type, complexity"""
+
+TECH_FIT_PROMPT = """Match an Upwork job to an AI Systems Engineer's expertise. Reply with JSON only.
+
+EXPERTISE (id: area [level]: keywords):
+{expertise}
+
+score_tech_fit (0-10): 10 if 3+ expertise matches, 7 if 2, 3 if 1, 0 if none
+Match expertise only on explicit mentions.
+
+FIELDS: matched_expertise [{{expertise_id, match_reason}}], score_tech_fit, reason_tech_fit"""
+
+RUBRIC_PROMPT = """Score an Upwork job on four criteria (0-10 each). Reply with JSON only.
+
+score_clarity: 10 specific/actionable, 7 clear but vague, 3 ambiguous, 0 nonsensical
+score_budget: 10 if >=$500 and fits scope, 0 if <$500 or wildly off
+score_client: payment verified, rating (4.5+ good, <4.0 bad), hire rate (>20% good, <10% bad), total paid (>1000 good, 0 bad)
+score_timeline: applicants (<5 good, >20 bad), age (<24h good, >1w bad)
+
+FIELDS: score_clarity, reason_clarity, score_budget, reason_budget, score_client, reason_client, score_timeline, reason_timeline
+Keep reasons to one sentence."""
+
+
+class DecomposedEvaluator(JobEvaluator):
+    """Evaluates a job with three small prompts run concurrently.
+
+    Relevance, tech fit and the remaining rubric are requested in parallel and
+    merged into one JobEvaluation; totals and priority are computed locally
+    with SCORE_WEIGHTS. Lower latency than one long completion at the cost of
+    sending the job description three times. If the job turns out not to be
+    AI-related, scoring calls that have not finished are cancelled.
+    """
+
+    kind = "dec"
+
+    def __init__(
+        self,
+        client: LLMBackend,
+        on_completion: Optional[Callable[[str, ChatCompletionResult], None]] = None,
+        expertise: Optional[ExpertiseAreas] = None,
+    ):
+        """Initialize decomposed evaluator.
+
+        Args:
+            client: LLM client
+            on_completion: Called with (job_id, result) after every LLM call
+            expertise: Expertise areas for the tech fit prompt; defaults to the seeded default profile
+        """
+        super().__init__(client, on_completion=on_completion, expertise=expertise)
+        self.prompt_variant = "decomposed"
+
+    def _build_system_prompt(self) -> str:
+        self.tech_fit_prompt = TECH_FIT_PROMPT.format(expertise=format_expertise(self.expertise))
+        # Only used for the evaluation version hash
+        return "\n\n".join((RELEVANCE_PROMPT, self.tech_fit_prompt, RUBRIC_PROMPT))
+
+    async def _complete(self, job_id: str, system_prompt: str, user_prompt: str, response_model):
+        result = await self._chat(
+            job_id,
+            [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            response_model,
+        )
+        return result.response
+
+    async def evaluate(self, job: Job) -> JobEvaluation:
+        """Evaluate a job using three concurrent completions without touching the database."""
+        user_prompt = self._build_user_prompt(self._build_request(job))
+        relevance_call = asyncio.create_task(
+            self._complete(job.id, RELEVANCE_PROMPT, user_prompt, RelevanceResponse)
+        )
+        tech_fit_call = asyncio.create_task(
+            self._complete(job.id, self.tech_fit_prompt, user_prompt, TechFitResponse)
+        )
+        rubric_call = asyncio.create_task(
+            self._complete(job.id, RUBRIC_PROMPT, user_prompt, RubricResponse)
+        )
+
+        try:
+            relevance = await relevance_call
+            if not relevance.is_ai_related:
+                tech_fit_call.cancel()
+                rubric_call.cancel()
+                await asyncio.gather(tech_fit_call, rubric_call, return_exceptions=True)
+                return self._not_ai_evaluation(job.id, relevance.filter_reason)
+
+            tech_fit, rubric = await asyncio.gather(tech_fit_call, rubric_call)
+        except BaseException:
+            for call in (relevance_call, tech_fit_call, rubric_call):
+                call.cancel()
+            raise
+
+        if isinstance(relevance.tech_stack, str):
+            tech_stack_list = [t.strip() for t in relevance.tech_stack.split(",") if t.strip()]
+        else:
+            tech_stack_list = relevance.tech_stack or []
+        tech_stack_list = tech_stack_list or list(job.detected_tech or [])
+
+        scores = {
+            "budget": rubric.score_budget,
+            "client": rubric.score_client,
+            "clarity": rubric.score_clarity,
+            "tech_fit": tech_fit.score_tech_fit,
+            "timeline": rubric.score_timeline,
+        }
+        score_total = weighted_score_total(scores)
+
+        return JobEvaluation(
+            job_id=job.id,
+            is_ai_related=1,
+            filter_reason=None,
+            tech_stack=tech_stack_list,
+            project_type=relevance.project_type or "",
+            complexity=relevance.complexity or "",
+            matched_expertise_ids=[m.expertise_id for m in tech_fit.matched_expertise],
+            score_budget=scores["budget"],
+            score_client=scores["client"],
+            score_clarity=scores["clarity"],
+            score_tech_fit=scores["tech_fit"],
+            score_timeline=scores["timeline"],
+            score_total=score_total,
+            reason_budget=rubric.reason_budget,
+            reason_client=rubric.reason_client,
+            reason_clarity=rubric.reason_clarity,
+            reason_tech_fit=tech_fit.reason_tech_fit,
+            reason_timeline=rubric.reason_timeline,
+            priority=priority_for_score(score_total),
+            evaluated_at=datetime.utcnow(),
+            evaluation_version=self.version,
+        )
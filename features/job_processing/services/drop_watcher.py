@@ -0,0 +1,121 @@
+import asyncio
+import shutil
+import traceback
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from core.config import settings
+from ..utils.json_stream import EXPORT_PATTERNS
+
+
+class DropWatcher:
+    """Polls a directory for new export files and ingests each one once it is complete.
+
+    A file counts as complete when its size and modification time are unchanged
+    between two polls, so files still being written by the scraper are left
+    alone. Ingested files are moved to archive_dir, files whose ingestion raised
+    to failed_dir; both default to subdirectories of the watched directory and
+    are not scanned. Restarting the watcher is safe: a file that was being
+    ingested is resumed by its ingestion run.
+
+    Usage:
+        watcher = DropWatcher(Path("drops"), ingest_file)
+        await watcher.run()
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        ingest: Callable[[Path], Awaitable[Dict[str, int]]],
+        archive_dir: Optional[Path] = None,
+        failed_dir: Optional[Path] = None,
+        poll_interval: float = settings.watch_poll_interval,
+        patterns: Tuple[str, ...] = EXPORT_PATTERNS,
+    ):
+        """Initialize watcher.
+
+        Args:
+            directory: Directory the scraper drops exports into
+            ingest: Coroutine function ingesting one file
+            archive_dir: Where ingested files go (default: directory/processed)
+            failed_dir: Where files whose ingestion failed go (default: directory/failed)
+            poll_interval: Seconds between directory scans
+            patterns: Glob patterns of files to ingest
+        """
+        self.directory = directory
+        self.ingest = ingest
+        self.archive_dir = archive_dir or directory / "processed"
+        self.failed_dir = failed_dir or directory / "failed"
+        self.poll_interval = poll_interval
+        self.patterns = patterns
+
+        self.results = {"files": 0, "failed": 0, "total_jobs": 0, "evaluated": 0, "errors": 0}
+        self._seen: Dict[Path, Tuple[int, int]] = {}
+
+    async def run(self, drain: bool = False) -> Dict[str, int]:
+        """Ingest files as they complete until cancelled, or until none are waiting if `drain`.
+
+        Returns:
+            Files ingested and failed, and job counters summed over files
+        """
+        while True:
+            ready, waiting = self.scan()
+            for path in ready:
+                await self._process(path)
+            if drain and not ready and not waiting:
+                return self.results
+            await asyncio.sleep(self.poll_interval)
+
+    def scan(self) -> Tuple[List[Path], int]:
+        """Files that are complete (unchanged since the last scan), oldest first.
+
+        Returns:
+            (complete files, number of files still changing)
+        """
+        current = {}
+        for pattern in self.patterns:
+            for path in self.directory.glob(pattern):
+                if path.is_file():
+                    stat = path.stat()
+                    current[path] = (stat.st_size, stat.st_mtime_ns)
+
+        ready = [
+            path for path, signature in current.items()
+            if signature[0] > 0 and self._seen.get(path) == signature
+        ]
+        self._seen = current
+        ready.sort(key=lambda path: current[path][1])
+        return ready, len(current) - len(ready)
+
+    async def _process(self, path: Path):
+        print(f"\n=== Ingesting {path.name} ===")
+        try:
+            results = await self.ingest(path)
+        except Exception:
+            traceback.print_exc()
+            self.results["failed"] += 1
+            self._move(path, self.failed_dir)
+            return
+
+        self.results["files"] += 1
+        if results.get("already_completed"):
+            print(f"{path.name}: already ingested by run {results.get('run_id')}")
+            self._move(path, self.archive_dir)
+            return
+        for key in ("total_jobs", "evaluated", "errors"):
+            self.results[key] += results.get(key, 0)
+        print(
+            f"{path.name}: {results.get('total_jobs', 0)} jobs, "
+            f"{results.get('evaluated', 0)} evaluated, {results.get('errors', 0)} errors"
+        )
+        self._move(path, self.archive_dir)
+
+    def _move(self, path: Path, target_dir: Path):
+        target_dir.mkdir(parents=True, exist_ok=True)
+        target = target_dir / path.name
+        if target.exists():
+            # Scrapers reuse names across days; keep both copies
+            target = target_dir / f"{path.stem}.{datetime.utcnow():%Y%m%dT%H%M%S}{path.suffix}"
+        shutil.move(str(path), str(target))
+        self._seen.pop(path, None)
@@ -0,0 +1,214 @@
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from core.config import settings
+from core.database import AsyncSessionLocal
+from ..models.evaluation import JobEvaluation
+from ..models.profile import JobProfileEvaluation
+from .relevance_filter import CLASSIFIER_VERSION_PREFIX
+from .task_queue import complete_tasks_statement
+
+
+def _evaluation_row(evaluation: JobEvaluation | JobProfileEvaluation) -> Dict[str, Any]:
+    """Convert an unsaved evaluation into a plain column dict for a bulk insert."""
+    row = {
+        column.name: getattr(evaluation, column.key)
+        for column in type(evaluation).__table__.columns
+    }
+    if row["evaluated_at"] is None:
+        row["evaluated_at"] = datetime.utcnow()
+    return row
+
+
+def uncount_failed_writes(
+    results: Dict[str, int], writer: "EvaluationWriter", job_ids: Optional[Set[str]] = None
+):
+    """Move evaluations whose buffered write failed from their outcome counters to errors.
+
+    Callers count an evaluation when they hand it to the writer; this undoes
+    evaluated, ai_related/not_ai_related and, for classifier rows, llm_skipped.
+    With job_ids, only the failed writes of those jobs are moved.
+    """
+    for job_id, row in writer.failed_rows.items():
+        if job_ids is not None and job_id not in job_ids:
+            continue
+        results["evaluated"] -= 1
+        results["ai_related" if row["is_ai_related"] else "not_ai_related"] -= 1
+        if "llm_skipped" in results and (row["evaluation_version"] or "").startswith(
+            CLASSIFIER_VERSION_PREFIX
+        ):
+            results["llm_skipped"] -= 1
+        results["errors"] += 1
+
+
+class EvaluationWriter:
+    """Async write buffer for job evaluations.
+
+    Evaluations are collected in memory and written to job_evaluations as one
+    multi-row INSERT ... ON CONFLICT (job_id) DO UPDATE per batch, when the buffer
+    reaches batch_size or every flush_interval seconds. If a batch fails, its rows
+    are retried one transaction each so a single bad row does not lose the others.
+    With complete_tasks=True the matching evaluation_tasks rows are marked done
+    in the same transaction. Per-profile rows of fan-out evaluations
+    (evaluation.profile_evaluations) are written with their evaluation.
+
+    Usage:
+        async with EvaluationWriter() as writer:
+            await writer.add(await evaluator.evaluate(job))
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker = AsyncSessionLocal,
+        batch_size: int = settings.evaluation_batch_size,
+        flush_interval: float = settings.evaluation_flush_interval,
+        complete_tasks: bool = False,
+    ):
+        """Initialize writer.
+
+        Args:
+            session_factory: Factory for the short-lived sessions used by flushes
+            batch_size: Buffered rows that trigger a flush
+            flush_interval: Seconds between background flushes
+            complete_tasks: Mark queued evaluation tasks done with their rows
+        """
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.complete_tasks = complete_tasks
+
+        self.written = 0
+        # Rows that could not be persisted, by job id
+        self.failed_rows: Dict[str, Dict[str, Any]] = {}
+
+        self._buffer: List[Dict[str, Any]] = []
+        self._profile_buffer: Dict[str, List[Dict[str, Any]]] = {}
+        self._lock = asyncio.Lock()
+        self._timer: asyncio.Task | None = None
+
+    async def __aenter__(self) -> "EvaluationWriter":
+        self._timer = asyncio.create_task(self._flush_periodically())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._timer:
+            self._timer.cancel()
+            try:
+                await self._timer
+            except asyncio.CancelledError:
+                pass
+            self._timer = None
+        await self.flush()
+
+    @property
+    def failed(self) -> int:
+        """Number of evaluations that could not be persisted."""
+        return len(self.failed_rows)
+
+    @property
+    def failed_ids(self) -> set[str]:
+        """Job IDs whose evaluations could not be persisted."""
+        return set(self.failed_rows)
+
+    async def _flush_periodically(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                # Shielded so cancelling the timer on exit never aborts a write in progress
+                await asyncio.shield(self.flush())
+            except Exception as e:
+                # Keep the timer alive; a dead timer would leave rows buffered until exit
+                print(f"  → Background flush failed: {e}")
+
+    async def add(self, evaluation: JobEvaluation):
+        """Buffer an evaluation, flushing if the batch is full."""
+        self._buffer.append(_evaluation_row(evaluation))
+        profile_evaluations = getattr(evaluation, "profile_evaluations", None)
+        if profile_evaluations:
+            self._profile_buffer[evaluation.job_id] = [
+                _evaluation_row(p) for p in profile_evaluations
+            ]
+        if len(self._buffer) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self) -> List[str]:
+        """Write all buffered evaluations.
+
+        Returns:
+            Job IDs whose evaluations were persisted
+        """
+        async with self._lock:
+            rows, self._buffer = self._buffer, []
+            profile_rows, self._profile_buffer = self._profile_buffer, {}
+            if not rows:
+                return []
+
+            # ON CONFLICT DO UPDATE cannot touch the same row twice in one statement
+            rows = list({row["job_id"]: row for row in rows}.values())
+
+            try:
+                async with self.session_factory() as db:
+                    await self._write(db, rows, profile_rows)
+                    await db.commit()
+                persisted = [row["job_id"] for row in rows]
+            except Exception as e:
+                print(f"  → Batch write of {len(rows)} evaluations failed ({e}), retrying per row")
+                persisted = await self._write_rows_individually(rows, profile_rows)
+
+            self.written += len(persisted)
+            persisted_ids = set(persisted)
+            self.failed_rows.update(
+                {row["job_id"]: row for row in rows if row["job_id"] not in persisted_ids}
+            )
+            return persisted
+
+    async def _write_rows_individually(
+        self,
+        rows: List[Dict[str, Any]],
+        profile_rows: Dict[str, List[Dict[str, Any]]],
+    ) -> List[str]:
+        persisted = []
+        try:
+            async with self.session_factory() as db:
+                for row in rows:
+                    try:
+                        await self._write(db, [row], profile_rows)
+                        await db.commit()
+                        persisted.append(row["job_id"])
+                    except Exception as e:
+                        await db.rollback()
+                        print(f"  → Failed to store evaluation for {row['job_id']}: {e}")
+        except Exception as e:
+            # No session (or a broken one): the rows not yet written are reported as failed
+            print(f"  → Per-row retry stopped after {len(persisted)} of {len(rows)} evaluations: {e}")
+        return persisted
+
+    async def _write(
+        self,
+        db,
+        rows: List[Dict[str, Any]],
+        profile_rows: Dict[str, List[Dict[str, Any]]],
+    ):
+        await db.execute(self._upsert_statement(JobEvaluation, rows, ["job_id"]))
+        fan_out_rows = [p for row in rows for p in profile_rows.get(row["job_id"], [])]
+        if fan_out_rows:
+            await db.execute(
+                self._upsert_statement(JobProfileEvaluation, fan_out_rows, ["job_id", "profile_id"])
+            )
+        if self.complete_tasks:
+            await db.execute(complete_tasks_statement([row["job_id"] for row in rows]))
+
+    def _upsert_statement(self, model, rows: List[Dict[str, Any]], key: List[str]):
+        statement = insert(model).values(rows)
+        return statement.on_conflict_do_update(
+            index_elements=key,
+            set_={
+                name: statement.excluded[name]
+                for name in rows[0]
+                if name not in key
+            },
+        )
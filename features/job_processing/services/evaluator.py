@@ -1,92 +1,265 @@
-from typing import Optional
+import hashlib
+import orjson
+from datetime import datetime
+from typing import Callable, Optional
 
 from ..models.job import Job
 from ..models.evaluation import JobEvaluation
 from ..schemas.evaluation import (
+    SCORE_WEIGHTS,
     JobEvaluationRequest,
     JobEvaluationResponse,
 )
-from core.cerebras import CerebrasClient
-from core.config import settings
+from ..models.profile import FreelancerProfile
+from .prompt_variants import DEFAULT_EXPERTISE, PROMPT_VARIANTS, ExpertiseAreas
+from ..utils.tech_extractor import DICTIONARY_VERSION
+from core.llm import ChatCompletionResult, LLMBackend, LLMCallError
+from sqlalchemy import and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
+USER_PROMPT_TEMPLATE = """Evaluate this Upwork job:
+
+Title: {title}
+Type: {type}
+{budget_info}
+
+{client_info}
+
+Competition:
+{competition_info}
+
+Description:
+{description}
+{urls_section}{detected_section}
+
+URL: {url}
+
+Provide a detailed evaluation as JSON."""
+
+DETECTED_TECH_LINE = "\nDetected technologies (confirm, drop false matches, add missing): {tech}"
+EXPERTISE_HINT_LINE = "\nLikely expertise ids: {ids}"
+
+
+def compute_evaluation_version(
+    kind: str, system_prompt: str, model: str, expertise_hints: bool = True
+) -> str:
+    """Hash everything that determines an evaluation's outcome.
+
+    Besides the system prompt and model, this covers the user prompt template
+    and the tech dictionary whose detections it carries.
+
+    Args:
+        kind: Evaluator kind, kept readable in front of the hash
+        system_prompt: System prompt sent with every evaluation
+        model: LLM model name
+        expertise_hints: Whether detected expertise ids are sent with the job
+
+    Returns:
+        "<kind>-<12 hex digits>", stored in job_evaluations.evaluation_version
+    """
+    user_prompt = USER_PROMPT_TEMPLATE + DETECTED_TECH_LINE
+    if expertise_hints:
+        user_prompt += EXPERTISE_HINT_LINE
+    payload = orjson.dumps(
+        {
+            "prompt": system_prompt,
+            "user_prompt": user_prompt,
+            "dictionary": DICTIONARY_VERSION,
+            "model": model,
+            "weights": SCORE_WEIGHTS,
+        },
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return f"{kind}-{hashlib.sha256(payload).hexdigest()[:12]}"
+
+
+def version_kind(version: str) -> str:
+    """Evaluator kind of an evaluation_version; "" for versions stamped before kinds were."""
+    return version.rpartition("-")[0]
+
+
+def is_stale(version: Optional[str], current: str) -> bool:
+    """Whether a stored evaluation should be redone by the evaluator whose version is `current`.
+
+    Only rows of the evaluator's own kind, and rows without a kind, can be
+    stale: single, decomposed and fan-out evaluations do not replace each
+    other, and classifier rows (clf-) are never stale.
+    """
+    if version is None:
+        return True
+    return version != current and version_kind(version) in ("", version_kind(current))
+
+
+def stale_clause(column, current: str):
+    """SQL form of is_stale() for an evaluation_version column."""
+    return or_(
+        column.is_(None),
+        and_(
+            column != current,
+            or_(column.like(f"{version_kind(current)}-%"), column.notlike("%-%")),
+        ),
+    )
+
+
+async def load_default_expertise(db: AsyncSession) -> ExpertiseAreas:
+    """Expertise areas of the stored "default" profile, or the seeded ones if it is missing or empty."""
+    profile = await db.get(FreelancerProfile, "default")
+    if profile is None or not profile.expertise:
+        return DEFAULT_EXPERTISE
+    return profile.expertise
+
+
 class JobEvaluator:
-    """Evaluates Upwork jobs against AI Systems Engineer criteria using Cerebras GLM 4.7."""
+    """Evaluates Upwork jobs against AI Systems Engineer criteria using an LLM backend."""
+
+    # Prefix of this evaluator's evaluation versions; staleness is judged per kind
+    kind = "sgl"
+    # Detected expertise ids use the default profile's numbering
+    expertise_hints = True
 
-    def __init__(self, cerebras_client: CerebrasClient):
-        """Initialize evaluator with Cerebras client."""
-        self.client = cerebras_client
+    def __init__(
+        self,
+        client: LLMBackend,
+        prompt_variant: str = "baseline",
+        on_completion: Optional[Callable[[str, ChatCompletionResult], None]] = None,
+        expertise: Optional[ExpertiseAreas] = None,
+    ):
+        """Initialize evaluator with an LLM client.
+
+        Args:
+            client: LLM client (Cerebras, local OpenAI-compatible server, replay, ...)
+            prompt_variant: Name of a registered system prompt builder
+            on_completion: Called with (job_id, result) after every LLM call; a call
+                that failed on every attempt is reported with result.response None
+            expertise: Expertise areas to score against (see load_default_expertise);
+                defaults to the seeded default profile
+        """
+        if prompt_variant not in PROMPT_VARIANTS:
+            raise ValueError(
+                f"Unknown prompt variant {prompt_variant!r}; "
+                f"registered: {', '.join(PROMPT_VARIANTS)}"
+            )
+        self.client = client
+        self.prompt_variant = prompt_variant
+        self.on_completion = on_completion
+        self.expertise = list(expertise) if expertise else DEFAULT_EXPERTISE
         self.system_prompt = self._build_system_prompt()
+        self.version = compute_evaluation_version(
+            self.kind, self.system_prompt, self.client.model, self.expertise_hints
+        )
 
     def _build_system_prompt(self) -> str:
-        return """You are an expert job evaluator for an AI Systems Engineer.
-You evaluate Upwork jobs against the following profile:
-
-EXPERTISE AREAS:
-1. AI Agent Architecture & Design (Expert): agent, autonomous, multi-agent, LangChain, crewAI
-2. RAG Systems (Advanced): RAG, retrieval, vector database, embeddings, semantic search
-3. Local AI Infrastructure (Expert): local LLM, ollama, LM Studio, self-hosted, on-premises, privacy
-4. Backend Systems (Expert): FastAPI, Python, PostgreSQL, pgvector, REST API, async
-5. Frontend Development (Advanced): React, TypeScript, Next.js, UI, web app
-6. DevOps & Infrastructure (Expert): Docker, deployment, CI/CD
-7. Voice & Real-Time AI (Advanced): voice, audio, Speech-to-Text, text-to-speech, WebRTC, Deepgram
-8. Testing & Code Quality (Intermediate-Advanced): testing, pytest, TDD, code quality, CI
-
-EVALUATION CRITERIA (score 0-10 for each):
-1. Budget Adequacy (25%): 10 if ≥$500 and matches scope, 0 if <$500 or mismatches wildly
-2. Client Reliability (15%): Evaluate using:
-   - Payment verification (verified=bonus)
-   - Client rating (4.5+=bonus, 4.0-4.5=ok, <4.0=penalty)
-   - Hire rate (>20%=bonus, 10-20%=ok, <10%=penalty)
-   - Total paid amount (>1000=bonus, 0=penalty)
-3. Requirements Clarity (20%): 10 if specific/actionable, 7 if clear but vague, 3 if ambiguous, 0 if nonsensical
-4. AI Technical Fit (30%): 10 if matches 3+ expertise areas, 7 if matches 2, 3 if matches 1, 0 if no match
-5. Competition & Freshness (10%): Evaluate using:
-   - Applicant count (<5=bonus, 5-15=neutral, >20=penalty)
-   - Job age (<24h=bonus, <72h=neutral, >1w=penalty)
-
-SCORE TO JSON FIELD MAPPING:
-- score_budget maps to "score_budget"
-- score_client maps to "score_client"
-- score_clarity maps to "score_clarity"
-- score_tech_fit maps to "score_tech_fit"
-- Competition score maps to "score_timeline" (JSON output field name)
-
-TOTAL SCORE = weighted sum (budget*2.5 + client*1.5 + clarity*2.0 + tech_fit*3.0 + competition*1.0)
-
-PRIORITY CLASSIFICATION:
-- High: score_total ≥ 80
-- Medium: 50 ≤ score_total < 80
-- Low: score_total < 50
-
-EXPERTISE MATCH FORMAT:
-Match expertise only when job description explicitly mentions related keywords or concepts.
-
-OUTPUT RULES:
-- Return valid JSON matching the exact field names: is_ai_related, tech_stack, project_type, complexity, matched_expertise (array with expertise_id and match_reason), score_budget, reason_budget, score_client, reason_client, score_clarity, reason_clarity, score_tech_fit, reason_tech_fit, score_timeline, reason_timeline, score_total, priority
-- is_ai_related=false → set filter_reason, other fields can be omitted
-- is_ai_related=true → fill all fields
-- complexity must be: Low, Medium, or High
-- priority must be: High, Medium, or High
-- expertise_id must be 1-8 corresponding to expertise area
-- Provide clear, concise reasoning for each score"""
+        return PROMPT_VARIANTS[self.prompt_variant](self.expertise)
 
     async def evaluate_job(
         self,
         job: Job,
         db: AsyncSession,
-    ) -> Optional[JobEvaluation]:
+    ) -> JobEvaluation:
         """Evaluate a job using AI and store results in database.
 
+        Commits immediately; bulk callers should pair evaluate() with an
+        EvaluationWriter instead.
+
         Args:
             job: Job to evaluate
             db: Database session
 
         Returns:
-            JobEvaluation if stored, None if job already evaluated
+            The stored JobEvaluation; an existing evaluation for the job is replaced
         """
-        request = JobEvaluationRequest(
+        evaluation = await self.evaluate(job)
+
+        try:
+            # merge() so re-evaluating a stale row replaces it instead of colliding on job_id
+            evaluation = await db.merge(evaluation)
+            await db.commit()
+
+            return evaluation
+
+        except Exception:
+            await db.rollback()
+            raise
+
+    async def evaluate(self, job: Job) -> JobEvaluation:
+        """Evaluate a job using AI without touching the database.
+
+        Args:
+            job: Job to evaluate
+
+        Returns:
+            Unsaved JobEvaluation for the job
+        """
+        result = await self._chat(job.id, self._build_messages(job), JobEvaluationResponse)
+        response = result.response
+
+        if not response.is_ai_related:
+            evaluation = self._not_ai_evaluation(job.id, response.filter_reason)
+        else:
+            tech_stack_list = []
+            if isinstance(response.tech_stack, str):
+                tech_stack_list = [t.strip() for t in response.tech_stack.split(",") if t.strip()]
+            else:
+                tech_stack_list = response.tech_stack or []
+            # The model may leave confirmed detections out
+            tech_stack_list = tech_stack_list or list(job.detected_tech or [])
+
+            score_total = int(response.computed_score_total) if response.computed_score_total else 0
+
+            evaluation = JobEvaluation(
+                job_id=job.id,
+                is_ai_related=1,
+                filter_reason=None,
+                tech_stack=tech_stack_list,
+                project_type=response.project_type or "",
+                complexity=response.complexity or "",
+                matched_expertise_ids=[
+                    m.expertise_id for m in (response.matched_expertise or [])
+                ],
+                score_budget=response.score_budget or 0,
+                score_client=response.score_client or 0,
+                score_clarity=response.score_clarity or 0,
+                score_tech_fit=response.score_tech_fit or 0,
+                score_timeline=response.score_timeline or 0,
+                score_total=score_total,
+                reason_budget=response.reason_budget or "",
+                reason_client=response.reason_client or "",
+                reason_clarity=response.reason_clarity or "",
+                reason_tech_fit=response.reason_tech_fit or "",
+                reason_timeline=response.reason_timeline or "",
+                priority=response.priority or "Medium",
+                evaluated_at=datetime.utcnow(),
+                evaluation_version=self.version,
+            )
+
+        return evaluation
+
+    async def _chat(
+        self, job_id: str, messages: list[dict[str, str]], response_model
+    ) -> ChatCompletionResult:
+        """Make one LLM call, reporting it to on_completion whether or not it succeeds."""
+        try:
+            result = await self.client.chat_completion_result(
+                messages=messages,
+                response_model=response_model,
+            )
+        except LLMCallError as e:
+            if self.on_completion:
+                self.on_completion(job_id, e.result)
+            raise
+        if self.on_completion:
+            self.on_completion(job_id, result)
+        return result
+
+    def _build_messages(self, job: Job) -> list[dict[str, str]]:
+        return [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": self._build_user_prompt(self._build_request(job))},
+        ]
+
+    def _build_request(self, job: Job) -> JobEvaluationRequest:
+        return JobEvaluationRequest(
             job_id=job.id,
             title=job.title,
             description=job.description,
@@ -120,82 +293,35 @@ OUTPUT RULES:
             job_age_string=job.job_age_string or "",
             # URLs
             description_urls=job.description_urls or [],
+            # Local tech dictionary
+            detected_tech=job.detected_tech or [],
+            detected_expertise_ids=job.detected_expertise_ids or [],
         )
 
-        messages = [
-            {"role": "system", "content": self.system_prompt},
-            {"role": "user", "content": self._build_user_prompt(request)},
-        ]
-
-        try:
-            response = await self.client.chat_completion(
-                messages=messages,
-                response_model=JobEvaluationResponse,
-            )
-
-            if not response.is_ai_related:
-                evaluation = JobEvaluation(
-                    job_id=job.id,
-                    is_ai_related=0,
-                    filter_reason=response.filter_reason or "Not AI-related",
-                    tech_stack=[],
-                    project_type="",
-                    complexity="",
-                    matched_expertise_ids=[],
-                    score_budget=0,
-                    score_client=0,
-                    score_clarity=0,
-                    score_tech_fit=0,
-                    score_timeline=0,
-                    score_total=0,
-                    reason_budget="",
-                    reason_client="",
-                    reason_clarity="",
-                    reason_tech_fit="",
-                    reason_timeline="",
-                    priority="Low",
-                )
-            else:
-                tech_stack_list = []
-                if isinstance(response.tech_stack, str):
-                    tech_stack_list = [t.strip() for t in response.tech_stack.split(",")]
-                else:
-                    tech_stack_list = response.tech_stack or []
-
-                score_total = int(response.computed_score_total) if response.computed_score_total else 0
-
-                evaluation = JobEvaluation(
-                    job_id=job.id,
-                    is_ai_related=1,
-                    filter_reason=None,
-                    tech_stack=tech_stack_list,
-                    project_type=response.project_type or "",
-                    complexity=response.complexity or "",
-                    matched_expertise_ids=[
-                        m.expertise_id for m in (response.matched_expertise or [])
-                    ],
-                    score_budget=response.score_budget or 0,
-                    score_client=response.score_client or 0,
-                    score_clarity=response.score_clarity or 0,
-                    score_tech_fit=response.score_tech_fit or 0,
-                    score_timeline=response.score_timeline or 0,
-                    score_total=score_total,
-                    reason_budget=response.reason_budget or "",
-                    reason_client=response.reason_client or "",
-                    reason_clarity=response.reason_clarity or "",
-                    reason_tech_fit=response.reason_tech_fit or "",
-                    reason_timeline=response.reason_timeline or "",
-                    priority=response.priority or "Medium",
-                )
-
-            db.add(evaluation)
-            await db.commit()
-
-            return evaluation
-
-        except Exception as e:
-            await db.rollback()
-            raise
+    def _not_ai_evaluation(self, job_id: str, filter_reason: Optional[str]) -> JobEvaluation:
+        return JobEvaluation(
+            job_id=job_id,
+            is_ai_related=0,
+            filter_reason=filter_reason or "Not AI-related",
+            tech_stack=[],
+            project_type="",
+            complexity="",
+            matched_expertise_ids=[],
+            score_budget=0,
+            score_client=0,
+            score_clarity=0,
+            score_tech_fit=0,
+            score_timeline=0,
+            score_total=0,
+            reason_budget="",
+            reason_client="",
+            reason_clarity="",
+            reason_tech_fit="",
+            reason_timeline="",
+            priority="Low",
+            evaluated_at=datetime.utcnow(),
+            evaluation_version=self.version,
+        )
 
     def _build_user_prompt(self, request: JobEvaluationRequest) -> str:
         budget_info = ""
@@ -235,21 +361,22 @@ OUTPUT RULES:
             if len(request.description_urls) > 5:
                 urls_section += f"\n  ... and {len(request.description_urls) - 5} more"
 
-        return f"""Evaluate this Upwork job:
-
-Title: {request.title}
-Type: {request.type}
-{budget_info}
-
-{', '.join(client_info) if client_info else 'Client Info: Not available'}
-
-Competition:
-{', '.join(competition_info)}
-
-Description:
-{request.description}
-{urls_section}
-
-URL: {request.url}
+        detected_section = ""
+        if request.detected_tech:
+            detected_section = DETECTED_TECH_LINE.format(tech=", ".join(request.detected_tech))
+            if self.expertise_hints and request.detected_expertise_ids:
+                detected_section += EXPERTISE_HINT_LINE.format(
+                    ids=", ".join(map(str, request.detected_expertise_ids))
+                )
 
-Provide a detailed evaluation as JSON."""
\ No newline at end of file
+        return USER_PROMPT_TEMPLATE.format(
+            title=request.title,
+            type=request.type,
+            budget_info=budget_info,
+            client_info=", ".join(client_info) if client_info else "Client Info: Not available",
+            competition_info=", ".join(competition_info),
+            description=request.description,
+            urls_section=urls_section,
+            detected_section=detected_section,
+            url=request.url,
+        )
@@ -0,0 +1,183 @@
+from datetime import datetime
+from typing import Callable, List, Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.llm import ChatCompletionResult, LLMBackend
+from ..models.job import Job
+from ..models.evaluation import JobEvaluation
+from ..models.profile import FreelancerProfile, JobProfileEvaluation
+from ..schemas.evaluation import (
+    FanOutEvaluationResponse,
+    ProfileFit,
+    priority_for_score,
+    weighted_score_total,
+)
+from .evaluator import JobEvaluator
+from .prompt_variants import format_expertise
+
+
+async def load_active_profiles(db: AsyncSession) -> List[FreelancerProfile]:
+    """Active profiles, with the "default" profile first."""
+    result = await db.execute(
+        select(FreelancerProfile)
+        .where(FreelancerProfile.active.is_(True))
+        .order_by((FreelancerProfile.id != "default"), FreelancerProfile.id)
+    )
+    return list(result.scalars().all())
+
+
+def build_fan_out_prompt(profiles: Sequence[FreelancerProfile]) -> str:
+    """System prompt scoring shared criteria once and tech fit once per profile."""
+    profile_sections = []
+    for profile in profiles:
+        areas = format_expertise(profile.expertise, indent="  ")
+        profile_sections.append(f'PROFILE "{profile.id}" ({profile.role}):\n{areas}')
+
+    return f"""You evaluate Upwork jobs for a team of freelancers. Reply with JSON only.
+
+{chr(10).join(profile_sections)}
+
+SHARED SCORES (0-10, same for every profile):
+score_budget: 10 if >=$500 and fits scope, 0 if <$500 or wildly off
+score_client: payment verified, rating (4.5+ good, <4.0 bad), hire rate (>20% good, <10% bad), total paid (>1000 good, 0 bad)
+score_clarity: 10 specific, 7 clear but vague, 3 ambiguous, 0 nonsensical
+score_timeline: applicants (<5 good, >20 bad), age (<24h good, >1w bad)
+
+PER-PROFILE SCORE (0-10), one profile_fits entry for EVERY profile above:
+score_tech_fit: 10 if 3+ of the profile's expertise areas match, 7 if 2, 3 if 1, 0 if none
+
+FIELDS: is_ai_related, filter_reason, tech_stack, project_type, complexity (Low|Medium|High), score_budget, reason_budget, score_client, reason_client, score_clarity, reason_clarity, score_timeline, reason_timeline, profile_fits [{{profile_id, matched_expertise_ids, score_tech_fit, reason_tech_fit}}]
+If is_ai_related=false, give only filter_reason. Match expertise only on explicit mentions, using the ids of that profile. Keep reasons to one sentence."""
+
+
+class FanOutEvaluator(JobEvaluator):
+    """Evaluates a job against several freelancer profiles in a single completion.
+
+    Shared scores are stored on job_evaluations together with the first
+    profile's tech fit, so single-profile consumers keep working. Every profile
+    additionally gets a JobProfileEvaluation with its own tech fit, total and
+    priority, attached to the returned evaluation as `profile_evaluations`.
+    """
+
+    kind = "fan"
+    # Profiles number their own expertise areas
+    expertise_hints = False
+
+    def __init__(
+        self,
+        client: LLMBackend,
+        profiles: Sequence[FreelancerProfile],
+        on_completion: Optional[Callable[[str, ChatCompletionResult], None]] = None,
+    ):
+        """Initialize fan-out evaluator.
+
+        Args:
+            client: LLM client
+            profiles: Profiles to score against; the first is the primary profile
+            on_completion: Called with (job_id, result) after every LLM call
+        """
+        if not profiles:
+            raise ValueError("Fan-out evaluation needs at least one profile")
+        self.profiles = list(profiles)
+        super().__init__(client, on_completion=on_completion)
+        self.prompt_variant = "fan-out"
+
+    def _build_system_prompt(self) -> str:
+        return build_fan_out_prompt(self.profiles)
+
+    async def evaluate_job(self, job: Job, db: AsyncSession) -> Optional[JobEvaluation]:
+        evaluation = await self.evaluate(job)
+
+        try:
+            for profile_evaluation in evaluation.profile_evaluations:
+                await db.merge(profile_evaluation)
+            profile_evaluations = evaluation.profile_evaluations
+            evaluation = await db.merge(evaluation)
+            await db.commit()
+
+            evaluation.profile_evaluations = profile_evaluations
+            return evaluation
+
+        except Exception:
+            await db.rollback()
+            raise
+
+    async def evaluate(self, job: Job) -> JobEvaluation:
+        """Evaluate a job for every profile without touching the database.
+
+        Returns:
+            Unsaved JobEvaluation with a `profile_evaluations` list
+            (empty if the job is not AI-related)
+        """
+        result = await self._chat(job.id, self._build_messages(job), FanOutEvaluationResponse)
+        response = result.response
+
+        if not response.is_ai_related:
+            evaluation = self._not_ai_evaluation(job.id, response.filter_reason)
+            evaluation.profile_evaluations = []
+            return evaluation
+
+        evaluated_at = datetime.utcnow()
+        shared_scores = {
+            "budget": response.score_budget or 0,
+            "client": response.score_client or 0,
+            "clarity": response.score_clarity or 0,
+            "timeline": response.score_timeline or 0,
+        }
+        fits = {fit.profile_id: fit for fit in response.profile_fits}
+
+        profile_evaluations = []
+        for profile in self.profiles:
+            fit = fits.get(profile.id) or ProfileFit(
+                profile_id=profile.id, reason_tech_fit="Not scored by the model"
+            )
+            score_tech_fit = max(0, min(10, fit.score_tech_fit))
+            valid_ids = {area["id"] for area in profile.expertise}
+            score_total = weighted_score_total({**shared_scores, "tech_fit": score_tech_fit})
+
+            profile_evaluations.append(JobProfileEvaluation(
+                job_id=job.id,
+                profile_id=profile.id,
+                matched_expertise_ids=[i for i in fit.matched_expertise_ids if i in valid_ids],
+                score_tech_fit=score_tech_fit,
+                reason_tech_fit=fit.reason_tech_fit,
+                score_total=score_total,
+                priority=priority_for_score(score_total),
+                evaluated_at=evaluated_at,
+                evaluation_version=self.version,
+            ))
+
+        if isinstance(response.tech_stack, str):
+            tech_stack_list = [t.strip() for t in response.tech_stack.split(",") if t.strip()]
+        else:
+            tech_stack_list = response.tech_stack or []
+        tech_stack_list = tech_stack_list or list(job.detected_tech or [])
+
+        primary = profile_evaluations[0]
+        evaluation = JobEvaluation(
+            job_id=job.id,
+            is_ai_related=1,
+            filter_reason=None,
+            tech_stack=tech_stack_list,
+            project_type=response.project_type or "",
+            complexity=response.complexity or "",
+            matched_expertise_ids=primary.matched_expertise_ids,
+            score_budget=shared_scores["budget"],
+            score_client=shared_scores["client"],
+            score_clarity=shared_scores["clarity"],
+            score_tech_fit=primary.score_tech_fit,
+            score_timeline=shared_scores["timeline"],
+            score_total=primary.score_total,
+            reason_budget=response.reason_budget or "",
+            reason_client=response.reason_client or "",
+            reason_clarity=response.reason_clarity or "",
+            reason_tech_fit=primary.reason_tech_fit,
+            reason_timeline=response.reason_timeline or "",
+            priority=primary.priority,
+            evaluated_at=evaluated_at,
+            evaluation_version=self.version,
+        )
+        evaluation.profile_evaluations = profile_evaluations
+        return evaluation
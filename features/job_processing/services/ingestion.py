@@ -1,192 +1,564 @@
-import orjson
+import asyncio
+import collections
+import itertools
+import math
+import multiprocessing
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Set, Tuple
 
+from core.config import settings
+from core.database import AsyncSessionLocal
+from core.llm import LLMCallError
+from ..models.evaluation import JobEvaluation
+from ..models.ingestion_run import IngestionRun
 from ..models.job import Job
-from ..utils.url_parser import extract_urls, calculate_job_age
+from ..utils.job_value import expected_value
+from ..utils.job_normalizer import normalize_job, normalize_records
+from ..utils.json_stream import open_export
 from .evaluator import JobEvaluator
-from sqlalchemy.ext.asyncio import AsyncSession
+from .evaluation_writer import EvaluationWriter, uncount_failed_writes
+from .ingestion_runs import finish_run, open_run, record_progress
+from .job_upsert import copy_merge_jobs, upsert_jobs
+from .task_queue import EvaluationTaskQueue
+from .relevance_filter import RelevanceFilter
+from sqlalchemy import String, any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+# Sorts after every job in the evaluation queue
+_END_OF_INPUT = (math.inf, math.inf, 0.0, None, None)
+
+# Counters of the pass over jobs of records before the resume offset
+_RESUME_COUNTERS = ("evaluated", "ai_related", "not_ai_related", "enqueued", "llm_skipped", "errors")
+
+
+@dataclass
+class _ParsedChunk:
+    """One chunk of records handed from the parse stage to the store stage."""
+    end_offset: int  # Records up to here are covered once this chunk is stored
+    jobs: List[Tuple[int, Job]]  # (file index, job) of newly parsed records
+    resumed: List[Tuple[int, str]]  # (file index, job id) of records before the resume offset
+    records: int  # Newly parsed records, failed ones included
+    errors: int  # Records that failed to parse
 
 
 class JobIngestionService:
-    def __init__(self, evaluator: JobEvaluator):
+    def __init__(
+        self,
+        evaluator: Optional[JobEvaluator],
+        queue: Optional[EvaluationTaskQueue] = None,
+        relevance_filter: Optional[RelevanceFilter] = None,
+        reference_time: Optional[datetime] = None,
+        order: str = settings.evaluation_order,
+        concurrency: int = 1,
+        session_factory: async_sessionmaker = AsyncSessionLocal,
+        batch_size: int = settings.ingest_batch_size,
+        queue_size: int = settings.ingest_queue_size,
+        parse_workers: int = settings.ingest_parse_workers,
+    ):
+        """Initialize ingestion.
+
+        Args:
+            evaluator: Evaluator for inline evaluation (may be None when only enqueueing)
+            queue: Evaluation queue; when set, new jobs are enqueued for workers
+                instead of being evaluated inline
+            relevance_filter: Local classifier; jobs it is confident are not
+                AI-related are stored as such without an LLM call
+            reference_time: Fixed "now" for job ages (keeps prompts reproducible
+                for recorded/replayed runs); defaults to the current time
+            order: "value" to evaluate (or queue) jobs with the highest expected
+                value first, "file" to keep file order
+            concurrency: Inline evaluations in flight at once (the LLM backend's
+                concurrency; jobs still start in evaluation order)
+            session_factory: Factory for the sessions that reload jobs to evaluate
+            batch_size: Parsed jobs written per bulk upsert and commit
+            queue_size: Stored jobs waiting for an evaluation slot; order="value"
+                picks the most valuable job within this window
+            parse_workers: Processes normalizing records (0 = one thread); worth
+                it on large exports, where parsing would otherwise compete with
+                LLM calls for this process's CPU
+        """
+        if order not in ("value", "file"):
+            raise ValueError(f"order must be 'value' or 'file', got {order!r}")
         self.evaluator = evaluator
+        self.queue = queue
+        self.relevance_filter = relevance_filter
+        self.reference_time = reference_time
+        self.order = order
+        self.concurrency = max(1, concurrency)
+        self.session_factory = session_factory
+        self.batch_size = max(1, batch_size)
+        self.queue_size = max(1, queue_size)
+        self.parse_workers = max(0, parse_workers)
 
     async def ingest_apify_json(
         self,
         file_path: Path,
         db: AsyncSession,
         checkpoint_interval: int = 10,
+        force: bool = False,
     ) -> Dict[str, int]:
-        with open(file_path, "rb") as f:
-            content = f.read()
-            data = orjson.loads(content)
+        """Ingest an Apify export and evaluate (or enqueue) new jobs.
 
+        Runs as three concurrent stages: records are parsed in batches off the
+        event loop, each batch is upserted and routed, and `concurrency`
+        evaluation slots take stored jobs from a bounded priority queue, each
+        reloading its job in a short-lived session. LLM calls overlap with
+        parsing and storing, and memory stays bounded by the queue sizes.
+
+        The run is recorded in ingestion_runs by file content hash, with the
+        resume offset committed after every stored batch. Rerunning a file whose
+        run stopped halfway continues after that offset; rerunning a completed
+        file does nothing unless forced. Jobs of earlier records that still lack
+        an evaluation are routed again and counted under "resumed" only: the
+        attempt that stopped may already have counted them.
+
+        Args:
+            file_path: Apify export: JSON array or NDJSON, optionally gzip/zstd compressed
+            db: Session for the store stage
+            checkpoint_interval: Jobs between progress lines and queue flushes
+            force: Ingest from the first record even if the file was ingested before
+
+        Returns:
+            Counters for the run (cumulative over resumed attempts), resumed
+            (counters of this attempt's pass over earlier records), plus run_id,
+            resumed_from (records skipped) and already_completed (1 for a no-op)
+        """
         results = {
             "total_jobs": 0,
             "ingested": 0,
+            "inserted": 0,
+            "updated": 0,
+            "unchanged": 0,
             "evaluated": 0,
             "ai_related": 0,
             "not_ai_related": 0,
+            "enqueued": 0,
+            "llm_skipped": 0,
             "errors": 0,
         }
 
-        results["total_jobs"] = len(data)
+        run, already_completed = await open_run(db, file_path, force)
+        if already_completed:
+            return {**results, **run.counters, "run_id": run.id, "resumed_from": 0, "already_completed": 1}
+        resume_from = run.records_committed
+        if resume_from:
+            results.update(run.counters)
+            print(f"Resuming run {run.id} after record {resume_from}")
+        # Replaces the resume pass counters of an earlier attempt
+        results["resumed"] = dict.fromkeys(_RESUME_COUNTERS, 0)
+        resumed_ids: Set[str] = set()
 
-        for idx, job_data in enumerate(data):
-            try:
-                job = self._parse_job_data(job_data)
-
-                existing = await db.get(Job, job.id)
-                if existing:
-                    # Update job metadata even if already ingested
-                    existing.job_age_hours = job.job_age_hours
-                    existing.job_age_string = job.job_age_string
-                    existing.applicant_count = job.applicant_count
-                    existing.interviewing_count = job.interviewing_count
-                    existing.invite_only = job.invite_only
-                    existing.client_payment_verified = job.client_payment_verified
-                    existing.client_rating = job.client_rating
-                    existing.client_jobs_posted = job.client_jobs_posted
-                    existing.client_hire_rate = job.client_hire_rate
-                    existing.client_total_paid = job.client_total_paid
-                    existing.client_hires = job.client_hires
-                    existing.client_reviews = job.client_reviews
-                    existing.experience_level = job.experience_level
-                    existing.project_length = job.project_length
-                    existing.proposal_required = job.proposal_required
-                    existing.client_response_time = job.client_response_time
-                    existing.description_urls = job.description_urls
-                    existing.updated_at = datetime.utcnow()
-                    await db.commit()
-                    results["ingested"] += 1
-                else:
-                    db.add(job)
-                    await db.commit()
-                    await db.refresh(job)
-                    results["ingested"] += 1
+        pending_tasks = []
+        # Bounded hand-offs between stages: parsing pauses while storing is
+        # behind, storing pauses while evaluation slots are busy
+        batches: asyncio.Queue = asyncio.Queue(maxsize=2)
+        to_evaluate: asyncio.PriorityQueue = asyncio.PriorityQueue(maxsize=self.queue_size)
+        started = itertools.count(1)
+
+        try:
+            async with EvaluationWriter() as writer:
+                with open_export(file_path) as records:
+                    async with asyncio.TaskGroup() as stages:
+                        stages.create_task(self._parse_stage(records, batches, resume_from))
+                        stages.create_task(self._store_stage(
+                            batches, to_evaluate, db, writer, pending_tasks, results,
+                            checkpoint_interval, run, resumed_ids,
+                        ))
+                        for _ in range(self.concurrency):
+                            stages.create_task(
+                                self._evaluate_stage(to_evaluate, started, writer)
+                            )
+
+            if pending_tasks:
+                results["enqueued"] += await self.queue.enqueue(db, pending_tasks)
+        except Exception as e:
+            await finish_run(db, run, results, error=f"{type(e).__name__}: {e}")
+            raise
+
+        # Evaluations whose buffered write failed were counted by outcome above
+        uncount_failed_writes(results, writer, writer.failed_ids - resumed_ids)
+        uncount_failed_writes(results["resumed"], writer, writer.failed_ids & resumed_ids)
+
+        await finish_run(db, run, results)
+        return {**results, "run_id": run.id, "resumed_from": resume_from, "already_completed": 0}
+
+    async def bulk_load_apify_json(self, file_path: Path, db: AsyncSession) -> Dict[str, int]:
+        """Load a large export with COPY and one set-based merge, without evaluating.
+
+        Jobs are parsed with _parse_job_data and streamed into an unlogged
+        staging table, then merged into jobs in one statement (see
+        copy_merge_jobs). The whole load is one transaction. When a queue is
+        set, stored jobs without an evaluation are enqueued for workers.
+
+        Args:
+            file_path: Apify export: JSON array or NDJSON, optionally gzip/zstd compressed
+            db: Database session
 
-                from ..models.evaluation import JobEvaluation
-                from sqlalchemy import select
-                existing_eval = await db.execute(
-                    select(JobEvaluation).where(JobEvaluation.job_id == job.id)
+        Returns:
+            Counts: total_jobs, ingested (inserted + updated + unchanged), unevaluated,
+            enqueued, errors (records that failed to parse)
+        """
+        results = {
+            "total_jobs": 0,
+            "ingested": 0,
+            "inserted": 0,
+            "updated": 0,
+            "unchanged": 0,
+            "unevaluated": 0,
+            "enqueued": 0,
+            "errors": 0,
+        }
+        priorities: Dict[str, int] = {}
+
+        def parsed_jobs(records: Iterable[Dict[str, Any]]) -> Iterator[Job]:
+            for job_data in records:
+                results["total_jobs"] += 1
+                try:
+                    job = self._parse_job_data(job_data)
+                except Exception:
+                    results["errors"] += 1
+                    traceback.print_exc()
+                    continue
+                if self.queue is not None:
+                    priorities[job.id] = self._queue_priority(job)
+                yield job
+
+        with open_export(file_path) as records:
+            stored, unevaluated = await copy_merge_jobs(db, parsed_jobs(records))
+        await db.commit()
+
+        for status in stored.values():
+            results[status] += 1
+        results["ingested"] = len(stored)
+        results["unevaluated"] = len(unevaluated)
+
+        if self.queue is not None:
+            # enqueue binds 3 parameters per job; keep each statement well under the limit
+            for offset in range(0, len(unevaluated), 5000):
+                chunk = unevaluated[offset:offset + 5000]
+                results["enqueued"] += await self.queue.enqueue(
+                    db, [(job_id, priorities[job_id]) for job_id in chunk]
                 )
-                existing_record = existing_eval.scalar_one_or_none()
+        return results
+
+    async def _parse_stage(
+        self,
+        records: Iterator[Dict[str, Any]],
+        batches: asyncio.Queue,
+        resume_from: int = 0,
+    ):
+        """Parse records into _ParsedChunks in file order, ending with None.
+
+        Raw records are read in a worker thread and normalized in chunks of
+        batch_size by normalize_records, in a thread or, with parse_workers, in
+        a process pool with one chunk in flight per process. The event loop keeps
+        serving LLM responses meanwhile. Records before resume_from were stored
+        by an earlier attempt and only have their ids passed on.
+        """
+        numbered = enumerate(records)
+
+        def next_chunk() -> List[Tuple[int, Dict[str, Any]]]:
+            return list(itertools.islice(numbered, self.batch_size))
+
+        loop = asyncio.get_running_loop()
+        # spawn: forking a process that runs an event loop and threads is unsafe
+        pool = ProcessPoolExecutor(
+            self.parse_workers, mp_context=multiprocessing.get_context("spawn")
+        ) if self.parse_workers else None
+        in_flight = collections.deque()
+        exhausted = False
+        try:
+            while True:
+                # Keep one chunk per parse process busy
+                while not exhausted and len(in_flight) < max(1, self.parse_workers):
+                    chunk = await asyncio.to_thread(next_chunk)
+                    if not chunk:
+                        exhausted = True
+                        break
+                    resumed = [
+                        (idx, job_data["id"]) for idx, job_data in chunk
+                        if idx < resume_from and isinstance(job_data, dict) and "id" in job_data
+                    ]
+                    fresh = [(idx, job_data) for idx, job_data in chunk if idx >= resume_from]
+                    future = loop.run_in_executor(
+                        pool, normalize_records, [job_data for _, job_data in fresh], self.reference_time
+                    ) if fresh else None
+                    in_flight.append((chunk[-1][0] + 1, resumed, [idx for idx, _ in fresh], future))
+                if not in_flight:
+                    break
+
+                end_offset, resumed, indices, future = in_flight.popleft()
+                rows = await future if future is not None else []
+                jobs = [(idx, Job(**row)) for idx, row in zip(indices, rows) if row is not None]
+                await batches.put(_ParsedChunk(
+                    end_offset=end_offset,
+                    jobs=jobs,
+                    resumed=resumed,
+                    records=len(indices),
+                    errors=len(indices) - len(jobs),
+                ))
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+        await batches.put(None)
+
+    async def _store_stage(
+        self,
+        batches: asyncio.Queue,
+        to_evaluate: asyncio.PriorityQueue,
+        db: AsyncSession,
+        writer: EvaluationWriter,
+        pending_tasks: list,
+        results: Dict[str, int],
+        checkpoint_interval: int,
+        run: Optional[IngestionRun] = None,
+        resumed_ids: Optional[Set[str]] = None,
+    ):
+        """Store parsed chunks, then tell every evaluation slot to stop.
 
-                if existing_record:
+        Parse counts are taken here rather than in the parse stage, so the
+        counters saved with each resume offset match it. Ids of jobs routed
+        again for records before the resume offset are added to resumed_ids.
+        """
+        while (chunk := await batches.get()) is not None:
+            results["total_jobs"] += chunk.records
+            results["errors"] += chunk.errors
+            if chunk.resumed:
+                resumed_ids.update(job_id for _, job_id in chunk.resumed)
+                await self._resume_batch(
+                    chunk.resumed, db, writer, to_evaluate, results["resumed"], checkpoint_interval
+                )
+            if chunk.jobs:
+                await self._store_batch(
+                    chunk.jobs, db, writer, pending_tasks, to_evaluate, results, checkpoint_interval
+                )
+            if run is not None:
+                await record_progress(db, run, chunk.end_offset, results)
+        for _ in range(self.concurrency):
+            await to_evaluate.put(_END_OF_INPUT)
+
+    async def _store_batch(
+        self,
+        batch: List[Tuple[int, Job]],
+        db: AsyncSession,
+        writer: EvaluationWriter,
+        pending_tasks: list,
+        to_evaluate: asyncio.PriorityQueue,
+        results: Dict[str, int],
+        checkpoint_interval: int,
+    ) -> None:
+        """Upsert a batch of parsed jobs, then route the stored ones.
+
+        The batch is written with one INSERT ... ON CONFLICT per chunk and a
+        single commit. If that fails, jobs are retried one per transaction so
+        a single bad row only loses itself.
+        """
+        jobs = [job for _, job in batch]
+        try:
+            stored = await upsert_jobs(db, jobs)
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            traceback.print_exc()
+            stored = {}
+            for job in jobs:
+                try:
+                    stored.update(await upsert_jobs(db, [job]))
+                    await db.commit()
+                except Exception:
+                    results["errors"] += 1
+                    traceback.print_exc()
+                    await db.rollback()
+
+        for status in stored.values():
+            results[status] += 1
+        results["ingested"] += len(stored)
+
+        # One query for the whole batch instead of one lookup per job
+        evaluated = await self._existing_evaluations(db, list(stored))
+        await self._route_batch(
+            [(idx, job) for idx, job in batch if job.id in stored], evaluated,
+            db, writer, pending_tasks, to_evaluate, results, checkpoint_interval,
+        )
+
+    async def _resume_batch(
+        self,
+        resumed: List[Tuple[int, str]],
+        db: AsyncSession,
+        writer: EvaluationWriter,
+        to_evaluate: asyncio.PriorityQueue,
+        results: Dict[str, int],
+        checkpoint_interval: int,
+    ) -> None:
+        """Route jobs an earlier attempt stored but did not get evaluated.
+
+        Records before the resume offset are not parsed or written again. One
+        query finds their jobs that still lack an evaluation (still queued or
+        buffered when the run stopped), which are routed like new ones and
+        counted in `results`, the resume pass counters. Their queue tasks are
+        enqueued here so they are counted there too.
+        """
+        positions = {job_id: idx for idx, job_id in resumed}
+        result = await db.execute(
+            select(Job)
+            .outerjoin(JobEvaluation, JobEvaluation.job_id == Job.id)
+            .where(
+                Job.id == any_(bindparam("ids", list(positions), type_=ARRAY(String))),
+                JobEvaluation.job_id.is_(None),
+            )
+        )
+        batch = sorted(
+            ((positions[job.id], job) for job in result.scalars()), key=lambda item: item[0]
+        )
+        pending_tasks = []
+        await self._route_batch(
+            batch, {}, db, writer, pending_tasks, to_evaluate, results, checkpoint_interval
+        )
+        if pending_tasks:
+            results["enqueued"] += await self.queue.enqueue(db, pending_tasks)
+
+    async def _route_batch(
+        self,
+        batch: List[Tuple[int, Job]],
+        evaluated: Dict[str, bool],
+        db: AsyncSession,
+        writer: EvaluationWriter,
+        pending_tasks: list,
+        to_evaluate: asyncio.PriorityQueue,
+        results: Dict[str, int],
+        checkpoint_interval: int,
+    ) -> None:
+        """Skip, prefilter, enqueue or queue for inline evaluation each stored job.
+
+        Args:
+            batch: (file index, job) of stored jobs
+            evaluated: is_ai_related of the jobs that already have an evaluation
+            results: Counters for the batch's jobs, also for their inline evaluations
+        """
+        for idx, job in batch:
+            try:
+                if job.id in evaluated:
                     print(f"  → Already evaluated, skipping")
                     results["evaluated"] += 1
-                    if existing_record.is_ai_related:
+                    if evaluated[job.id]:
                         results["ai_related"] += 1
                     else:
                         results["not_ai_related"] += 1
+                elif self.relevance_filter and (
+                    prefiltered := self.relevance_filter.prefilter(job)
+                ) is not None:
+                    await writer.add(prefiltered)
+                    results["evaluated"] += 1
+                    results["not_ai_related"] += 1
+                    results["llm_skipped"] += 1
+                    print(f"  → Skipped LLM ({prefiltered.filter_reason})")
+                elif self.queue is not None:
+                    pending_tasks.append((job.id, self._queue_priority(job)))
+                    if len(pending_tasks) >= checkpoint_interval:
+                        results["enqueued"] += await self.queue.enqueue(db, pending_tasks)
+                        pending_tasks.clear()
                 else:
-                    print(f"Evaluating job {idx + 1}: {job.title[:50]}...")
-                    try:
-                        evaluation = await self.evaluator.evaluate_job(job, db)
-
-                        if evaluation:
-                            results["evaluated"] += 1
-                            if evaluation.is_ai_related:
-                                results["ai_related"] += 1
-                            else:
-                                results["not_ai_related"] += 1
-
-                            print(f"  → Score: {evaluation.score_total}/100, Priority: {evaluation.priority}")
-                    except Exception as eval_error:
-                        import httpx
-                        if isinstance(eval_error, httpx.HTTPStatusError) and eval_error.response.status_code == 502:
-                            print(f"  → API unavailable (502), will retry in next run")
-                        else:
-                            raise
+                    value = expected_value(job)
+                    # Highest value first; ties (and order="file") keep file order
+                    sort_key = -value if self.order == "value" else 0.0
+                    await to_evaluate.put((sort_key, idx, value, job.id, results))
 
                 if (idx + 1) % checkpoint_interval == 0:
-                    print(f"Checkpoint: {idx + 1}/{len(data)} jobs processed")
+                    print(f"Checkpoint: {idx + 1} jobs processed")
 
-            except Exception as e:
+            except Exception:
                 results["errors"] += 1
-                import traceback
                 traceback.print_exc()
                 await db.rollback()
 
-        return results
+    async def _existing_evaluations(self, db: AsyncSession, job_ids: List[str]) -> Dict[str, bool]:
+        """is_ai_related of the stored evaluations among job_ids, keyed by job id.
 
-    def _parse_job_data(self, job_data: Dict[str, Any]) -> Job:
-        budget_amount = None
-        duration_weeks = None
-
-        if "fixed" in job_data and job_data["fixed"]:
-            fixed = job_data["fixed"]
-            if "budget" in fixed and fixed["budget"]:
-                budget_amount = float(fixed["budget"]["amount"])
-            if "duration" in fixed and fixed["duration"]:
-                duration_rid = fixed["duration"].get("rid")
-                duration_weeks = self._map_duration_rid_to_weeks(duration_rid)
-
-        ts_publish = self._parse_timestamp(job_data.get("ts_publish"))
-        scraped_at = self._parse_timestamp(job_data.get("scraped_at"))
-
-        # Calculate job age
-        description = job_data.get("description", "")
-        job_age_hours, job_age_str = calculate_job_age(ts_publish) if ts_publish else (0, "")
-
-        # Extract URLs from description
-        urls = extract_urls(description)
-
-        # Get client data (default to 0/None if not available)
-        client_data = job_data.get("client_info", {})
-        client_secondary = job_data.get("client_secondary_info", {})
-
-        return Job(
-            id=job_data["id"],
-            title=job_data["title"],
-            ts_publish=ts_publish,
-            description=description,
-            type=job_data.get("type", "FIXED"),
-            url=job_data["url"],
-            fixed_budget_amount=budget_amount,
-            fixed_duration_weeks=duration_weeks,
-            job_age_hours=job_age_hours,
-            job_age_string=job_age_str,
-            applicant_count=job_data.get("applicant_count", 0),
-            interviewing_count=job_data.get("interviewing_count", 0),
-            invite_only=job_data.get("invite_only", False),
-            client_payment_verified=job_data.get("payment_verified", False),
-            client_rating=job_data.get("client_rating"),
-            client_jobs_posted=job_data.get("client_jobs_posted", 0),
-            client_hire_rate=job_data.get("client_hire_rate"),
-            client_total_paid=job_data.get("client_total_paid"),
-            client_hires=job_data.get("client_hires", 0),
-            client_reviews=job_data.get("client_reviews", 0),
-            experience_level=job_data.get("experience_level"),
-            project_length=job_data.get("project_length"),
-            proposal_required=job_data.get("proposal_required", False),
-            client_response_time=job_data.get("client_response_time"),
-            description_urls=urls,
-            source="apify",
-            scraped_at=scraped_at,
+        Binds the ids as a single array parameter (job_id = ANY(:ids)).
+        """
+        if not job_ids:
+            return {}
+        result = await db.execute(
+            select(JobEvaluation.job_id, JobEvaluation.is_ai_related).where(
+                JobEvaluation.job_id == any_(bindparam("ids", job_ids, type_=ARRAY(String)))
+            )
         )
+        return dict(result.all())
 
-    def _map_duration_rid_to_weeks(self, rid: int | None) -> float | None:
-        if rid is None:
-            return None
+    async def _evaluate_stage(
+        self,
+        to_evaluate: asyncio.PriorityQueue,
+        started: Iterator[int],
+        writer: EvaluationWriter,
+    ):
+        """One evaluation slot: evaluate queued jobs until the end marker.
 
-        mapping = {
-            1: 52.0,
-            2: 18.0,
-            3: 9.0,
-            4: 3.0,
-        }
+        With order="value" the slot takes the highest expected value among the
+        jobs stored so far. High-priority evaluations are flushed to the database
+        immediately so they show up in /jobs/ranked without waiting for the rest
+        of the run.
+        """
+        while True:
+            # Each job comes with the counters of the pass that routed it
+            _, _, value, job_id, results = await to_evaluate.get()
+            if job_id is None:
+                return
+            try:
+                async with self.session_factory() as db:
+                    job = await db.get(Job, job_id)
+            except Exception:
+                results["errors"] += 1
+                traceback.print_exc()
+                continue
+            if job is None:
+                # Deleted or rolled back since it was queued
+                print(f"Job {job_id} is no longer stored, skipping")
+                results["errors"] += 1
+                continue
+            await self._evaluate_one(job, value, next(started), writer, results)
 
-        return mapping.get(rid)
+    async def _evaluate_one(
+        self,
+        job: Job,
+        value: float,
+        position: int,
+        writer: EvaluationWriter,
+        results: Dict[str, int],
+    ):
+        """Evaluate one pending job and hand the result to the writer."""
+        print(f"Evaluating job {position} (value {value:.0f}): {job.title[:50]}...")
+        try:
+            evaluation = await self.evaluator.evaluate(job)
+            await writer.add(evaluation)
 
-    def _parse_timestamp(self, ts: str | None) -> datetime | None:
-        if ts is None:
-            return None
+            results["evaluated"] += 1
+            if evaluation.is_ai_related:
+                results["ai_related"] += 1
+            else:
+                results["not_ai_related"] += 1
 
-        try:
-            dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-            return dt.replace(tzinfo=None)
-        except (ValueError, AttributeError):
-            return None
\ No newline at end of file
+            print(f"  → Score: {evaluation.score_total}/100, Priority: {evaluation.priority}")
+            if evaluation.priority == "High":
+                await writer.flush()
+                print(f"  ★ High priority: {job.title[:60]} ({job.url})")
+        except Exception as eval_error:
+            import httpx
+            # The client wraps the last attempt's error in LLMCallError
+            cause = eval_error.__cause__ if isinstance(eval_error, LLMCallError) else eval_error
+            if isinstance(cause, httpx.HTTPStatusError) and cause.response.status_code == 502:
+                print(f"  → API unavailable (502), will retry in next run")
+            else:
+                results["errors"] += 1
+                traceback.print_exc()
+
+    def _queue_priority(self, job: Job) -> int:
+        """Queue priority for a job: its rounded expected value, or 0 in file order."""
+        return round(expected_value(job)) if self.order == "value" else 0
+
+    def _parse_job_data(self, job_data: Dict[str, Any]) -> Job:
+        return Job(**normalize_job(job_data, self.reference_time))
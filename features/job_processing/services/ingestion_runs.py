@@ -0,0 +1,102 @@
+import hashlib
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.ingestion_run import IngestionRun
+
+
+def file_sha256(file_path: Path) -> str:
+    """Hex SHA-256 of a file's content, read in chunks."""
+    with open(file_path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+async def open_run(
+    db: AsyncSession, file_path: Path, force: bool = False
+) -> Tuple[IngestionRun, bool]:
+    """Start a run for a file, or pick up the unfinished run of the same content.
+
+    Args:
+        db: Database session (committed here)
+        file_path: Export about to be ingested
+        force: Start from the first record even if the file was ingested before
+
+    Returns:
+        (run, already_completed); when already_completed the run is the earlier
+        completed one and nothing should be ingested
+    """
+    digest = file_sha256(file_path)
+    result = await db.execute(
+        select(IngestionRun)
+        .where(IngestionRun.file_sha256 == digest)
+        .order_by(IngestionRun.id.desc())
+        .limit(1)
+    )
+    latest = result.scalar_one_or_none()
+
+    if latest is not None and not force:
+        if latest.status == "completed":
+            return latest, True
+        # Crashed ("running") or failed: continue after its last committed record
+        latest.status = "running"
+        latest.file_path = str(file_path)
+        latest.resumes += 1
+        latest.last_error = None
+        await db.commit()
+        return latest, False
+
+    run = IngestionRun(file_path=str(file_path), file_sha256=digest, counters={})
+    db.add(run)
+    await db.commit()
+    return run, False
+
+
+async def record_progress(
+    db: AsyncSession, run: IngestionRun, records_committed: int, counters: Dict[str, int]
+):
+    """Persist the resume offset and counters after a batch has been committed."""
+    run.records_committed = records_committed
+    run.counters = dict(counters)
+    await db.commit()
+
+
+async def finish_run(
+    db: AsyncSession, run: IngestionRun, counters: Dict[str, int], error: Optional[str] = None
+):
+    """Mark a run completed, or failed with the error (it stays resumable)."""
+    if error:
+        # The session may hold the failed batch's aborted transaction
+        await db.rollback()
+    run.status = "failed" if error else "completed"
+    run.counters = dict(counters)
+    run.last_error = error
+    run.finished_at = None if error else datetime.utcnow()
+    await db.commit()
+
+
+def run_summary(run: IngestionRun) -> Dict[str, Any]:
+    return {
+        "id": run.id,
+        "file_path": run.file_path,
+        "file_sha256": run.file_sha256,
+        "status": run.status,
+        "records_committed": run.records_committed,
+        "counters": run.counters,
+        "resumes": run.resumes,
+        "last_error": run.last_error,
+        "started_at": run.started_at,
+        "updated_at": run.updated_at,
+        "finished_at": run.finished_at,
+    }
+
+
+async def list_runs(db: AsyncSession, limit: int = 50) -> List[Dict[str, Any]]:
+    """Most recent ingestion runs first."""
+    result = await db.execute(
+        select(IngestionRun).order_by(IngestionRun.id.desc()).limit(limit)
+    )
+    return [run_summary(run) for run in result.scalars()]
@@ -0,0 +1,200 @@
+import hashlib
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+from uuid import uuid4
+
+import orjson
+from sqlalchemy import Boolean, column, exists, func, literal_column, select, table, text
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.evaluation import JobEvaluation
+from ..models.job import Job
+
+# Postgres accepts at most 32767 bind parameters per statement
+MAX_BIND_PARAMETERS = 32767
+
+# Columns refreshed when an already stored job shows up again in an export
+JOB_METADATA_COLUMNS = (
+    "job_age_hours",
+    "job_age_string",
+    "applicant_count",
+    "interviewing_count",
+    "invite_only",
+    "client_payment_verified",
+    "client_rating",
+    "client_jobs_posted",
+    "client_hire_rate",
+    "client_total_paid",
+    "client_hires",
+    "client_reviews",
+    "experience_level",
+    "project_length",
+    "proposal_required",
+    "client_response_time",
+    "description_urls",
+    "detected_tech",
+    "detected_expertise_ids",
+    "updated_at",
+    "metadata_hash",
+)
+
+# Columns whose values make up metadata_hash. The job age is derived from
+# ts_publish and the time of parsing, so it differs on every re-import; it is
+# refreshed along with a real change but never causes an update on its own.
+FINGERPRINT_COLUMNS = tuple(
+    name for name in JOB_METADATA_COLUMNS
+    if name not in ("job_age_hours", "job_age_string", "updated_at", "metadata_hash")
+)
+
+
+def metadata_fingerprint(row: Dict[str, Any]) -> str:
+    """Hash of a job's refreshable metadata; equal hashes mean an update would change nothing."""
+    values = orjson.dumps([row[name] for name in FINGERPRINT_COLUMNS])
+    return hashlib.blake2b(values, digest_size=16).hexdigest()
+
+
+def _upsert_statuses(rows: Iterable[Tuple[str, Any]]) -> Dict[str, str]:
+    """Map (id, inserted) result rows to "inserted", "updated" or, for a NULL flag, "unchanged"."""
+    return {
+        job_id: "unchanged" if inserted is None else "inserted" if inserted else "updated"
+        for job_id, inserted in rows
+    }
+
+
+def job_row(job: Job) -> Dict[str, Any]:
+    """Convert an unsaved Job into a full column dict for a bulk insert.
+
+    Unset columns get their model defaults, which Core inserts of explicit
+    values would otherwise skip.
+    """
+    row = {}
+    for col in Job.__table__.columns:
+        value = getattr(job, col.key)
+        if value is None and col.default is not None:
+            value = col.default.arg(None) if col.default.is_callable else col.default.arg
+        row[col.name] = value
+    row["updated_at"] = datetime.utcnow()
+    row["metadata_hash"] = metadata_fingerprint(row)
+    return row
+
+
+async def upsert_jobs(db: AsyncSession, jobs: Sequence[Job]) -> Dict[str, str]:
+    """Insert new jobs and refresh the metadata of stored ones in bulk.
+
+    Runs one multi-row INSERT ... ON CONFLICT (id) DO UPDATE over
+    JOB_METADATA_COLUMNS per chunk of rows that fits the bind parameter limit;
+    title, description and created_at of stored jobs are kept. Stored jobs
+    whose metadata_hash is unchanged are not updated at all (no dead tuple,
+    updated_at kept). The caller commits.
+
+    Args:
+        db: Database session
+        jobs: Parsed jobs; for duplicate ids the last one wins
+
+    Returns:
+        Job id -> "inserted", "updated" or "unchanged"
+    """
+    rows: List[Dict[str, Any]] = list({job.id: job_row(job) for job in jobs}.values())
+    chunk_size = MAX_BIND_PARAMETERS // len(Job.__table__.columns)
+
+    outcome: Dict[str, str] = {}
+    for offset in range(0, len(rows), chunk_size):
+        chunk = rows[offset:offset + chunk_size]
+        statement = insert(Job).values(chunk)
+        statement = statement.on_conflict_do_update(
+            index_elements=[Job.id],
+            set_={name: statement.excluded[name] for name in JOB_METADATA_COLUMNS},
+            where=Job.metadata_hash.is_distinct_from(statement.excluded.metadata_hash),
+        ).returning(
+            Job.id,
+            # xmax is 0 for a freshly inserted row version and set for an updated one
+            literal_column("(xmax = 0)", Boolean).label("inserted"),
+        )
+        result = await db.execute(statement)
+        # Conflicting rows skipped by the WHERE are not returned
+        outcome.update(_upsert_statuses((row["id"], None) for row in chunk))
+        outcome.update(_upsert_statuses(result.all()))
+    return outcome
+
+
+def _copy_record(job: Job, seq: int) -> tuple:
+    """Row tuple for COPY: job_row values in table column order, then the sequence number."""
+    row = job_row(job)
+    values = []
+    for col in Job.__table__.columns:
+        value = row[col.name]
+        if isinstance(col.type, JSONB):
+            # The asyncpg codec set up by SQLAlchemy takes JSON text
+            value = orjson.dumps(value).decode()
+        values.append(value)
+    values.append(seq)
+    return tuple(values)
+
+
+async def copy_merge_jobs(
+    db: AsyncSession, jobs: Iterable[Job]
+) -> Tuple[Dict[str, str], List[str]]:
+    """Bulk load jobs through an unlogged staging table.
+
+    Streams all jobs into a fresh UNLOGGED staging table with one COPY
+    (asyncpg copy_records_to_table), then merges it into jobs with a single
+    INSERT ... SELECT ... ON CONFLICT (id) DO UPDATE over JOB_METADATA_COLUMNS,
+    skipping stored jobs whose metadata_hash is unchanged. The staging table is
+    dropped in the same transaction; the caller commits.
+
+    Args:
+        db: Database session
+        jobs: Parsed jobs (consumed lazily); for duplicate ids the last one wins
+
+    Returns:
+        (job id -> "inserted", "updated" or "unchanged";
+        ids of loaded jobs without a stored evaluation)
+    """
+    names = [col.name for col in Job.__table__.columns]
+    staging_name = f"jobs_staging_{uuid4().hex[:12]}"
+    staging = table(staging_name, *[column(name) for name in names], column("staging_seq"))
+
+    await db.execute(text(
+        f"CREATE UNLOGGED TABLE {staging_name} "
+        f"(LIKE {Job.__tablename__} INCLUDING DEFAULTS, staging_seq bigint NOT NULL)"
+    ))
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        staging_name,
+        records=(_copy_record(job, seq) for seq, job in enumerate(jobs)),
+        columns=names + ["staging_seq"],
+    )
+
+    ranked = select(
+        staging,
+        func.row_number().over(
+            partition_by=staging.c.id, order_by=staging.c.staging_seq.desc()
+        ).label("rank"),
+    ).subquery()
+    latest = select(*[ranked.c[name] for name in names]).where(ranked.c.rank == literal_column("1"))
+    merge = insert(Job).from_select(names, latest)
+    merge = merge.on_conflict_do_update(
+        index_elements=[Job.id],
+        set_={name: merge.excluded[name] for name in JOB_METADATA_COLUMNS},
+        where=Job.metadata_hash.is_distinct_from(merge.excluded.metadata_hash),
+    ).returning(Job.id, literal_column("(xmax = 0)", Boolean).label("inserted"))
+    merged = merge.cte("merged")
+    # Unchanged jobs are not returned by the merge: report every staged id,
+    # with a NULL inserted flag for those
+    staged_ids = select(staging.c.id).distinct().subquery()
+    result = await db.execute(
+        select(
+            staged_ids.c.id,
+            merged.c.inserted,
+            exists().where(JobEvaluation.job_id == staged_ids.c.id).label("evaluated"),
+        ).outerjoin(merged, merged.c.id == staged_ids.c.id)
+    )
+
+    rows = result.all()
+    outcome = _upsert_statuses((job_id, inserted) for job_id, inserted, _ in rows)
+    unevaluated = [job_id for job_id, _, evaluated in rows if not evaluated]
+
+    await db.execute(text(f"DROP TABLE {staging_name}"))
+    return outcome, unevaluated
@@ -0,0 +1,111 @@
+import asyncio
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.backends import create_backend
+from core.openai_compatible import OpenAICompatibleClient, ReservedSlotClient
+from ..models.job import Job
+from ..models.evaluation import JobEvaluation
+from .evaluator import JobEvaluator, is_stale, load_default_expertise
+from .telemetry import TelemetryWriter
+
+
+class OnDemandEvaluator:
+    """Evaluates single jobs for the API.
+
+    A stored evaluation that is not stale for the evaluator (see is_stale) is
+    returned as is. Otherwise the job is evaluated on the client's reserved
+    slot; concurrent requests for the same job share one LLM call. If the
+    request making that call is cancelled, a waiting request makes it instead.
+    """
+
+    def __init__(self, evaluator: JobEvaluator):
+        """Initialize on-demand evaluator.
+
+        Args:
+            evaluator: Evaluator whose client uses the reserved slot
+        """
+        self.evaluator = evaluator
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    async def evaluate(self, job: Job, db: AsyncSession) -> Tuple[JobEvaluation, str]:
+        """Return a current evaluation for a stored job.
+
+        Args:
+            job: Job already persisted in db
+            db: Database session
+
+        Returns:
+            Evaluation and its source: "existing", "evaluated" or "coalesced"
+        """
+        existing = await db.get(JobEvaluation, job.id)
+        if existing and not is_stale(existing.evaluation_version, self.evaluator.version):
+            return existing, "existing"
+
+        while job.id in self._in_flight:
+            shared = self._in_flight[job.id]
+            try:
+                return await asyncio.shield(shared), "coalesced"
+            except asyncio.CancelledError:
+                if not shared.cancelled():
+                    raise
+                # The request making the call was cancelled: make it again
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[job.id] = future
+        try:
+            evaluation = await self.evaluator.evaluate(job)
+            evaluation = await db.merge(evaluation)
+            await db.commit()
+            future.set_result(evaluation)
+            return evaluation, "evaluated"
+        except Exception as e:
+            await db.rollback()
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure is not logged as never retrieved
+            future.exception()
+            raise
+        except BaseException:
+            # Not the waiters' failure (e.g. this request's client disconnected)
+            future.cancel()
+            raise
+        finally:
+            del self._in_flight[job.id]
+
+
+_client: Optional[OpenAICompatibleClient] = None
+_telemetry: Optional[TelemetryWriter] = None
+_on_demand: Optional[OnDemandEvaluator] = None
+
+
+async def get_on_demand_evaluator(db: AsyncSession) -> OnDemandEvaluator:
+    """Process-wide evaluator, created on first use so the API starts without an LLM key check.
+
+    It scores against the stored "default" profile; after the profile is
+    edited, the next request swaps in an evaluator built from the new one.
+    """
+    global _client, _telemetry, _on_demand
+    expertise = await load_default_expertise(db)
+    if _on_demand is None:
+        _client = create_backend()
+        _telemetry = TelemetryWriter().start()
+        _on_demand = OnDemandEvaluator(_telemetry.attach(
+            JobEvaluator(ReservedSlotClient(_client), expertise=expertise)
+        ))
+    elif _on_demand.evaluator.expertise != expertise:
+        _on_demand.evaluator = _telemetry.attach(
+            JobEvaluator(ReservedSlotClient(_client), expertise=expertise)
+        )
+    return _on_demand
+
+
+async def close_on_demand_evaluator():
+    global _client, _telemetry, _on_demand
+    if _telemetry is not None:
+        await _telemetry.close()
+    if _client is not None:
+        await _client.close()
+    _client = None
+    _telemetry = None
+    _on_demand = None
@@ -0,0 +1,210 @@
+import asyncio
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.llm import ChatCompletionResult
+from ..models.job import Job
+from ..models.evaluation import JobEvaluation
+from .evaluator import JobEvaluator
+from .prompt_variants import ExpertiseAreas
+
+PRIORITIES = ("High", "Medium", "Low")
+COMPONENTS = ("budget", "client", "clarity", "tech_fit", "timeline")
+
+
+async def sample_jobs(db: AsyncSession, size: int, seed: int = 0) -> List[Job]:
+    """Deterministic pseudo-random job sample (same seed, same jobs)."""
+    result = await db.execute(
+        select(Job).order_by(func.md5(Job.id + str(seed))).limit(size)
+    )
+    return list(result.scalars().all())
+
+
+class PromptBenchmark:
+    """Runs several prompt variants over the same jobs and compares them to a baseline.
+
+    Nothing is written to the database; every variant evaluates every job.
+    """
+
+    def __init__(
+        self,
+        client,
+        variants: Sequence[str],
+        baseline: str = "baseline",
+        expertise: Optional[ExpertiseAreas] = None,
+    ):
+        """Initialize benchmark.
+
+        Args:
+            client: LLM client shared by all variants
+            variants: Registered prompt variant names to compare
+            baseline: Variant the others are compared against
+            expertise: Expertise areas every variant scores against
+        """
+        self.baseline = baseline
+        self.variants = [baseline] + [v for v in variants if v != baseline]
+        self._calls: Dict[str, List[ChatCompletionResult]] = defaultdict(list)
+        # Calls that failed on every attempt; they count towards the parse failure rate
+        self._failed_calls: Dict[str, List[ChatCompletionResult]] = defaultdict(list)
+        self.evaluators = {
+            name: JobEvaluator(
+                client,
+                prompt_variant=name,
+                expertise=expertise,
+                on_completion=lambda job_id, result, name=name: self._record(name, result),
+            )
+            for name in self.variants
+        }
+
+    def _record(self, name: str, result: ChatCompletionResult):
+        # Failed calls (no response) only feed the parse failure rate
+        if result.response is None:
+            self._failed_calls[name].append(result)
+        else:
+            self._calls[name].append(result)
+
+    async def run(self, jobs: Sequence[Job]) -> Dict[str, Any]:
+        """Evaluate every job with every variant.
+
+        Returns:
+            JSON-serialisable report
+        """
+        evaluations: Dict[str, Dict[str, Optional[JobEvaluation]]] = defaultdict(dict)
+        failures: Dict[str, int] = defaultdict(int)
+
+        async def evaluate(job: Job):
+            # Variants run back to back per job so load drift affects them equally
+            for name in self.variants:
+                try:
+                    evaluations[name][job.id] = await self.evaluators[name].evaluate(job)
+                except Exception as e:
+                    failures[name] += 1
+                    evaluations[name][job.id] = None
+                    print(f"  → {name} failed on {job.id}: {e}")
+
+        await asyncio.gather(*(evaluate(job) for job in jobs))
+
+        report = {
+            "sample_size": len(jobs),
+            "baseline": self.baseline,
+            "variants": {},
+            "agreement": {},
+        }
+        for name in self.variants:
+            report["variants"][name] = self._usage_stats(name, failures[name])
+            if name != self.baseline:
+                report["agreement"][name] = self._agreement(
+                    evaluations[self.baseline], evaluations[name]
+                )
+        return report
+
+    def _usage_stats(self, name: str, failed_calls: int) -> Dict[str, Any]:
+        calls = self._calls[name]
+        prompt_tokens = np.array([c.prompt_tokens for c in calls], dtype=float)
+        completion_tokens = np.array([c.completion_tokens for c in calls], dtype=float)
+        latency = np.array([c.latency for c in calls], dtype=float)
+        attempted = calls + self._failed_calls[name]
+        attempts = sum(c.attempts for c in attempted)
+        parse_failures = sum(c.parse_failures for c in attempted)
+
+        return {
+            "system_prompt_chars": len(self.evaluators[name].system_prompt),
+            "calls": len(calls),
+            "failed_calls": failed_calls,
+            "parse_failure_rate": parse_failures / attempts if attempts else 0.0,
+            "prompt_tokens_mean": float(prompt_tokens.mean()) if len(calls) else 0.0,
+            "completion_tokens_mean": float(completion_tokens.mean()) if len(calls) else 0.0,
+            "total_tokens": int(prompt_tokens.sum() + completion_tokens.sum()),
+            "latency_p50": float(np.percentile(latency, 50)) if len(calls) else 0.0,
+            "latency_p95": float(np.percentile(latency, 95)) if len(calls) else 0.0,
+        }
+
+    def _agreement(
+        self,
+        baseline: Dict[str, Optional[JobEvaluation]],
+        variant: Dict[str, Optional[JobEvaluation]],
+    ) -> Dict[str, Any]:
+        pairs = [
+            (baseline[job_id], variant[job_id])
+            for job_id in baseline
+            if baseline[job_id] is not None and variant.get(job_id) is not None
+        ]
+        confusion = {b: {v: 0 for v in PRIORITIES} for b in PRIORITIES}
+        for base, other in pairs:
+            if base.priority in confusion and other.priority in confusion[base.priority]:
+                confusion[base.priority][other.priority] += 1
+
+        both_ai = [(b, o) for b, o in pairs if b.is_ai_related and o.is_ai_related]
+        deltas = np.array([o.score_total - b.score_total for b, o in both_ai], dtype=float)
+        component_deltas = {
+            component: float(np.mean([
+                abs(getattr(o, f"score_{component}") - getattr(b, f"score_{component}"))
+                for b, o in both_ai
+            ])) if both_ai else 0.0
+            for component in COMPONENTS
+        }
+
+        return {
+            "jobs_compared": len(pairs),
+            "is_ai_related_agreement": (
+                sum(b.is_ai_related == o.is_ai_related for b, o in pairs) / len(pairs)
+                if pairs else 0.0
+            ),
+            "priority_agreement": (
+                sum(b.priority == o.priority for b, o in pairs) / len(pairs) if pairs else 0.0
+            ),
+            "priority_confusion": confusion,
+            "score_total_delta_mean": float(deltas.mean()) if len(deltas) else 0.0,
+            "score_total_delta_mean_abs": float(np.abs(deltas).mean()) if len(deltas) else 0.0,
+            "score_total_delta_max_abs": float(np.abs(deltas).max()) if len(deltas) else 0.0,
+            "component_delta_mean_abs": component_deltas,
+        }
+
+
+def render_markdown(report: Dict[str, Any]) -> str:
+    """Render a PromptBenchmark report as markdown."""
+    lines = [
+        "# Prompt Variant Benchmark",
+        "",
+        f"Sample: {report['sample_size']} jobs, baseline: `{report['baseline']}`",
+        "",
+        "| Variant | Prompt chars | Calls | Failed | Parse failures | Prompt tok | Completion tok | p50 s | p95 s |",
+        "|---|---|---|---|---|---|---|---|---|",
+    ]
+    for name, stats in report["variants"].items():
+        lines.append(
+            f"| {name} | {stats['system_prompt_chars']} | {stats['calls']} | "
+            f"{stats['failed_calls']} | {stats['parse_failure_rate']:.1%} | "
+            f"{stats['prompt_tokens_mean']:.0f} | {stats['completion_tokens_mean']:.0f} | "
+            f"{stats['latency_p50']:.2f} | {stats['latency_p95']:.2f} |"
+        )
+
+    for name, agreement in report["agreement"].items():
+        lines += [
+            "",
+            f"## `{name}` vs `{report['baseline']}`",
+            "",
+            f"- Jobs compared: {agreement['jobs_compared']}",
+            f"- is_ai_related agreement: {agreement['is_ai_related_agreement']:.1%}",
+            f"- Priority agreement: {agreement['priority_agreement']:.1%}",
+            f"- score_total delta: mean {agreement['score_total_delta_mean']:+.1f}, "
+            f"mean abs {agreement['score_total_delta_mean_abs']:.1f}, "
+            f"max abs {agreement['score_total_delta_max_abs']:.0f}",
+            "- Component mean abs delta: " + ", ".join(
+                f"{component} {delta:.2f}"
+                for component, delta in agreement["component_delta_mean_abs"].items()
+            ),
+            "",
+            "| Baseline \\ Variant | " + " | ".join(PRIORITIES) + " |",
+            "|---|" + "---|" * len(PRIORITIES),
+        ]
+        for base_priority, row in agreement["priority_confusion"].items():
+            lines.append(
+                f"| {base_priority} | " + " | ".join(str(row[p]) for p in PRIORITIES) + " |"
+            )
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,122 @@
+from typing import Any, Callable, Dict, List, Sequence
+
+ExpertiseAreas = Sequence[Dict[str, Any]]
+
+# Expertise of the seeded "default" profile, used when no stored profile is available.
+# The stored profile (PUT /jobs/profiles/default) takes precedence.
+DEFAULT_EXPERTISE: List[Dict[str, Any]] = [
+    {"id": 1, "name": "AI Agent Architecture & Design", "level": "Expert", "keywords": ["agent", "autonomous", "multi-agent", "LangChain", "crewAI"]},
+    {"id": 2, "name": "RAG Systems", "level": "Advanced", "keywords": ["RAG", "retrieval", "vector database", "embeddings", "semantic search"]},
+    {"id": 3, "name": "Local AI Infrastructure", "level": "Expert", "keywords": ["local LLM", "ollama", "LM Studio", "self-hosted", "on-premises", "privacy"]},
+    {"id": 4, "name": "Backend Systems", "level": "Expert", "keywords": ["FastAPI", "Python", "PostgreSQL", "pgvector", "REST API", "async"]},
+    {"id": 5, "name": "Frontend Development", "level": "Advanced", "keywords": ["React", "TypeScript", "Next.js", "UI", "web app"]},
+    {"id": 6, "name": "DevOps & Infrastructure", "level": "Expert", "keywords": ["Docker", "deployment", "CI/CD"]},
+    {"id": 7, "name": "Voice & Real-Time AI", "level": "Advanced", "keywords": ["voice", "audio", "Speech-to-Text", "text-to-speech", "WebRTC", "Deepgram"]},
+    {"id": 8, "name": "Testing & Code Quality", "level": "Intermediate-Advanced", "keywords": ["testing", "pytest", "TDD", "code quality", "CI"]},
+]
+
+# Named system prompt builders, called with the expertise areas to score against;
+# JobEvaluator(prompt_variant=...) selects one
+PROMPT_VARIANTS: Dict[str, Callable[[ExpertiseAreas], str]] = {}
+
+
+def format_expertise(expertise: ExpertiseAreas, indent: str = "") -> str:
+    """One "id: name [level]: keywords" line per expertise area."""
+    return "\n".join(
+        f"{indent}{area['id']}: {area['name']} [{area['level']}]: {', '.join(area.get('keywords', []))}"
+        for area in expertise
+    )
+
+
+def _expertise_ids(expertise: ExpertiseAreas) -> str:
+    """Valid expertise ids, as a range when they are consecutive."""
+    ids = sorted(area["id"] for area in expertise)
+    if ids and ids == list(range(ids[0], ids[-1] + 1)):
+        return f"{ids[0]}-{ids[-1]}"
+    return ", ".join(map(str, ids))
+
+
+def register_prompt_variant(name: str):
+    """Register a system prompt builder under `name`."""
+    def decorator(
+        builder: Callable[[ExpertiseAreas], str]
+    ) -> Callable[[ExpertiseAreas], str]:
+        if name in PROMPT_VARIANTS:
+            raise ValueError(f"Prompt variant {name!r} is already registered")
+        PROMPT_VARIANTS[name] = builder
+        return builder
+    return decorator
+
+
+@register_prompt_variant("baseline")
+def baseline_prompt(expertise: ExpertiseAreas) -> str:
+    areas = "\n".join(
+        f"{area['id']}. {area['name']} ({area['level']}): {', '.join(area.get('keywords', []))}"
+        for area in expertise
+    )
+    return f"""You are an expert job evaluator for an AI Systems Engineer.
+You evaluate Upwork jobs against the following profile:
+
+EXPERTISE AREAS:
+{areas}
+
+EVALUATION CRITERIA (score 0-10 for each):
+1. Budget Adequacy (25%): 10 if ≥$500 and matches scope, 0 if <$500 or mismatches wildly
+2. Client Reliability (15%): Evaluate using:
+   - Payment verification (verified=bonus)
+   - Client rating (4.5+=bonus, 4.0-4.5=ok, <4.0=penalty)
+   - Hire rate (>20%=bonus, 10-20%=ok, <10%=penalty)
+   - Total paid amount (>1000=bonus, 0=penalty)
+3. Requirements Clarity (20%): 10 if specific/actionable, 7 if clear but vague, 3 if ambiguous, 0 if nonsensical
+4. AI Technical Fit (30%): 10 if matches 3+ expertise areas, 7 if matches 2, 3 if matches 1, 0 if no match
+5. Competition & Freshness (10%): Evaluate using:
+   - Applicant count (<5=bonus, 5-15=neutral, >20=penalty)
+   - Job age (<24h=bonus, <72h=neutral, >1w=penalty)
+
+SCORE TO JSON FIELD MAPPING:
+- score_budget maps to "score_budget"
+- score_client maps to "score_client"
+- score_clarity maps to "score_clarity"
+- score_tech_fit maps to "score_tech_fit"
+- Competition score maps to "score_timeline" (JSON output field name)
+
+TOTAL SCORE = weighted sum (budget*2.5 + client*1.5 + clarity*2.0 + tech_fit*3.0 + competition*1.0)
+
+PRIORITY CLASSIFICATION:
+- High: score_total ≥ 80
+- Medium: 50 ≤ score_total < 80
+- Low: score_total < 50
+
+EXPERTISE MATCH FORMAT:
+Match expertise only when job description explicitly mentions related keywords or concepts.
+
+OUTPUT RULES:
+- Return valid JSON matching the exact field names: is_ai_related, tech_stack, project_type, complexity, matched_expertise (array with expertise_id and match_reason), score_budget, reason_budget, score_client, reason_client, score_clarity, reason_clarity, score_tech_fit, reason_tech_fit, score_timeline, reason_timeline, score_total, priority
+- is_ai_related=false → set filter_reason, other fields can be omitted
+- is_ai_related=true → fill all fields
+- complexity must be: Low, Medium, or High
+- priority must be: High, Medium, or High
+- expertise_id must be {_expertise_ids(expertise)} corresponding to expertise area
+- Provide clear, concise reasoning for each score"""
+
+
+@register_prompt_variant("compact")
+def compact_prompt(expertise: ExpertiseAreas) -> str:
+    """Baseline rubric without the redundant field mapping and prose."""
+    return f"""Evaluate Upwork jobs for an AI Systems Engineer. Reply with JSON only.
+
+EXPERTISE (id: area [level]: keywords):
+{format_expertise(expertise)}
+
+SCORES (0-10):
+score_budget: 10 if >=$500 and fits scope, 0 if <$500 or wildly off
+score_client: payment verified, rating (4.5+ good, <4.0 bad), hire rate (>20% good, <10% bad), total paid (>1000 good, 0 bad)
+score_clarity: 10 specific, 7 clear but vague, 3 ambiguous, 0 nonsensical
+score_tech_fit: 10 if 3+ expertise matches, 7 if 2, 3 if 1, 0 if none
+score_timeline: applicants (<5 good, >20 bad), age (<24h good, >1w bad)
+
+score_total = budget*2.5 + client*1.5 + clarity*2.0 + tech_fit*3.0 + timeline*1.0
+priority: High if score_total>=80, Medium if >=50, else Low
+
+FIELDS: is_ai_related, filter_reason, tech_stack, project_type, complexity (Low|Medium|High), matched_expertise [{{expertise_id, match_reason}}], score_budget, reason_budget, score_client, reason_client, score_clarity, reason_clarity, score_tech_fit, reason_tech_fit, score_timeline, reason_timeline, score_total, priority
+If is_ai_related=false, give only filter_reason. Match expertise only on explicit mentions. Keep reasons to one sentence."""
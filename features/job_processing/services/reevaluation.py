@@ -0,0 +1,135 @@
+import asyncio
+from typing import Dict, Optional
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.job import Job
+from ..models.evaluation import JobEvaluation
+from .evaluator import JobEvaluator, stale_clause
+from .evaluation_writer import EvaluationWriter
+
+
+class ReevaluationScheduler:
+    """Re-evaluates jobs whose stored evaluation came from an older prompt/model version.
+
+    Only rows of the evaluator's own kind are considered (see is_stale), so a
+    single-prompt scheduler leaves decomposed, fan-out and classifier rows alone.
+
+    Stale rows are processed best current score first, then freshest job, and LLM
+    calls are paced to a per-minute budget. Each re-evaluated row is committed with
+    the current version (one commit per batch through EvaluationWriter), so an
+    interrupted run simply resumes with what is left.
+    """
+
+    def __init__(
+        self,
+        evaluator: JobEvaluator,
+        rate_per_minute: int,
+        batch_size: int = 20,
+    ):
+        """Initialize scheduler.
+
+        Args:
+            evaluator: Evaluator whose version defines "current"
+            rate_per_minute: Maximum re-evaluations started per minute
+            batch_size: Stale rows fetched per query
+        """
+        self.evaluator = evaluator
+        self.batch_size = batch_size
+        self._min_interval = 60.0 / rate_per_minute
+        self._next_slot = 0.0
+
+    def _stale_clause(self):
+        return stale_clause(JobEvaluation.evaluation_version, self.evaluator.version)
+
+    async def count_stale(self, db: AsyncSession) -> int:
+        """Count evaluations that are not at the current version."""
+        return await db.scalar(
+            select(func.count(JobEvaluation.job_id)).where(self._stale_clause())
+        ) or 0
+
+    async def _wait_for_slot(self):
+        """Block until the rate budget allows the next LLM call."""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        if self._next_slot > now:
+            await asyncio.sleep(self._next_slot - now)
+            now = self._next_slot
+        self._next_slot = now + self._min_interval
+
+    async def run_once(
+        self,
+        db: AsyncSession,
+        limit: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """Re-evaluate stale rows until none are left (or limit is reached).
+
+        Args:
+            db: Database session
+            limit: Maximum number of re-evaluations in this pass
+
+        Returns:
+            Counters for the pass
+        """
+        stale = await self.count_stale(db)
+        results = {"stale": stale, "reevaluated": 0, "errors": 0, "remaining": stale}
+        failed_ids: set[str] = set()
+        target = min(stale, limit) if limit is not None else stale
+
+        print(f"Stale evaluations: {stale} (current version {self.evaluator.version})")
+
+        async with EvaluationWriter() as writer:
+            while results["reevaluated"] < target:
+                query = (
+                    select(Job, JobEvaluation.score_total)
+                    .join(JobEvaluation, Job.id == JobEvaluation.job_id)
+                    .where(self._stale_clause())
+                    .order_by(JobEvaluation.score_total.desc(), Job.ts_publish.desc())
+                    .limit(min(self.batch_size, target - results["reevaluated"]))
+                )
+                if failed_ids:
+                    query = query.where(Job.id.notin_(failed_ids))
+
+                batch = (await db.execute(query)).all()
+                if not batch:
+                    break
+
+                evaluated_ids = set()
+                for job, previous_score in batch:
+                    await self._wait_for_slot()
+                    try:
+                        evaluation = await self.evaluator.evaluate(job)
+                        await writer.add(evaluation)
+                        evaluated_ids.add(job.id)
+                        print(
+                            f"  {job.title[:50]}: "
+                            f"{previous_score} → {evaluation.score_total} ({evaluation.priority})"
+                        )
+                    except Exception as e:
+                        failed_ids.add(job.id)
+                        results["errors"] += 1
+                        print(f"  → Re-evaluation failed for {job.id}: {e}")
+
+                # One commit per batch, so the next query no longer sees these rows as stale
+                await writer.flush()
+                write_failures = evaluated_ids & writer.failed_ids
+                failed_ids.update(write_failures)
+                results["errors"] += len(write_failures)
+
+                done = len(evaluated_ids - write_failures)
+                results["reevaluated"] += done
+                results["remaining"] -= done
+                print(f"Progress: {results['reevaluated']}/{target} re-evaluated")
+
+        return results
+
+    async def run_forever(self, db: AsyncSession, interval: float):
+        """Keep re-evaluating stale rows, polling every `interval` seconds when idle."""
+        while True:
+            results = await self.run_once(db)
+            print(
+                f"Pass complete: {results['reevaluated']} re-evaluated, "
+                f"{results['errors']} errors, {results['remaining']} remaining"
+            )
+            await asyncio.sleep(interval)
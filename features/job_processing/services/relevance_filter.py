@@ -0,0 +1,150 @@
+import hashlib
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from sqlalchemy import select, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from ..models.job import Job
+from ..models.evaluation import JobEvaluation
+from ..utils.text_classifier import HashedLogisticRegression, calibration_report
+
+# evaluation_version prefix of rows decided by the classifier instead of the LLM
+CLASSIFIER_VERSION_PREFIX = "clf-"
+
+
+def _job_text(title: str, description: str) -> str:
+    return f"{title}\n{description}"
+
+
+class RelevanceFilter:
+    """Local pre-screen that skips the LLM for jobs that are clearly not AI-related.
+
+    Wraps a HashedLogisticRegression trained on stored job_evaluations.is_ai_related
+    labels. A job whose predicted probability of being AI-related is at or below
+    skip_threshold gets a "not AI-related" evaluation without an LLM call.
+    """
+
+    def __init__(self, model: HashedLogisticRegression, skip_threshold: float):
+        """Initialize filter.
+
+        Args:
+            model: Trained classifier
+            skip_threshold: Maximum p(AI-related) at which the LLM is skipped
+        """
+        self.model = model
+        self.skip_threshold = skip_threshold
+        digest = hashlib.sha256(model.weights.astype("float32").tobytes()).hexdigest()
+        self.version = f"{CLASSIFIER_VERSION_PREFIX}{digest[:12]}"
+
+    @classmethod
+    def load(
+        cls,
+        path: Path = Path(settings.relevance_model_path),
+        skip_threshold: Optional[float] = None,
+    ) -> "RelevanceFilter":
+        """Load a filter trained with train_from_db().
+
+        Args:
+            path: Model file
+            skip_threshold: Override the threshold stored with the model
+        """
+        model, metadata = HashedLogisticRegression.load(path)
+        if skip_threshold is None:
+            skip_threshold = metadata.get("skip_threshold", settings.relevance_skip_threshold)
+        return cls(model, skip_threshold)
+
+    @classmethod
+    async def train_from_db(
+        cls,
+        db: AsyncSession,
+        skip_threshold: float = settings.relevance_skip_threshold,
+        holdout_fraction: float = 0.2,
+    ) -> tuple["RelevanceFilter", Dict[str, Any]]:
+        """Train on LLM-produced evaluations and report holdout calibration.
+
+        The holdout split is deterministic (by job ID hash). After scoring the
+        holdout, the model is refit on all rows.
+
+        Args:
+            db: Database session
+            skip_threshold: Threshold used for the report and stored with the model
+            holdout_fraction: Share of rows held out for the calibration report
+
+        Returns:
+            Trained filter and calibration report of the holdout set
+        """
+        result = await db.execute(
+            select(Job.id, Job.title, Job.description, JobEvaluation.is_ai_related)
+            .join(JobEvaluation, Job.id == JobEvaluation.job_id)
+            # Never learn from the classifier's own decisions
+            .where(or_(
+                JobEvaluation.evaluation_version.is_(None),
+                JobEvaluation.evaluation_version.notlike(f"{CLASSIFIER_VERSION_PREFIX}%"),
+            ))
+        )
+        rows = result.all()
+        labels = [1 if is_ai else 0 for _, _, _, is_ai in rows]
+        if len(rows) < 20 or len(set(labels)) < 2:
+            raise ValueError(
+                f"Need at least 20 evaluations with both labels to train, found {len(rows)}"
+            )
+
+        cutoff = int(holdout_fraction * 100)
+        train, holdout = [], []
+        for (job_id, title, description, _), label in zip(rows, labels):
+            bucket = zlib.crc32(job_id.encode()) % 100
+            (holdout if bucket < cutoff else train).append((_job_text(title, description), label))
+
+        model = HashedLogisticRegression().fit([t for t, _ in train], [label for _, label in train])
+        report = calibration_report(
+            model.predict_proba([t for t, _ in holdout]),
+            [label for _, label in holdout],
+            skip_threshold,
+        )
+        report["train_samples"] = len(train)
+
+        model = HashedLogisticRegression().fit(
+            [_job_text(title, description) for _, title, description, _ in rows], labels
+        )
+        return cls(model, skip_threshold), report
+
+    def save(self, path: Path = Path(settings.relevance_model_path)):
+        self.model.save(path, skip_threshold=self.skip_threshold)
+
+    def probability(self, job: Job) -> float:
+        """Predicted probability that a job is AI-related."""
+        return float(self.model.predict_proba([_job_text(job.title, job.description)])[0])
+
+    def prefilter(self, job: Job) -> Optional[JobEvaluation]:
+        """Return a "not AI-related" evaluation if the LLM can be skipped, else None."""
+        probability = self.probability(job)
+        if probability > self.skip_threshold:
+            return None
+
+        return JobEvaluation(
+            job_id=job.id,
+            is_ai_related=0,
+            filter_reason=f"Local classifier: p(AI-related)={probability:.3f}",
+            tech_stack=[],
+            project_type="",
+            complexity="",
+            matched_expertise_ids=[],
+            score_budget=0,
+            score_client=0,
+            score_clarity=0,
+            score_tech_fit=0,
+            score_timeline=0,
+            score_total=0,
+            reason_budget="",
+            reason_client="",
+            reason_clarity="",
+            reason_tech_fit="",
+            reason_timeline="",
+            priority="Low",
+            evaluated_at=datetime.utcnow(),
+            evaluation_version=self.version,
+        )
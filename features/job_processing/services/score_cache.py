@@ -0,0 +1,84 @@
+import asyncio
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.evaluation import JobEvaluation
+from ..models.profile import JobProfileEvaluation
+from ..utils.score_ranking import SCORE_COMPONENTS
+
+
+class ScoreMatrixCache:
+    """In-process cache of the component scores of all AI-related evaluations.
+
+    Holds job IDs and a (jobs × components) float matrix so re-ranking with
+    custom weights is a single matrix-vector product. The cache is rebuilt when
+    the evaluation count or the latest evaluated_at changes. With a profile_id,
+    the tech fit column comes from that profile's fan-out evaluations.
+    """
+
+    def __init__(self, profile_id: Optional[str] = None):
+        self.profile_id = profile_id
+        self._key: Optional[Tuple[Any, ...]] = None
+        self._job_ids = np.zeros(0, dtype=object)
+        self._scores = np.zeros((0, len(SCORE_COMPONENTS)), dtype=np.float64)
+        self._lock = asyncio.Lock()
+
+    async def get(self, db: AsyncSession) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (job_ids, scores), reloading only if evaluations changed.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Job ID array and score matrix in SCORE_COMPONENTS column order
+        """
+        source = JobProfileEvaluation if self.profile_id else JobEvaluation
+        result = await db.execute(
+            self._filter(select(
+                func.count(source.job_id),
+                func.max(source.evaluated_at),
+                func.sum(source.score_total),
+            ))
+        )
+        key = tuple(result.one())
+
+        async with self._lock:
+            if key != self._key:
+                rows = (await db.execute(
+                    self._filter(select(
+                        JobEvaluation.job_id,
+                        *(
+                            getattr(source if c == "tech_fit" else JobEvaluation, f"score_{c}")
+                            for c in SCORE_COMPONENTS
+                        ),
+                    ))
+                )).all()
+                self._job_ids = np.array([row[0] for row in rows], dtype=object)
+                self._scores = np.array(
+                    [[score or 0 for score in row[1:]] for row in rows], dtype=np.float64
+                ).reshape(len(rows), len(SCORE_COMPONENTS))
+                self._key = key
+            return self._job_ids, self._scores
+
+    def _filter(self, query):
+        if self.profile_id:
+            query = query.select_from(JobEvaluation).join(
+                JobProfileEvaluation, JobProfileEvaluation.job_id == JobEvaluation.job_id
+            ).where(JobProfileEvaluation.profile_id == self.profile_id)
+        return query.where(JobEvaluation.is_ai_related == 1)
+
+
+_caches: Dict[Optional[str], ScoreMatrixCache] = {}
+
+
+def score_matrix_cache(profile_id: Optional[str] = None) -> ScoreMatrixCache:
+    """Shared cache for the default scores or for one profile.
+
+    Entries are never evicted, so callers pass only ids of stored profiles.
+    """
+    if profile_id not in _caches:
+        _caches[profile_id] = ScoreMatrixCache(profile_id)
+    return _caches[profile_id]
@@ -0,0 +1,160 @@
+from datetime import timedelta
+from typing import Dict, Iterable, List, Tuple
+
+from sqlalchemy import DateTime, select, update, func, and_, or_, case
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from ..models.evaluation_task import EvaluationTask
+
+# Lease times come from the database clock so workers on different nodes agree
+_db_utcnow = func.timezone("utc", func.now(), type_=DateTime)
+
+
+def complete_tasks_statement(job_ids: List[str]):
+    """UPDATE marking the tasks of the given jobs done.
+
+    Executed by EvaluationWriter in the same transaction that stores the
+    evaluations, so a task is never done without its evaluation.
+    """
+    return (
+        update(EvaluationTask)
+        .where(EvaluationTask.job_id.in_(job_ids))
+        .values(state="done", locked_by=None, lease_expires_at=None, updated_at=_db_utcnow)
+    )
+
+
+class EvaluationTaskQueue:
+    """Postgres-backed queue of job evaluations shared by any number of workers."""
+
+    def __init__(self, lease_seconds: int = settings.queue_lease_seconds):
+        """Initialize queue.
+
+        Args:
+            lease_seconds: How long a claimed task stays reserved for its worker
+        """
+        self.lease = timedelta(seconds=lease_seconds)
+
+    async def enqueue(
+        self,
+        db: AsyncSession,
+        jobs: Iterable[Tuple[str, int]],
+    ) -> int:
+        """Queue evaluations for jobs.
+
+        Already queued jobs keep their task (with the higher of both priorities);
+        finished or failed tasks are reset to pending.
+
+        Args:
+            db: Database session
+            jobs: (job_id, priority) pairs
+
+        Returns:
+            Number of tasks queued or updated
+        """
+        rows = [{"job_id": job_id, "priority": priority} for job_id, priority in jobs]
+        if not rows:
+            return 0
+
+        statement = insert(EvaluationTask).values(rows)
+        finished = EvaluationTask.state.in_(["done", "failed"])
+        statement = statement.on_conflict_do_update(
+            index_elements=[EvaluationTask.job_id],
+            set_={
+                "priority": func.greatest(EvaluationTask.priority, statement.excluded.priority),
+                "state": case((finished, "pending"), else_=EvaluationTask.state),
+                "attempts": case((finished, 0), else_=EvaluationTask.attempts),
+                "updated_at": _db_utcnow,
+            },
+        )
+        await db.execute(statement)
+        await db.commit()
+        return len(rows)
+
+    async def claim(
+        self,
+        db: AsyncSession,
+        worker_id: str,
+        limit: int = 1,
+    ) -> List[EvaluationTask]:
+        """Lease up to `limit` tasks, highest priority first.
+
+        Pending tasks and running tasks whose lease expired are claimable.
+        FOR UPDATE SKIP LOCKED lets concurrent workers claim disjoint tasks
+        without blocking each other.
+
+        Args:
+            db: Database session
+            worker_id: Identifier recorded on the lease
+            limit: Maximum number of tasks to claim
+
+        Returns:
+            Claimed tasks
+        """
+        lease_expired = and_(
+            EvaluationTask.state == "running",
+            EvaluationTask.lease_expires_at < _db_utcnow,
+        )
+
+        # Expired tasks that used up their attempts would otherwise stay "running" forever
+        await db.execute(
+            update(EvaluationTask)
+            .where(lease_expired)
+            .where(EvaluationTask.attempts >= EvaluationTask.max_attempts)
+            .values(state="failed", locked_by=None, lease_expires_at=None, updated_at=_db_utcnow)
+        )
+
+        claimable = (
+            select(EvaluationTask.id)
+            .where(or_(EvaluationTask.state == "pending", lease_expired))
+            .where(EvaluationTask.attempts < EvaluationTask.max_attempts)
+            .order_by(EvaluationTask.priority.desc(), EvaluationTask.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await db.execute(
+            update(EvaluationTask)
+            .where(EvaluationTask.id.in_(claimable.scalar_subquery()))
+            .values(
+                state="running",
+                locked_by=worker_id,
+                lease_expires_at=_db_utcnow + self.lease,
+                attempts=EvaluationTask.attempts + 1,
+                updated_at=_db_utcnow,
+            )
+            .returning(EvaluationTask)
+            .execution_options(synchronize_session=False)
+        )
+        tasks = list(result.scalars().all())
+        await db.commit()
+        return tasks
+
+    async def fail(self, db: AsyncSession, task: EvaluationTask, error: str):
+        """Release a task after a failed attempt.
+
+        The task goes back to pending, or to failed once it used up its attempts.
+        """
+        await db.execute(
+            update(EvaluationTask)
+            .where(EvaluationTask.id == task.id)
+            .values(
+                state=case(
+                    (EvaluationTask.attempts >= EvaluationTask.max_attempts, "failed"),
+                    else_="pending",
+                ),
+                locked_by=None,
+                lease_expires_at=None,
+                last_error=error[:2000],
+                updated_at=_db_utcnow,
+            )
+        )
+        await db.commit()
+
+    async def counts(self, db: AsyncSession) -> Dict[str, int]:
+        """Number of tasks per state."""
+        result = await db.execute(
+            select(EvaluationTask.state, func.count(EvaluationTask.id))
+            .group_by(EvaluationTask.state)
+        )
+        return {state: count for state, count in result.all()}
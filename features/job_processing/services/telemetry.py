@@ -0,0 +1,275 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Set
+
+from sqlalchemy import Date, case, cast, func, literal_column, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.config import settings
+from core.database import AsyncSessionLocal
+from core.llm import ChatCompletionResult
+from ..models.evaluation import JobEvaluation
+from ..models.job import Job
+from ..models.telemetry import EvaluationTelemetry
+from .evaluator import JobEvaluator
+
+TELEMETRY_GROUPS = ("day", "priority", "project_type")
+
+
+class TelemetryWriter:
+    """Buffers per-call LLM telemetry and bulk-inserts it into evaluation_telemetry.
+
+    Attached to an evaluator's on_completion hook, so recording a call is a
+    list append. The hook also reports calls that failed on every attempt;
+    those rows are marked failed. Rows are written as one multi-row INSERT
+    when the buffer reaches batch_size or every flush_interval seconds. A
+    failed write is reported and dropped; telemetry never fails an evaluation.
+
+    Usage:
+        async with TelemetryWriter() as telemetry:
+            evaluator = telemetry.attach(JobEvaluator(client))
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker = AsyncSessionLocal,
+        batch_size: int = settings.telemetry_batch_size,
+        flush_interval: float = settings.telemetry_flush_interval,
+    ):
+        """Initialize writer.
+
+        Args:
+            session_factory: Factory for the short-lived sessions used by flushes
+            batch_size: Buffered rows that trigger a flush
+            flush_interval: Seconds between background flushes
+        """
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.written = 0
+        self.dropped = 0
+
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = asyncio.Lock()
+        self._timer: asyncio.Task | None = None
+        self._flushes: Set[asyncio.Task] = set()
+
+    async def __aenter__(self) -> "TelemetryWriter":
+        return self.start()
+
+    def start(self) -> "TelemetryWriter":
+        """Start the background flush; needs a running event loop."""
+        if self._timer is None:
+            self._timer = asyncio.create_task(self._flush_periodically())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Stop the background flush and write what is left."""
+        if self._timer:
+            self._timer.cancel()
+            try:
+                await self._timer
+            except asyncio.CancelledError:
+                pass
+            self._timer = None
+        if self._flushes:
+            await asyncio.gather(*self._flushes)
+        await self.flush()
+
+    def attach(self, evaluator: JobEvaluator) -> JobEvaluator:
+        """Record every LLM call the evaluator makes, keeping any existing hook."""
+        previous = evaluator.on_completion
+
+        def on_completion(job_id: str, result: ChatCompletionResult):
+            self.record(evaluator, job_id, result)
+            if previous:
+                previous(job_id, result)
+
+        evaluator.on_completion = on_completion
+        return evaluator
+
+    def record(self, evaluator: JobEvaluator, job_id: str, result: ChatCompletionResult):
+        """Buffer one call; schedules a flush when the batch is full."""
+        self._buffer.append({
+            "job_id": job_id,
+            "evaluation_version": evaluator.version,
+            "prompt_variant": evaluator.prompt_variant,
+            "model": result.model or evaluator.client.model,
+            "backend": result.backend or "unknown",
+            "prompt_tokens": result.prompt_tokens,
+            "completion_tokens": result.completion_tokens,
+            "latency": result.latency,
+            "queue_wait": result.queue_wait,
+            "attempts": result.attempts,
+            "parse_failures": result.parse_failures,
+            "cost_usd": result.cost_usd,
+            "failed": result.response is None,
+            "created_at": datetime.utcnow(),
+        })
+        if len(self._buffer) >= self.batch_size:
+            task = asyncio.create_task(self.flush())
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _flush_periodically(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await asyncio.shield(self.flush())
+
+    async def flush(self) -> int:
+        """Write all buffered rows.
+
+        Returns:
+            Number of rows written
+        """
+        async with self._lock:
+            rows, self._buffer = self._buffer, []
+            if not rows:
+                return 0
+            try:
+                async with self.session_factory() as db:
+                    await db.execute(insert(EvaluationTelemetry).values(rows))
+                    await db.commit()
+            except Exception as e:
+                self.dropped += len(rows)
+                print(f"  → Dropped {len(rows)} telemetry rows: {e}")
+                return 0
+            self.written += len(rows)
+            return len(rows)
+
+
+def _group_column(group_by: str):
+    # Literal constants: with bound parameters Postgres cannot match the
+    # SELECT expression to the identical GROUP BY expression
+    if group_by == "day":
+        return cast(func.date_trunc(literal_column("'day'"), EvaluationTelemetry.created_at), Date)
+    if group_by == "priority":
+        return func.coalesce(JobEvaluation.priority, literal_column("'unevaluated'"))
+    if group_by == "project_type":
+        return func.coalesce(
+            func.nullif(JobEvaluation.project_type, literal_column("''")), literal_column("'none'")
+        )
+    raise ValueError(f"group_by must be one of {', '.join(TELEMETRY_GROUPS)}, got {group_by!r}")
+
+
+def _window(days: int):
+    return (
+        EvaluationTelemetry.created_at >= datetime.utcnow() - timedelta(days=days)
+    )
+
+
+async def cost_summary(db: AsyncSession, group_by: str, days: int) -> List[Dict[str, Any]]:
+    """Token usage and cost per group over the last `days` days.
+
+    Priority and project type come from each job's current evaluation.
+    """
+    group = _group_column(group_by).label("group")
+    evaluations = func.count(func.distinct(EvaluationTelemetry.job_id))
+    cost = func.sum(EvaluationTelemetry.cost_usd)
+    result = await db.execute(
+        select(
+            group,
+            evaluations,
+            func.count(EvaluationTelemetry.id),
+            func.sum(EvaluationTelemetry.prompt_tokens),
+            func.sum(EvaluationTelemetry.completion_tokens),
+            cost,
+        )
+        .select_from(EvaluationTelemetry)
+        .outerjoin(JobEvaluation, JobEvaluation.job_id == EvaluationTelemetry.job_id)
+        .where(_window(days))
+        .group_by(group)
+        .order_by(group)
+    )
+    return [
+        {
+            group_by: str(key),
+            "jobs": jobs,
+            "calls": calls,
+            "prompt_tokens": int(prompt_tokens or 0),
+            "completion_tokens": int(completion_tokens or 0),
+            "cost_usd": round(total_cost or 0.0, 6),
+            "cost_per_job_usd": round((total_cost or 0.0) / jobs, 6) if jobs else 0.0,
+        }
+        for key, jobs, calls, prompt_tokens, completion_tokens, total_cost in result.all()
+    ]
+
+
+async def latency_summary(db: AsyncSession, group_by: str, days: int) -> List[Dict[str, Any]]:
+    """Per-call latency and queue-wait percentiles per group over the last `days` days."""
+    group = _group_column(group_by).label("group")
+
+    def percentile(column, fraction: float):
+        return func.percentile_cont(fraction).within_group(column.asc())
+
+    latency = EvaluationTelemetry.latency
+    queue_wait = EvaluationTelemetry.queue_wait
+    result = await db.execute(
+        select(
+            group,
+            func.count(EvaluationTelemetry.id),
+            percentile(latency, 0.5),
+            percentile(latency, 0.9),
+            percentile(latency, 0.99),
+            percentile(queue_wait, 0.5),
+            percentile(queue_wait, 0.9),
+            func.avg(case((EvaluationTelemetry.attempts > 1, 1.0), else_=0.0)),
+            func.avg(case((EvaluationTelemetry.failed, 1.0), else_=0.0)),
+        )
+        .select_from(EvaluationTelemetry)
+        .outerjoin(JobEvaluation, JobEvaluation.job_id == EvaluationTelemetry.job_id)
+        .where(_window(days))
+        .group_by(group)
+        .order_by(group)
+    )
+    return [
+        {
+            group_by: str(key),
+            "calls": calls,
+            "latency_p50": round(p50, 3),
+            "latency_p90": round(p90, 3),
+            "latency_p99": round(p99, 3),
+            "queue_wait_p50": round(wait_p50, 3),
+            "queue_wait_p90": round(wait_p90, 3),
+            "retry_rate": round(retry_rate or 0.0, 4),
+            "failure_rate": round(failure_rate or 0.0, 4),
+        }
+        for key, calls, p50, p90, p99, wait_p50, wait_p90, retry_rate, failure_rate in result.all()
+    ]
+
+
+async def slowest_jobs(db: AsyncSession, days: int, limit: int) -> List[Dict[str, Any]]:
+    """Jobs with the highest total LLM time over the last `days` days."""
+    total_latency = func.sum(EvaluationTelemetry.latency).label("total_latency")
+    result = await db.execute(
+        select(
+            EvaluationTelemetry.job_id,
+            Job.title,
+            total_latency,
+            func.count(EvaluationTelemetry.id),
+            func.max(EvaluationTelemetry.attempts),
+            func.sum(EvaluationTelemetry.cost_usd),
+        )
+        .select_from(EvaluationTelemetry)
+        .outerjoin(Job, Job.id == EvaluationTelemetry.job_id)
+        .where(_window(days))
+        .group_by(EvaluationTelemetry.job_id, Job.title)
+        .order_by(total_latency.desc())
+        .limit(limit)
+    )
+    return [
+        {
+            "job_id": job_id,
+            "title": title,
+            "total_latency": round(latency, 3),
+            "calls": calls,
+            "max_attempts": max_attempts,
+            "cost_usd": round(cost or 0.0, 6),
+        }
+        for job_id, title, latency, calls, max_attempts, cost in result.all()
+    ]
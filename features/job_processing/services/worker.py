@@ -0,0 +1,96 @@
+import asyncio
+import os
+import socket
+from typing import Dict, Optional
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from core.config import settings
+from core.database import AsyncSessionLocal
+from ..models.job import Job
+from .evaluator import JobEvaluator
+from .evaluation_writer import EvaluationWriter, uncount_failed_writes
+from .task_queue import EvaluationTaskQueue
+
+
+class EvaluationWorker:
+    """Drains the evaluation_tasks queue with N concurrent evaluators.
+
+    Each evaluator slot claims one task at a time in its own short-lived session,
+    evaluates the job and hands the result to a shared EvaluationWriter, which
+    stores the evaluation and marks the task done in one transaction. Run as many
+    workers on as many nodes as needed; SKIP LOCKED keeps their claims disjoint.
+    """
+
+    def __init__(
+        self,
+        evaluator: JobEvaluator,
+        queue: EvaluationTaskQueue,
+        concurrency: int = settings.worker_concurrency,
+        worker_id: Optional[str] = None,
+        poll_interval: float = settings.queue_poll_interval,
+        session_factory: async_sessionmaker = AsyncSessionLocal,
+    ):
+        """Initialize worker.
+
+        Args:
+            evaluator: Evaluator used for every task
+            queue: Task queue to drain
+            concurrency: Number of concurrent evaluator slots
+            worker_id: Lease owner name (defaults to host:pid)
+            poll_interval: Seconds to wait when the queue is empty
+            session_factory: Factory for per-task sessions
+        """
+        self.evaluator = evaluator
+        self.queue = queue
+        self.concurrency = concurrency
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.poll_interval = poll_interval
+        self.session_factory = session_factory
+
+        self.results = {"evaluated": 0, "ai_related": 0, "not_ai_related": 0, "errors": 0}
+
+    async def run(self, drain: bool = False) -> Dict[str, int]:
+        """Process tasks until cancelled, or until the queue is empty if `drain`.
+
+        Returns:
+            Counters for this worker
+        """
+        async with EvaluationWriter(
+            session_factory=self.session_factory, complete_tasks=True
+        ) as writer:
+            await asyncio.gather(
+                *(self._run_slot(writer, drain) for _ in range(self.concurrency))
+            )
+
+        uncount_failed_writes(self.results, writer)
+        return self.results
+
+    async def _run_slot(self, writer: EvaluationWriter, drain: bool):
+        while True:
+            async with self.session_factory() as db:
+                tasks = await self.queue.claim(db, self.worker_id)
+                job = await db.get(Job, tasks[0].job_id) if tasks else None
+
+            if not tasks:
+                if drain:
+                    return
+                await asyncio.sleep(self.poll_interval)
+                continue
+
+            task = tasks[0]
+            try:
+                evaluation = await self.evaluator.evaluate(job)
+                await writer.add(evaluation)
+
+                self.results["evaluated"] += 1
+                if evaluation.is_ai_related:
+                    self.results["ai_related"] += 1
+                else:
+                    self.results["not_ai_related"] += 1
+                print(f"[{self.worker_id}] {job.title[:50]} → {evaluation.score_total}/100")
+            except Exception as e:
+                self.results["errors"] += 1
+                print(f"[{self.worker_id}] Task {task.id} ({task.job_id}) failed: {e}")
+                async with self.session_factory() as db:
+                    await self.queue.fail(db, task, f"{type(e).__name__}: {e}")
@@ -0,0 +1,121 @@
+import traceback
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .tech_extractor import extract_tech
+from .url_parser import extract_urls, calculate_job_age
+
+# Upwork fixed-price duration ids -> weeks
+_DURATION_WEEKS = {
+    1: 52.0,
+    2: 18.0,
+    3: 9.0,
+    4: 3.0,
+}
+
+
+def parse_timestamp(ts: str | None) -> datetime | None:
+    """Parse an ISO timestamp from the export into a naive UTC datetime."""
+    if ts is None:
+        return None
+
+    try:
+        dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+        return dt.replace(tzinfo=None)
+    except (ValueError, AttributeError):
+        return None
+
+
+def normalize_job(job_data: Dict[str, Any], reference_time: Optional[datetime] = None) -> Dict[str, Any]:
+    """Normalize one Apify job object into Job column values.
+
+    Plain data in and out (no ORM objects), so it can run in worker processes.
+
+    Args:
+        job_data: One job object from an Apify export
+        reference_time: "Now" for the job age; defaults to the current time
+
+    Returns:
+        Keyword arguments for Job
+
+    Raises:
+        KeyError: id, title or url is missing
+    """
+    budget_amount = None
+    duration_weeks = None
+
+    if "fixed" in job_data and job_data["fixed"]:
+        fixed = job_data["fixed"]
+        if "budget" in fixed and fixed["budget"]:
+            budget_amount = float(fixed["budget"]["amount"])
+        if "duration" in fixed and fixed["duration"]:
+            duration_weeks = _DURATION_WEEKS.get(fixed["duration"].get("rid"))
+
+    hourly = job_data.get("hourly") or {}
+    hourly_min = float(hourly["min"]) if hourly.get("min") is not None else None
+    hourly_max = float(hourly["max"]) if hourly.get("max") is not None else None
+
+    ts_publish = parse_timestamp(job_data.get("ts_publish"))
+    scraped_at = parse_timestamp(job_data.get("scraped_at"))
+
+    # Calculate job age
+    description = job_data.get("description", "")
+    job_age_hours, job_age_str = (
+        calculate_job_age(ts_publish, reference_time) if ts_publish else (0, "")
+    )
+
+    # Extract URLs and technologies from the text
+    urls = extract_urls(description)
+    detected_tech, detected_expertise_ids = extract_tech(f"{job_data['title']}\n{description}")
+
+    return dict(
+        id=job_data["id"],
+        title=job_data["title"],
+        ts_publish=ts_publish,
+        description=description,
+        type=job_data.get("type", "FIXED"),
+        url=job_data["url"],
+        fixed_budget_amount=budget_amount,
+        fixed_duration_weeks=duration_weeks,
+        hourly_min=hourly_min,
+        hourly_max=hourly_max,
+        job_age_hours=job_age_hours,
+        job_age_string=job_age_str,
+        applicant_count=job_data.get("applicant_count", 0),
+        interviewing_count=job_data.get("interviewing_count", 0),
+        invite_only=job_data.get("invite_only", False),
+        client_payment_verified=job_data.get("payment_verified", False),
+        client_rating=job_data.get("client_rating"),
+        client_jobs_posted=job_data.get("client_jobs_posted", 0),
+        client_hire_rate=job_data.get("client_hire_rate"),
+        client_total_paid=job_data.get("client_total_paid"),
+        client_hires=job_data.get("client_hires", 0),
+        client_reviews=job_data.get("client_reviews", 0),
+        experience_level=job_data.get("experience_level"),
+        project_length=job_data.get("project_length"),
+        proposal_required=job_data.get("proposal_required", False),
+        client_response_time=job_data.get("client_response_time"),
+        description_urls=urls,
+        detected_tech=detected_tech,
+        detected_expertise_ids=detected_expertise_ids,
+        source="apify",
+        scraped_at=scraped_at,
+    )
+
+
+def normalize_records(
+    records: List[Dict[str, Any]], reference_time: Optional[datetime] = None
+) -> List[Optional[Dict[str, Any]]]:
+    """normalize_job over a chunk of records; None (with a traceback) for records that fail.
+
+    Entry point for parse worker processes: one call per chunk keeps pickling
+    and scheduling overhead per job low.
+    """
+    rows = []
+    for job_data in records:
+        try:
+            rows.append(normalize_job(job_data, reference_time))
+        except Exception:
+            traceback.print_exc()
+            rows.append(None)
+    return rows
@@ -0,0 +1,56 @@
+import math
+
+from ..models.job import Job
+
+# Share of the 0-100 expected value each signal can contribute
+VALUE_WEIGHTS = {
+    "budget": 40.0,
+    "client": 20.0,
+    "freshness": 25.0,
+    "competition": 15.0,
+}
+
+# Budget signal when a job states no budget at all
+UNKNOWN_BUDGET = 0.25
+
+
+def _log_scale(value: float, low: float, high: float) -> float:
+    """Map value onto 0-1 logarithmically between low and high (clamped)."""
+    if value <= low:
+        return 0.0
+    return min(1.0, math.log(value / low) / math.log(high / low))
+
+
+def expected_value(job: Job) -> float:
+    """Cheap 0-100 estimate of how worthwhile a job is, from parsed fields only.
+
+    Used to order LLM evaluations so promising jobs are scored first; it is not
+    a substitute for the evaluation itself.
+
+    Args:
+        job: Parsed (not necessarily persisted) job
+
+    Returns:
+        Expected value, higher is better
+    """
+    if job.fixed_budget_amount:
+        budget = _log_scale(float(job.fixed_budget_amount), 100, 10_000)
+    elif job.hourly_min or job.hourly_max:
+        rate = float(job.hourly_max or job.hourly_min)
+        budget = min(1.0, max(0.0, (rate - 15) / (100 - 15)))
+    else:
+        budget = UNKNOWN_BUDGET
+
+    client = _log_scale(float(job.client_total_paid or 0), 100, 100_000)
+    if job.client_payment_verified:
+        client = 0.8 * client + 0.2
+
+    freshness = math.exp(-(job.job_age_hours or 0) / 48)
+    competition = 1.0 / (1.0 + (job.applicant_count or 0) / 10)
+
+    return (
+        VALUE_WEIGHTS["budget"] * budget
+        + VALUE_WEIGHTS["client"] * client
+        + VALUE_WEIGHTS["freshness"] * freshness
+        + VALUE_WEIGHTS["competition"] * competition
+    )
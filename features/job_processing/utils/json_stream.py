@@ -0,0 +1,167 @@
+import gzip
+import io
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator
+
+import orjson
+import zstandard
+
+# A whole string literal (group 1 is the closing quote, missing if the string
+# continues past the buffer) or a byte that changes nesting
+_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*(")?|[\[\]{},]', re.S)
+_WHITESPACE = b" \t\r\n"
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_NDJSON_SUFFIXES = {".jsonl", ".ndjson"}
+_COMPRESSED_SUFFIXES = (".gz", ".zst", ".zstd")
+
+# Export file names ingestion accepts (JSON array or NDJSON, optionally compressed)
+EXPORT_PATTERNS = tuple(
+    f"*{suffix}{compression}"
+    for suffix in (".json", ".jsonl", ".ndjson")
+    for compression in ("",) + _COMPRESSED_SUFFIXES
+)
+
+
+def iter_json_array(f: BinaryIO, chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """Yield the elements of a top-level JSON array one at a time.
+
+    Only the element being read and one chunk are held in memory, so memory
+    stays flat however large the file is. Element boundaries are found with a
+    regex that skips string literals in one step; each element is then decoded
+    with orjson.
+
+    Args:
+        f: Binary file positioned at the start of the array
+        chunk_size: Bytes read per call to f.read
+
+    Yields:
+        Decoded array elements
+
+    Raises:
+        ValueError: The input is not a JSON array or is truncated
+    """
+    buffer = b""
+    pos = 0  # Scan position in buffer
+    start = None  # Start of the current element in buffer
+    depth = 0  # Nesting inside the current element
+    opened = False
+    need_more = True
+
+    while True:
+        if need_more:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                raise ValueError("Truncated JSON array" if opened else "Expected a JSON array")
+            # Keep only the unfinished element
+            keep = pos if start is None else start
+            buffer = buffer[keep:] + chunk
+            pos -= keep
+            if start is not None:
+                start = 0
+            need_more = False
+
+        if start is None:
+            # Between elements: skip whitespace and separators
+            stripped = buffer[pos:].lstrip(_WHITESPACE)
+            pos = len(buffer) - len(stripped)
+            if not stripped:
+                need_more = True
+                continue
+            first = stripped[:1]
+            if not opened:
+                if first != b"[":
+                    raise ValueError("Expected a JSON array")
+                opened = True
+                pos += 1
+                continue
+            if first == b"]":
+                return
+            if first == b",":
+                pos += 1
+                continue
+            start = pos
+
+        match = _TOKEN.search(buffer, pos)
+        if match is None:
+            pos = len(buffer)
+            need_more = True
+            continue
+        token = match.group()
+
+        if token[:1] == b'"':
+            if match.group(1) is None:
+                # String runs past the buffer: rescan it once more data is in
+                pos = match.start()
+                need_more = True
+                continue
+            pos = match.end()
+        elif token in b"[{":
+            pos = match.end()
+            depth += 1
+        elif token in b"]}" and depth > 0:
+            pos = match.end()
+            depth -= 1
+            if depth == 0:
+                yield orjson.loads(buffer[start:pos])
+                start = None
+        elif depth == 0:
+            # "," or "]" after a scalar element
+            yield orjson.loads(buffer[start:match.start()])
+            start = None
+            pos = match.start()
+        else:
+            pos = match.end()
+
+
+def iter_ndjson(f: BinaryIO) -> Iterator[Any]:
+    """Yield the values of a newline-delimited JSON stream, skipping blank lines.
+
+    Raises:
+        ValueError: A line is not valid JSON
+    """
+    for number, line in enumerate(f, 1):
+        if line.strip():
+            try:
+                yield orjson.loads(line)
+            except orjson.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON on line {number}: {e}") from None
+
+
+@contextmanager
+def open_export(file_path: Path) -> Iterator[Iterator[Any]]:
+    """Open an export file and yield an iterator over its records.
+
+    gzip and zstd compression are detected by magic bytes and decompressed
+    while streaming. NDJSON is detected by a .jsonl/.ndjson suffix (before any
+    compression suffix) or, failing that, by a first value that is not an
+    array. Memory stays flat for every combination.
+
+    Usage:
+        with open_export(path) as records:
+            for record in records:
+                ...
+    """
+    path = Path(file_path)
+    raw = open(path, "rb")
+    try:
+        magic = raw.read(4)
+        raw.seek(0)
+        if magic.startswith(_GZIP_MAGIC):
+            f = gzip.GzipFile(fileobj=raw)
+        elif magic == _ZSTD_MAGIC:
+            f = io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(raw, closefd=True))
+        else:
+            f = raw
+        with f:
+            suffixes = [s for s in path.suffixes if s not in _COMPRESSED_SUFFIXES]
+            if suffixes and suffixes[-1] in _NDJSON_SUFFIXES:
+                ndjson = True
+            else:
+                ndjson = f.peek(1 << 12).lstrip(_WHITESPACE)[:1] not in (b"[", b"")
+            yield iter_ndjson(f) if ndjson else iter_json_array(f)
+    finally:
+        raw.close()
@@ -0,0 +1,54 @@
+from typing import Mapping, Optional
+
+import numpy as np
+
+from ..schemas.evaluation import PRIORITY_THRESHOLDS, SCORE_WEIGHTS
+
+# Column order of score matrices
+SCORE_COMPONENTS = tuple(SCORE_WEIGHTS)
+
+
+def resolve_weights(overrides: Mapping[str, Optional[float]]) -> np.ndarray:
+    """Merge per-request weight overrides into the default weights.
+
+    Missing or None entries keep their default. The result is normalised to sum
+    to 1 so totals stay on the 0-100 scale of stored scores.
+
+    Args:
+        overrides: Component name → weight
+
+    Returns:
+        Weight vector in SCORE_COMPONENTS order
+    """
+    unknown = set(overrides) - set(SCORE_COMPONENTS)
+    if unknown:
+        raise ValueError(f"Unknown score components: {', '.join(sorted(unknown))}")
+
+    weights = np.array([
+        SCORE_WEIGHTS[c] if overrides.get(c) is None else overrides[c]
+        for c in SCORE_COMPONENTS
+    ], dtype=np.float64)
+    if (weights < 0).any() or weights.sum() <= 0:
+        raise ValueError("Weights must be non-negative and not all zero")
+    return weights / weights.sum()
+
+
+def weighted_totals(scores: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Recompute score_total for every row of a (jobs × components) 0-10 score matrix."""
+    return np.rint(scores @ weights * 10).astype(np.int64)
+
+
+def priorities(totals: np.ndarray) -> np.ndarray:
+    """Derive priority labels from totals using PRIORITY_THRESHOLDS."""
+    labels = np.full(len(totals), "Low", dtype=object)
+    for label, minimum in reversed(PRIORITY_THRESHOLDS):
+        labels[totals >= minimum] = label
+    return labels
+
+
+def top_k(totals: np.ndarray, mask: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest totals among rows where mask is True, best first."""
+    candidates = np.flatnonzero(mask)
+    if len(candidates) > k:
+        candidates = candidates[np.argpartition(-totals[candidates], k - 1)[:k]]
+    return candidates[np.argsort(-totals[candidates], kind="stable")]
@@ -0,0 +1,150 @@
+import hashlib
+import re
+from typing import Dict, List, Tuple
+
+import orjson
+
+# Canonical tag -> (aliases, expertise area ids). Aliases match case-insensitively
+# on word boundaries; ids refer to the expertise areas of the evaluation prompt:
+# 1 agents, 2 RAG, 3 local AI, 4 backend, 5 frontend, 6 devops, 7 voice, 8 testing
+TECH_DICTIONARY: Dict[str, Tuple[Tuple[str, ...], Tuple[int, ...]]] = {
+    # AI agents
+    "AI agents": (("ai agent", "ai agents", "autonomous agent", "autonomous agents", "agentic"), (1,)),
+    "Multi-agent": (("multi-agent", "multi agent", "multiagent"), (1,)),
+    "LangChain": (("langchain",), (1,)),
+    "LangGraph": (("langgraph",), (1,)),
+    "CrewAI": (("crewai", "crew ai"), (1,)),
+    "AutoGen": (("autogen",), (1,)),
+    "OpenAI Assistants": (("assistants api", "openai assistants"), (1,)),
+    "MCP": (("model context protocol", "mcp server"), (1,)),
+    # RAG
+    "RAG": (("rag", "retrieval augmented generation", "retrieval-augmented generation"), (2,)),
+    "Embeddings": (("embedding", "embeddings"), (2,)),
+    "Semantic search": (("semantic search", "vector search"), (2,)),
+    "Vector database": (("vector database", "vector db", "vector store"), (2,)),
+    "LlamaIndex": (("llamaindex", "llama index", "llama-index"), (2,)),
+    "Pinecone": (("pinecone",), (2,)),
+    "Weaviate": (("weaviate",), (2,)),
+    "Qdrant": (("qdrant",), (2,)),
+    "Chroma": (("chromadb", "chroma db"), (2,)),
+    "FAISS": (("faiss",), (2,)),
+    "Milvus": (("milvus",), (2,)),
+    "pgvector": (("pgvector", "pg_vector"), (2, 4)),
+    # Local AI
+    "Local LLM": (("local llm", "local llms", "self-hosted llm", "on-prem llm"), (3,)),
+    "Self-hosted": (("self-hosted", "self hosted", "on-premise", "on-premises", "on-prem"), (3,)),
+    "Ollama": (("ollama",), (3,)),
+    "LM Studio": (("lm studio", "lmstudio"), (3,)),
+    "llama.cpp": (("llama.cpp", "llamacpp", "llama-cpp"), (3,)),
+    "vLLM": (("vllm",), (3,)),
+    "Hugging Face": (("hugging face", "huggingface"), (3,)),
+    # Backend
+    "Python": (("python",), (4,)),
+    "FastAPI": (("fastapi", "fast api"), (4,)),
+    "Django": (("django",), (4,)),
+    "Flask": (("flask",), (4,)),
+    "PostgreSQL": (("postgresql", "postgres", "psql"), (4,)),
+    "REST API": (("rest api", "restful api", "rest apis", "restful"), (4,)),
+    "Node.js": (("node.js", "nodejs", "node js"), (4,)),
+    "Supabase": (("supabase",), (4,)),
+    "MongoDB": (("mongodb", "mongo"), (4,)),
+    "Redis": (("redis",), (4,)),
+    # Frontend
+    "React": (("react", "react.js", "reactjs"), (5,)),
+    "TypeScript": (("typescript",), (5,)),
+    "Next.js": (("next.js", "nextjs"), (5,)),
+    "Vue": (("vue", "vue.js", "vuejs"), (5,)),
+    "Tailwind CSS": (("tailwind", "tailwindcss"), (5,)),
+    "JavaScript": (("javascript",), (5,)),
+    # DevOps
+    "Docker": (("docker", "dockerfile", "docker-compose", "docker compose"), (6,)),
+    "Kubernetes": (("kubernetes", "k8s"), (6,)),
+    "CI/CD": (("ci/cd", "cicd", "github actions", "gitlab ci"), (6, 8)),
+    "AWS": (("aws", "amazon web services", "lambda", "ec2"), (6,)),
+    "GCP": (("gcp", "google cloud"), (6,)),
+    "Azure": (("azure",), (6,)),
+    "Terraform": (("terraform",), (6,)),
+    # Voice
+    "Voice AI": (("voice ai", "voice agent", "voice assistant", "voice bot", "voicebot"), (7,)),
+    "Speech-to-text": (("speech-to-text", "speech to text", "stt", "transcription"), (7,)),
+    "Text-to-speech": (("text-to-speech", "text to speech", "tts"), (7,)),
+    "WebRTC": (("webrtc",), (7,)),
+    "Deepgram": (("deepgram",), (7,)),
+    "Whisper": (("whisper",), (7,)),
+    "ElevenLabs": (("elevenlabs", "eleven labs"), (7,)),
+    "Twilio": (("twilio",), (7,)),
+    "LiveKit": (("livekit",), (7,)),
+    "Vapi": (("vapi",), (7,)),
+    # Testing
+    "pytest": (("pytest",), (8,)),
+    "TDD": (("tdd", "test-driven", "test driven development"), (8,)),
+    "Playwright": (("playwright",), (8,)),
+    "Unit testing": (("unit test", "unit tests", "unit testing"), (8,)),
+    # Models and providers (no expertise area of their own)
+    "OpenAI": (("openai", "gpt-4", "gpt-4o", "gpt-5", "chatgpt"), ()),
+    "Claude": (("claude", "anthropic"), ()),
+    "Gemini": (("gemini",), ()),
+    "Llama": (("llama 3", "llama3", "llama 2", "llama2"), ()),
+    "Mistral": (("mistral", "mixtral"), ()),
+}
+
+# Changes whenever an alias or expertise mapping does; part of the evaluation version,
+# since detections are sent to the LLM
+DICTIONARY_VERSION = hashlib.sha256(
+    orjson.dumps(TECH_DICTIONARY, option=orjson.OPT_SORT_KEYS)
+).hexdigest()[:12]
+
+_ALIASES: Dict[str, str] = {
+    alias: canonical
+    for canonical, (aliases, _) in TECH_DICTIONARY.items()
+    for alias in aliases
+}
+
+
+def _trie_pattern(words: List[str]) -> str:
+    """Regex matching any of `words`, nested by shared prefix.
+
+    Python's re tries every branch of a flat alternation at each position; a
+    prefix trie rejects most positions after one character.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        ends = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Longest match first: optional suffixes are greedy
+        return f"(?:{body})?" if ends else body
+
+    return build(trie)
+
+
+# Boundaries treat + # . - as part of a term, so "node.js" or "c++" are not split
+_MATCHER = re.compile(
+    r"(?<![\w+#.-])(" + _trie_pattern(list(_ALIASES)) + r")(?![\w+#-]|\.\w)",
+    re.IGNORECASE,
+)
+
+
+def extract_tech(text: str) -> Tuple[List[str], List[int]]:
+    """Find known technologies in a job text.
+
+    Args:
+        text: Job title and description
+
+    Returns:
+        (canonical tags in order of first mention, sorted expertise area ids)
+    """
+    tags: Dict[str, None] = {}
+    for match in _MATCHER.finditer(text):
+        tags.setdefault(_ALIASES[match.group(1).lower()])
+
+    expertise_ids = sorted({i for tag in tags for i in TECH_DICTIONARY[tag][1]})
+    return list(tags), expertise_ids
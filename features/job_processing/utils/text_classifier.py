@@ -0,0 +1,199 @@
+import re
+import zlib
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.\-]*")
+
+# Sparse document matrix in CSR form: (indptr, indices, values)
+SparseRows = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def hashed_ngrams(text: str, n_features: int) -> np.ndarray:
+    """Hash the unigrams and bigrams of a text into feature indices.
+
+    Args:
+        text: Raw text
+        n_features: Size of the hashed feature space (power of two)
+
+    Returns:
+        Sorted unique feature indices present in the text
+    """
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    grams = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    mask = n_features - 1
+    return np.unique(
+        np.fromiter((zlib.crc32(g.encode()) & mask for g in grams), dtype=np.int64, count=len(grams))
+    )
+
+
+def vectorize(texts: Sequence[str], n_features: int) -> SparseRows:
+    """Turn texts into L2-normalised binary hashed n-gram rows.
+
+    Args:
+        texts: Documents to vectorize
+        n_features: Size of the hashed feature space
+
+    Returns:
+        CSR (indptr, indices, values) arrays
+    """
+    rows = [hashed_ngrams(text, n_features) for text in texts]
+    indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum([len(r) for r in rows])
+    indices = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+    lengths = np.diff(indptr)
+    values = np.repeat(1.0 / np.sqrt(np.maximum(lengths, 1)), lengths)
+    return indptr, indices, values
+
+
+class HashedLogisticRegression:
+    """Logistic regression over hashed n-gram features, implemented with NumPy only.
+
+    Trained with full-batch gradient descent and L2 regularisation on sparse rows,
+    so memory stays proportional to the number of non-zero features.
+    """
+
+    def __init__(self, n_features: int = 2 ** 18, l2: float = 1e-4):
+        """Initialize an untrained model.
+
+        Args:
+            n_features: Size of the hashed feature space (power of two)
+            l2: L2 regularisation strength
+        """
+        if n_features & (n_features - 1):
+            raise ValueError("n_features must be a power of two")
+        self.n_features = n_features
+        self.l2 = l2
+        self.weights = np.zeros(n_features, dtype=np.float64)
+        self.bias = 0.0
+
+    def _margins(self, rows: SparseRows) -> np.ndarray:
+        indptr, indices, values = rows
+        n_rows = len(indptr) - 1
+        row_ids = np.repeat(np.arange(n_rows), np.diff(indptr))
+        return np.bincount(row_ids, weights=self.weights[indices] * values, minlength=n_rows) + self.bias
+
+    def fit(
+        self,
+        texts: Sequence[str],
+        labels: Sequence[int],
+        epochs: int = 300,
+        learning_rate: float = 2.0,
+    ) -> "HashedLogisticRegression":
+        """Fit the model.
+
+        Args:
+            texts: Training documents
+            labels: 1 for positive (AI-related), 0 for negative
+            epochs: Gradient descent iterations
+            learning_rate: Step size
+
+        Returns:
+            self
+        """
+        rows = vectorize(texts, self.n_features)
+        indptr, indices, values = rows
+        y = np.asarray(labels, dtype=np.float64)
+        n_rows = len(y)
+        row_ids = np.repeat(np.arange(n_rows), np.diff(indptr))
+
+        for _ in range(epochs):
+            residual = _sigmoid(self._margins(rows)) - y
+            gradient = np.bincount(
+                indices, weights=values * residual[row_ids], minlength=self.n_features
+            ) / n_rows
+            self.weights -= learning_rate * (gradient + self.l2 * self.weights)
+            self.bias -= learning_rate * residual.mean()
+
+        return self
+
+    def predict_proba(self, texts: Sequence[str]) -> np.ndarray:
+        """Probability of the positive class for each text."""
+        return _sigmoid(self._margins(vectorize(texts, self.n_features)))
+
+    def save(self, path: Path, **metadata: float):
+        """Store weights (plus scalar metadata) as a compressed .npz file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            path,
+            weights=self.weights.astype(np.float32),
+            bias=np.float64(self.bias),
+            n_features=np.int64(self.n_features),
+            l2=np.float64(self.l2),
+            **{key: np.float64(value) for key, value in metadata.items()},
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> Tuple["HashedLogisticRegression", Dict[str, float]]:
+        """Load a model saved with save().
+
+        Returns:
+            Model and its scalar metadata
+        """
+        with np.load(Path(path)) as data:
+            model = cls(n_features=int(data["n_features"]), l2=float(data["l2"]))
+            model.weights = data["weights"].astype(np.float64)
+            model.bias = float(data["bias"])
+            metadata = {
+                key: float(data[key])
+                for key in data.files
+                if key not in ("weights", "bias", "n_features", "l2")
+            }
+        return model, metadata
+
+
+def calibration_report(
+    probabilities: np.ndarray,
+    labels: Sequence[int],
+    skip_threshold: float,
+    n_bins: int = 10,
+) -> Dict[str, object]:
+    """Summarise how trustworthy predicted probabilities are.
+
+    Args:
+        probabilities: Predicted probability of the positive class
+        labels: True labels
+        skip_threshold: Texts with probability at or below this would skip the LLM
+        n_bins: Number of reliability bins
+
+    Returns:
+        Accuracy, Brier score, log loss, reliability bins and the effect of the
+        skip threshold (share of LLM calls saved, positives wrongly skipped)
+    """
+    p = np.asarray(probabilities, dtype=np.float64)
+    y = np.asarray(labels, dtype=np.float64)
+    clipped = np.clip(p, 1e-7, 1 - 1e-7)
+
+    bins: List[Dict[str, float]] = []
+    edges = np.linspace(0.0, 1.0, n_bins + 1)
+    bin_ids = np.clip(np.digitize(p, edges[1:-1]), 0, n_bins - 1)
+    for b in range(n_bins):
+        in_bin = bin_ids == b
+        if in_bin.any():
+            bins.append({
+                "range": f"{edges[b]:.1f}-{edges[b + 1]:.1f}",
+                "count": int(in_bin.sum()),
+                "mean_predicted": float(p[in_bin].mean()),
+                "observed_rate": float(y[in_bin].mean()),
+            })
+
+    skipped = p <= skip_threshold
+    positives = max(int(y.sum()), 1)
+    return {
+        "samples": int(len(y)),
+        "accuracy": float(((p >= 0.5) == (y == 1)).mean()) if len(y) else 0.0,
+        "brier_score": float(np.mean((p - y) ** 2)) if len(y) else 0.0,
+        "log_loss": float(-np.mean(y * np.log(clipped) + (1 - y) * np.log(1 - clipped))) if len(y) else 0.0,
+        "reliability": bins,
+        "skip_threshold": skip_threshold,
+        "llm_calls_saved": float(skipped.mean()) if len(y) else 0.0,
+        "positives_skipped": int((skipped & (y == 1)).sum()),
+        "positive_recall_kept": 1.0 - float((skipped & (y == 1)).sum()) / positives,
+    }
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-np.clip(x, -35, 35)))
@@ -37,16 +37,17 @@ def extract_urls(text: str) -> List[str]:
     return urls
 
 
-def calculate_job_age(ts_publish: datetime) -> tuple[int, str]:
+def calculate_job_age(ts_publish: datetime, now: datetime | None = None) -> tuple[int, str]:
     """Calculate job age and return hours and human-readable string.
 
     Args:
         ts_publish: Job publish timestamp
+        now: Reference time (UTC, naive); defaults to the current time
 
     Returns:
         Tuple of (age_in_hours, human_readable_string)
     """
-    now = datetime.utcnow()
+    now = now or datetime.utcnow()
     if isinstance(ts_publish, str):
         ts_publish = datetime.fromisoformat(ts_publish.replace('Z', '+00:00'))
 
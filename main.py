@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 from core.database import AsyncSessionLocal
 from features.job_processing.routes.endpoints import router as job_router
+from features.job_processing.services.on_demand import close_on_demand_evaluator
 from features.workflow.routes.endpoints import router as workflow_router
 
 app = FastAPI(title="Upwork Job Processing API")
@@ -32,7 +33,7 @@ async def startup():
 
 @app.on_event("shutdown")
 async def shutdown():
-    pass
+    await close_on_demand_evaluator()
 
 
 @app.get("/")
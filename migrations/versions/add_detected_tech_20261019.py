@@ -0,0 +1,32 @@
+"""add detected_tech and detected_expertise_ids to jobs
+
+Revision ID: add_detected_tech_20261019
+Revises: add_evaluation_telemetry_20261019
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = 'add_detected_tech_20261019'
+down_revision = 'add_evaluation_telemetry_20261019'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'jobs',
+        sa.Column('detected_tech', postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default='[]')
+    )
+    op.add_column(
+        'jobs',
+        sa.Column('detected_expertise_ids', postgresql.ARRAY(sa.SmallInteger()), nullable=False, server_default='{}')
+    )
+    # Existing rows are tagged by `python cli.py tag-jobs`
+
+
+def downgrade():
+    op.drop_column('jobs', 'detected_expertise_ids')
+    op.drop_column('jobs', 'detected_tech')
@@ -0,0 +1,40 @@
+"""add evaluation_tasks work queue
+
+Revision ID: add_evaluation_tasks_20261019
+Revises: add_evaluation_version_20261019
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'add_evaluation_tasks_20261019'
+down_revision = 'add_evaluation_version_20261019'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'evaluation_tasks',
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.Column('job_id', sa.String(), nullable=False),
+        sa.Column('state', sa.String(20), nullable=False, server_default='pending'),
+        sa.Column('priority', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('max_attempts', sa.Integer(), nullable=False, server_default='3'),
+        sa.Column('locked_by', sa.String(100), nullable=True),
+        sa.Column('lease_expires_at', sa.DateTime(), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE', name='fk_evaluation_task_job_id'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('job_id', name='uq_evaluation_task_job_id')
+    )
+    op.create_index('idx_evaluation_tasks_claim', 'evaluation_tasks', ['state', 'priority', 'id'])
+
+
+def downgrade():
+    op.drop_index('idx_evaluation_tasks_claim', table_name='evaluation_tasks')
+    op.drop_table('evaluation_tasks')
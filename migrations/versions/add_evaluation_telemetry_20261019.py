@@ -0,0 +1,43 @@
+"""add evaluation_telemetry table
+
+Revision ID: add_evaluation_telemetry_20261019
+Revises: add_profiles_20261019
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'add_evaluation_telemetry_20261019'
+down_revision = 'add_profiles_20261019'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'evaluation_telemetry',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('job_id', sa.String(), nullable=False),
+        sa.Column('evaluation_version', sa.String(16), nullable=True),
+        sa.Column('prompt_variant', sa.String(30), nullable=False),
+        sa.Column('model', sa.String(), nullable=False),
+        sa.Column('backend', sa.String(30), nullable=False),
+        sa.Column('prompt_tokens', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('completion_tokens', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('latency', sa.Float(), nullable=False),
+        sa.Column('queue_wait', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('attempts', sa.SmallInteger(), nullable=False, server_default='1'),
+        sa.Column('parse_failures', sa.SmallInteger(), nullable=False, server_default='0'),
+        sa.Column('cost_usd', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_evaluation_telemetry_created_at', 'evaluation_telemetry', ['created_at'])
+    op.create_index('idx_evaluation_telemetry_job_id', 'evaluation_telemetry', ['job_id'])
+
+
+def downgrade():
+    op.drop_index('idx_evaluation_telemetry_job_id', table_name='evaluation_telemetry')
+    op.drop_index('idx_evaluation_telemetry_created_at', table_name='evaluation_telemetry')
+    op.drop_table('evaluation_telemetry')
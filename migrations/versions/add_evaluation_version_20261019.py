@@ -0,0 +1,29 @@
+"""add evaluation_version to job_evaluations
+
+Revision ID: add_evaluation_version_20261019
+Revises: add_session_id_to_workflows
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'add_evaluation_version_20261019'
+down_revision = 'add_session_id_to_workflows'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'job_evaluations',
+        sa.Column('evaluation_version', sa.String(16), nullable=True)
+    )
+    op.create_index(
+        'ix_job_evaluations_evaluation_version', 'job_evaluations', ['evaluation_version']
+    )
+
+
+def downgrade():
+    op.drop_index('ix_job_evaluations_evaluation_version', table_name='job_evaluations')
+    op.drop_column('job_evaluations', 'evaluation_version')
@@ -0,0 +1,39 @@
+"""add ingestion_runs table
+
+Revision ID: add_ingestion_runs_20261019
+Revises: add_detected_tech_20261019
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = 'add_ingestion_runs_20261019'
+down_revision = 'add_detected_tech_20261019'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'ingestion_runs',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('file_path', sa.Text(), nullable=False),
+        sa.Column('file_sha256', sa.String(64), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False, server_default='running'),
+        sa.Column('records_committed', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('counters', postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default='{}'),
+        sa.Column('resumes', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_ingestion_runs_file_sha256', 'ingestion_runs', ['file_sha256', 'id'])
+
+
+def downgrade():
+    op.drop_index('idx_ingestion_runs_file_sha256', table_name='ingestion_runs')
+    op.drop_table('ingestion_runs')
@@ -0,0 +1,23 @@
+"""add metadata_hash to jobs
+
+Revision ID: add_metadata_hash_20261019
+Revises: add_ingestion_runs_20261019
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'add_metadata_hash_20261019'
+down_revision = 'add_ingestion_runs_20261019'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # NULL until a job is next ingested; IS DISTINCT FROM treats it as changed
+    op.add_column('jobs', sa.Column('metadata_hash', sa.String(32), nullable=True))
+
+
+def downgrade():
+    op.drop_column('jobs', 'metadata_hash')
@@ -0,0 +1,71 @@
+"""add freelancer profiles and per-profile evaluations
+
+Revision ID: add_profiles_20261019
+Revises: add_evaluation_tasks_20261019
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = 'add_profiles_20261019'
+down_revision = 'add_evaluation_tasks_20261019'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'profiles',
+        sa.Column('id', sa.String(50), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('role', sa.String(), nullable=False),
+        sa.Column('expertise', postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default='[]'),
+        sa.Column('active', sa.Boolean(), nullable=False, server_default='true'),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    op.create_table(
+        'job_profile_evaluations',
+        sa.Column('job_id', sa.String(), nullable=False),
+        sa.Column('profile_id', sa.String(50), nullable=False),
+        sa.Column('matched_expertise_ids', postgresql.ARRAY(sa.SmallInteger()), nullable=False, server_default='{}'),
+        sa.Column('score_tech_fit', sa.SmallInteger(), nullable=False),
+        sa.Column('reason_tech_fit', sa.Text(), nullable=False),
+        sa.Column('score_total', sa.SmallInteger(), nullable=False),
+        sa.Column('priority', sa.String(), nullable=False),
+        sa.Column('evaluated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('evaluation_version', sa.String(16), nullable=True),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE', name='fk_job_profile_evaluation_job_id'),
+        sa.ForeignKeyConstraint(['profile_id'], ['profiles.id'], ondelete='CASCADE', name='fk_job_profile_evaluation_profile_id'),
+        sa.PrimaryKeyConstraint('job_id', 'profile_id')
+    )
+    op.create_index(
+        'idx_job_profile_evaluations_ranking',
+        'job_profile_evaluations',
+        ['profile_id', 'score_total'],
+    )
+
+    # Seed the profile that was previously hard-coded into the evaluation prompt
+    op.execute("""
+        INSERT INTO profiles (id, name, role, expertise) VALUES
+        ('default', 'Default', 'AI Systems Engineer', '[
+            {"id": 1, "name": "AI Agent Architecture & Design", "level": "Expert", "keywords": ["agent", "autonomous", "multi-agent", "LangChain", "crewAI"]},
+            {"id": 2, "name": "RAG Systems", "level": "Advanced", "keywords": ["RAG", "retrieval", "vector database", "embeddings", "semantic search"]},
+            {"id": 3, "name": "Local AI Infrastructure", "level": "Expert", "keywords": ["local LLM", "ollama", "LM Studio", "self-hosted", "on-premises", "privacy"]},
+            {"id": 4, "name": "Backend Systems", "level": "Expert", "keywords": ["FastAPI", "Python", "PostgreSQL", "pgvector", "REST API", "async"]},
+            {"id": 5, "name": "Frontend Development", "level": "Advanced", "keywords": ["React", "TypeScript", "Next.js", "UI", "web app"]},
+            {"id": 6, "name": "DevOps & Infrastructure", "level": "Expert", "keywords": ["Docker", "deployment", "CI/CD"]},
+            {"id": 7, "name": "Voice & Real-Time AI", "level": "Advanced", "keywords": ["voice", "audio", "Speech-to-Text", "text-to-speech", "WebRTC", "Deepgram"]},
+            {"id": 8, "name": "Testing & Code Quality", "level": "Intermediate-Advanced", "keywords": ["testing", "pytest", "TDD", "code quality", "CI"]}
+        ]'::jsonb)
+    """)
+
+
+def downgrade():
+    op.drop_index('idx_job_profile_evaluations_ranking', table_name='job_profile_evaluations')
+    op.drop_table('job_profile_evaluations')
+    op.drop_table('profiles')
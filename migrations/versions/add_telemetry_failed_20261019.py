@@ -0,0 +1,26 @@
+"""add failed to evaluation_telemetry
+
+Revision ID: add_telemetry_failed_20261019
+Revises: add_metadata_hash_20261019
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'add_telemetry_failed_20261019'
+down_revision = 'add_metadata_hash_20261019'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Calls that failed on every attempt; earlier rows were all successful
+    op.add_column(
+        'evaluation_telemetry',
+        sa.Column('failed', sa.Boolean(), nullable=False, server_default=sa.false()),
+    )
+
+
+def downgrade():
+    op.drop_column('evaluation_telemetry', 'failed')
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+LLM Response Decode Benchmark
+
+Measures CPU time per chat completion response for the legacy decode path
+(json envelope, json.loads of the content, model_validate) and the fast path
+(orjson envelope, cached TypeAdapter.validate_json). Two scenarios:
+
+- decode: the decoder alone, in a tight loop
+- client: OpenAICompatibleClient end to end against an in-process mock server,
+  with many requests in flight at once
+
+Usage:
+    python scripts/bench_decode.py [--responses 20000] [--concurrency 256]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import orjson
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.openai_compatible as openai_compatible
+from core.llm import BackendProfile
+from core.llm_decode import decode_content, decode_envelope
+from features.job_processing.schemas.evaluation import JobEvaluationResponse
+
+
+def sample_body() -> bytes:
+    """A chat completions response shaped like a real job evaluation."""
+    evaluation = {
+        "is_ai_related": True,
+        "tech_stack": ["Python", "FastAPI", "LangChain", "PostgreSQL", "pgvector", "React"],
+        "project_type": "RAG chatbot",
+        "complexity": "Medium",
+        "matched_expertise": [
+            {"expertise_id": 2, "match_reason": "Retrieval over company documents with pgvector"},
+            {"expertise_id": 4, "match_reason": "FastAPI backend with PostgreSQL"},
+            {"expertise_id": 5, "match_reason": "React admin dashboard"},
+        ],
+        "score_budget": 8,
+        "reason_budget": "Fixed $2,500 budget matches a four-week RAG build.",
+        "score_client": 7,
+        "reason_client": "Verified payment, 4.8 rating, $12k spent, 35% hire rate.",
+        "score_clarity": 9,
+        "reason_clarity": "Deliverables, data sources and acceptance criteria are listed.",
+        "score_tech_fit": 10,
+        "reason_tech_fit": "Three expertise areas match explicitly.",
+        "score_timeline": 6,
+        "reason_timeline": "Posted 30 hours ago with 12 applicants.",
+    }
+    return orjson.dumps({
+        "id": "chatcmpl-bench",
+        "object": "chat.completion",
+        "model": "bench-model",
+        "choices": [{
+            "index": 0,
+            "finish_reason": "stop",
+            "message": {"role": "assistant", "content": json.dumps(evaluation)},
+        }],
+        "usage": {"prompt_tokens": 1450, "completion_tokens": 310, "total_tokens": 1760},
+    })
+
+
+def legacy_decode_envelope(body: bytes):
+    data = json.loads(body)
+    return data["choices"][0]["message"]["content"], data.get("usage") or {}
+
+
+def legacy_decode_content(content, response_model):
+    parsed = json.loads(content) if isinstance(content, str) else content
+    return response_model.model_validate(parsed)
+
+
+DECODERS = {
+    "legacy": (legacy_decode_envelope, legacy_decode_content),
+    "fast": (decode_envelope, decode_content),
+}
+
+
+def bench_decode(body: bytes, responses: int) -> dict:
+    results = {}
+    for name, (envelope, content_decoder) in DECODERS.items():
+        started = time.process_time()
+        for _ in range(responses):
+            content, _usage = envelope(body)
+            content_decoder(content, JobEvaluationResponse)
+        results[name] = (time.process_time() - started) / responses
+    return results
+
+
+async def bench_client(body: bytes, responses: int, concurrency: int) -> dict:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+
+    messages = [{"role": "user", "content": "Evaluate this job"}]
+    results = {}
+    for name, (envelope, content_decoder) in DECODERS.items():
+        openai_compatible.decode_envelope = envelope
+        openai_compatible.decode_content = content_decoder
+
+        client = openai_compatible.OpenAICompatibleClient(BackendProfile(
+            name="bench", base_url="http://bench/v1", model="bench-model", concurrency=concurrency,
+        ))
+        client._http_client = httpx.AsyncClient(
+            base_url=client.base_url, transport=httpx.MockTransport(handler)
+        )
+
+        async def call():
+            await client.chat_completion_result(messages, JobEvaluationResponse)
+
+        await asyncio.gather(*(call() for _ in range(concurrency)))  # warm-up
+        started = time.process_time()
+        await asyncio.gather(*(call() for _ in range(responses)))
+        results[name] = (time.process_time() - started) / responses
+        await client.close()
+
+    openai_compatible.decode_envelope = decode_envelope
+    openai_compatible.decode_content = decode_content
+    return results
+
+
+def report(title: str, results: dict):
+    legacy, fast = results["legacy"], results["fast"]
+    print(f"\n{title}")
+    print(f"  legacy: {legacy * 1e6:8.1f} µs CPU/response")
+    print(f"  fast:   {fast * 1e6:8.1f} µs CPU/response  ({legacy / fast:.2f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--responses", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=256)
+    args = parser.parse_args()
+
+    body = sample_body()
+    print(f"Response body: {len(body)} bytes")
+    report("Decode only", bench_decode(body, args.responses))
+    report(
+        f"Client path, {args.concurrency} requests in flight",
+        asyncio.run(bench_client(body, args.responses // 4, args.concurrency)),
+    )
+
+
+if __name__ == "__main__":
+    main()
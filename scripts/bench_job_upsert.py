@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Job Upsert Benchmark
+
+Times storing synthetic jobs with the old per-job loop (get, assign or add,
+commit) against the bulk INSERT ... ON CONFLICT in upsert_jobs. Each size is
+run three times per method: an insert pass into an empty id range, an update
+pass over the same ids with changed applicant counts, and a pass storing the
+same jobs again (skipped as unchanged by the bulk path's metadata_hash). Needs
+DATABASE_URL; bench rows use the "bench-upsert-" id prefix and are deleted
+afterwards.
+
+Usage:
+    python scripts/bench_job_upsert.py [sample.json] [--sizes 1000 10000 100000]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import orjson
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import delete
+
+from core.database import AsyncSessionLocal
+from features.job_processing.models import evaluation  # noqa: F401 (mapper registry)
+from features.job_processing.models.job import Job
+from features.job_processing.services.ingestion import JobIngestionService
+from features.job_processing.services.job_upsert import JOB_METADATA_COLUMNS, upsert_jobs
+
+DEFAULT_SAMPLE = Path(__file__).parent.parent / "jobs_dataset_upwork_2026-02-05_04-09-24-623.json"
+ID_PREFIX = "bench-upsert-"
+
+
+def build_jobs(sample: list, count: int, run: str, applicant_bump: int = 0) -> list:
+    """Parse count jobs cycled from the sample, with ids unique to this run."""
+    parser = JobIngestionService(None, reference_time=datetime(2026, 2, 5))
+    jobs = []
+    for i in range(count):
+        data = dict(sample[i % len(sample)])
+        data["id"] = f"{ID_PREFIX}{run}-{i}"
+        data["applicant_count"] = data.get("applicant_count", 0) + applicant_bump
+        jobs.append(parser._parse_job_data(data))
+    return jobs
+
+
+async def store_loop(jobs: list) -> None:
+    """The per-job path ingestion used before bulk upserts."""
+    async with AsyncSessionLocal() as db:
+        for job in jobs:
+            existing = await db.get(Job, job.id)
+            if existing:
+                for name in JOB_METADATA_COLUMNS:
+                    setattr(existing, name, getattr(job, name))
+                existing.updated_at = datetime.utcnow()
+                await db.commit()
+            else:
+                db.add(job)
+                await db.commit()
+                await db.refresh(job)
+
+
+async def store_bulk(jobs: list, batch_size: int) -> None:
+    async with AsyncSessionLocal() as db:
+        for offset in range(0, len(jobs), batch_size):
+            await upsert_jobs(db, jobs[offset:offset + batch_size])
+            await db.commit()
+
+
+async def timed(coro) -> float:
+    started = time.perf_counter()
+    await coro
+    return time.perf_counter() - started
+
+
+async def cleanup() -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(Job).where(Job.id.startswith(ID_PREFIX)))
+        await db.commit()
+
+
+async def run(sample: list, sizes: list, batch_size: int) -> None:
+    print(
+        f"{'jobs':>8} {'method':>6} {'insert s':>9} {'update s':>9} "
+        f"{'same s':>9} {'jobs/s':>9}"
+    )
+    await cleanup()
+    try:
+        for size in sizes:
+            for method in ("loop", "bulk"):
+                run_id = f"{method}{size}"
+                if method == "loop":
+                    store = store_loop
+                else:
+                    store = lambda jobs: store_bulk(jobs, batch_size)  # noqa: E731
+                # Fresh objects per pass: the loop attaches its jobs to a session
+                insert = await timed(store(build_jobs(sample, size, run_id)))
+                update = await timed(store(build_jobs(sample, size, run_id, applicant_bump=1)))
+                same = await timed(store(build_jobs(sample, size, run_id, applicant_bump=1)))
+                rate = 3 * size / (insert + update + same)
+                print(
+                    f"{size:>8} {method:>6} {insert:>9.2f} {update:>9.2f} "
+                    f"{same:>9.2f} {rate:>9.0f}"
+                )
+                await cleanup()
+    finally:
+        await cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("sample", nargs="?", type=Path, default=DEFAULT_SAMPLE)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--batch-size", type=int, default=500, help="Jobs per upsert_jobs call")
+    args = parser.parse_args()
+
+    sample = orjson.loads(args.sample.read_bytes())
+    asyncio.run(run(sample, args.sizes, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Parse Worker Scaling Benchmark
+
+Runs the ingestion parse stage (streaming read, normalize_records, Job
+construction) over a synthetic export with 0 (one thread), 1, 2, 4, ...
+worker processes and reports jobs/s and the worst event-loop stall seen by a
+1 ms ticker, which stands in for in-flight LLM calls waiting to be served.
+
+Usage:
+    python scripts/bench_parse_workers.py [sample.json] [--jobs 50000] [--workers 0 1 2 4 8]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import orjson
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from features.job_processing.models import evaluation  # noqa: F401 (mapper registry)
+from features.job_processing.services.ingestion import JobIngestionService
+from features.job_processing.utils.json_stream import iter_json_array
+
+DEFAULT_SAMPLE = Path(__file__).parent.parent / "jobs_dataset_upwork_2026-02-05_04-09-24-623.json"
+
+
+def build_export(sample: list, jobs: int, path: Path) -> None:
+    with open(path, "wb") as f:
+        f.write(b"[")
+        for i in range(jobs):
+            job = dict(sample[i % len(sample)])
+            job["id"] = f"bench-{i}"
+            f.write((b"," if i else b"") + orjson.dumps(job))
+        f.write(b"]")
+
+
+async def run_parse_stage(path: Path, workers: int, batch_size: int) -> tuple:
+    """Drain the parse stage; returns (jobs, seconds, worst loop stall in ms)."""
+    service = JobIngestionService(
+        None, reference_time=datetime(2026, 2, 5), batch_size=batch_size, parse_workers=workers
+    )
+    batches: asyncio.Queue = asyncio.Queue(maxsize=2)
+    results = {"total_jobs": 0, "errors": 0}
+    worst_stall = 0.0
+    parsing = True
+
+    async def ticker():
+        nonlocal worst_stall
+        while parsing:
+            expected = time.perf_counter() + 0.001
+            await asyncio.sleep(0.001)
+            worst_stall = max(worst_stall, time.perf_counter() - expected)
+
+    async def consume() -> int:
+        parsed = 0
+        while (batch := await batches.get()) is not None:
+            parsed += len(batch)
+        return parsed
+
+    started = time.perf_counter()
+    with open(path, "rb") as f:
+        tick = asyncio.create_task(ticker())
+        _, parsed = await asyncio.gather(
+            service._parse_stage(iter_json_array(f), batches, results), consume()
+        )
+    elapsed = time.perf_counter() - started
+    parsing = False
+    await tick
+    return parsed, elapsed, worst_stall * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("sample", nargs="?", type=Path, default=DEFAULT_SAMPLE)
+    parser.add_argument("--jobs", type=int, default=50_000)
+    parser.add_argument("--workers", type=int, nargs="+")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    workers = args.workers or [0] + [n for n in (1, 2, 4, 8, 16) if n <= cores]
+    sample = orjson.loads(args.sample.read_bytes())
+
+    print(f"{args.jobs} jobs, {cores} cores")
+    print(f"{'workers':>8} {'seconds':>8} {'jobs/s':>8} {'speedup':>8} {'max stall ms':>13}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "export.json"
+        build_export(sample, args.jobs, path)
+        baseline = None
+        for count in workers:
+            parsed, elapsed, stall = asyncio.run(run_parse_stage(path, count, args.batch_size))
+            assert parsed == args.jobs
+            baseline = baseline or elapsed
+            print(
+                f"{count:>8} {elapsed:>8.2f} {parsed / elapsed:>8.0f} "
+                f"{baseline / elapsed:>7.2f}x {stall:>13.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Streaming Parser Memory Benchmark
+
+Builds synthetic Apify exports of increasing size from a sample export and
+reports peak RSS and wall time for parsing each one with a full orjson.loads
+versus the streaming iter_json_array. Every measurement runs in a fresh
+subprocess so peak RSS is not shared between runs. Each job is also run
+through the ingestion parser, as `cli.py ingest` would.
+
+Usage:
+    python scripts/bench_stream_rss.py [sample.json] [--sizes 25 100 400]
+"""
+
+import argparse
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import orjson
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+DEFAULT_SAMPLE = Path(__file__).parent.parent / "jobs_dataset_upwork_2026-02-05_04-09-24-623.json"
+
+
+def build_export(sample: list, target_mb: int, path: Path) -> int:
+    """Write a JSON array of about target_mb MB by repeating sample jobs with fresh ids."""
+    jobs = 0
+    written = 0
+    with open(path, "wb") as f:
+        f.write(b"[")
+        while written < target_mb * 1_000_000:
+            job = dict(sample[jobs % len(sample)])
+            job["id"] = f"bench-{jobs}"
+            job["url"] = f"https://www.upwork.com/jobs/~bench{jobs}"
+            encoded = (b"," if jobs else b"") + orjson.dumps(job)
+            f.write(encoded)
+            written += len(encoded)
+            jobs += 1
+        f.write(b"]")
+    return jobs
+
+
+def measure(mode: str, path: Path):
+    """Child process: parse the file and print jobs, seconds and peak RSS in MB."""
+    from features.job_processing.models import evaluation  # noqa: F401 (mapper registry)
+    from features.job_processing.services.ingestion import JobIngestionService
+    from features.job_processing.utils.json_stream import iter_json_array
+
+    parser = JobIngestionService(None)
+    started = time.perf_counter()
+    jobs = 0
+    with open(path, "rb") as f:
+        records = orjson.loads(f.read()) if mode == "load" else iter_json_array(f)
+        for record in records:
+            parser._parse_job_data(record)
+            jobs += 1
+    elapsed = time.perf_counter() - started
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux reports KB
+    print(orjson.dumps({"jobs": jobs, "seconds": elapsed, "peak_rss_mb": peak_mb}).decode())
+
+
+def run_child(mode: str, path: Path) -> dict:
+    output = subprocess.run(
+        [sys.executable, __file__, "--measure", mode, str(path)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return orjson.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("sample", nargs="?", type=Path, default=DEFAULT_SAMPLE)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[25, 100, 400], help="File sizes in MB")
+    parser.add_argument("--measure", choices=["load", "stream"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(args.measure, args.sample)
+        return
+
+    sample = orjson.loads(args.sample.read_bytes())
+    print(f"{'size MB':>8} {'jobs':>8} {'load RSS':>9} {'stream RSS':>11} {'load s':>7} {'stream s':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            path = Path(tmp) / f"export_{size}mb.json"
+            jobs = build_export(sample, size, path)
+            load = run_child("load", path)
+            stream = run_child("stream", path)
+            assert load["jobs"] == stream["jobs"] == jobs
+            print(
+                f"{size:>8} {jobs:>8} {load['peak_rss_mb']:>8.0f}M {stream['peak_rss_mb']:>10.0f}M "
+                f"{load['seconds']:>7.2f} {stream['seconds']:>9.2f}"
+            )
+            path.unlink()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+import asyncio
+
+import pytest
+
+from core.llm import ChatCompletionResult
+from features.job_processing.models.evaluation import JobEvaluation
+from features.job_processing.models.job import Job  # noqa: F401 - maps JobEvaluation.job
+
+
+class FakeResult:
+    """Rows of a faked query result."""
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+
+    def all(self):
+        return self.rows
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def scalars(self):
+        return FakeResult(row[0] if isinstance(row, tuple) else row for row in self.rows)
+
+
+class FakeSession:
+    """In-memory stand-in for an AsyncSession.
+
+    Executed statements are recorded and answered by `respond(statement)`,
+    which returns result rows; `get` looks instances up in `stored` by
+    (model, primary key), falling back to the primary key alone. Works as an async context manager, so `lambda: session` doubles as a
+    session factory, and as its own raw asyncpg connection for COPY.
+    """
+
+    def __init__(self, stored=None, respond=None):
+        self.stored = stored if stored is not None else {}
+        self.respond = respond
+        self.statements = []
+        self.merged = []
+        self.copied = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return FakeResult(self.respond(statement) if self.respond else [])
+
+    async def scalar(self, statement):
+        rows = (await self.execute(statement)).all()
+        return rows[0][0] if rows else None
+
+    async def get(self, model, key):
+        return self.stored.get((model, key), self.stored.get(key))
+
+    async def merge(self, instance):
+        self.merged.append(instance)
+        return instance
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+    async def connection(self):
+        return self
+
+    async def get_raw_connection(self):
+        return self
+
+    @property
+    def driver_connection(self):
+        return self
+
+    async def copy_records_to_table(self, name, records, columns):
+        self.copied = [dict(zip(columns, record)) for record in records]
+
+
+class FakeClient:
+    """LLM client answering every response model with a canned payload.
+
+    `payloads` maps response model names to payloads (an exception instance is
+    raised instead); `delays` maps them to seconds, so calls can overlap.
+    """
+
+    model = "fake-model"
+
+    def __init__(self, payloads=None, delays=None, prompt_tokens=0, completion_tokens=0):
+        self.payloads = payloads or {}
+        self.delays = delays or {}
+        self.prompt_tokens = prompt_tokens
+        self.completion_tokens = completion_tokens
+        self.calls = []  # Response model names, in call order
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def chat_completion(self, messages, response_model):
+        return (await self.chat_completion_result(messages, response_model)).response
+
+    async def chat_completion_result(self, messages, response_model):
+        name = response_model.__name__
+        self.calls.append(name)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(name, 0))
+            payload = self.payloads[name]
+            if isinstance(payload, Exception):
+                raise payload
+            return ChatCompletionResult(
+                response=response_model.model_validate(payload),
+                prompt_tokens=self.prompt_tokens,
+                completion_tokens=self.completion_tokens,
+            )
+        finally:
+            self.in_flight -= 1
+
+    async def close(self):
+        pass
+
+
+class FakeEvaluator:
+    """Evaluator returning an AI-related, Low priority evaluation after `delay` seconds.
+
+    Jobs in `fail_ids` raise instead. Tracks calls and peak concurrency.
+    """
+
+    prompt_variant = "baseline"
+
+    def __init__(self, version="v1", delay=0.0, fail_ids=()):
+        self.version = version
+        self.delay = delay
+        self.fail_ids = set(fail_ids)
+        self.client = FakeClient()
+        self.on_completion = None
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    async def evaluate(self, job):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if job.id in self.fail_ids:
+            raise RuntimeError(f"LLM call failed for {job.id}")
+        return JobEvaluation(
+            job_id=job.id,
+            is_ai_related=1,
+            score_total=50,
+            priority="Low",
+            evaluation_version=self.version,
+        )
+
+
+class FakeWriter:
+    """EvaluationWriter stand-in that keeps added evaluations in memory.
+
+    Evaluations of jobs in `fail_ids` are reported as failed writes.
+    """
+
+    def __init__(self, fail_ids=()):
+        self.fail_ids = set(fail_ids)
+        self.added = []
+        self.failed_rows = {}
+        self.flushes = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    @property
+    def failed(self):
+        return len(self.failed_rows)
+
+    @property
+    def failed_ids(self):
+        return set(self.failed_rows)
+
+    async def add(self, evaluation):
+        self.added.append(evaluation)
+        if evaluation.job_id in self.fail_ids:
+            self.failed_rows[evaluation.job_id] = {
+                "is_ai_related": evaluation.is_ai_related,
+                "evaluation_version": evaluation.evaluation_version,
+            }
+
+    async def flush(self):
+        self.flushes += 1
+
+
+@pytest.fixture
+def fake_session():
+    """FakeSession factory: fake_session(stored={...}, respond=lambda statement: rows)."""
+    return FakeSession
+
+
+@pytest.fixture
+def fake_client():
+    """FakeClient factory: fake_client({"ResponseModel": payload}, delays={...})."""
+    return FakeClient
+
+
+@pytest.fixture
+def fake_evaluator():
+    """FakeEvaluator factory: fake_evaluator(version="v1", delay=0.0, fail_ids=())."""
+    return FakeEvaluator
+
+
+@pytest.fixture
+def fake_writer():
+    """FakeWriter factory: fake_writer(fail_ids=())."""
+    return FakeWriter
@@ -0,0 +1,25 @@
+import pytest
+
+from core.backends import create_backend
+from core.cerebras import CerebrasClient
+from core.config import settings
+from core.llm import LLMBackend
+
+
+def test_local_backend_uses_its_own_profile():
+    client = create_backend("llamacpp")
+
+    assert isinstance(client, LLMBackend)
+    assert client.model == settings.llamacpp_model
+    assert client.profile.base_url == settings.llamacpp_base_url
+    assert client.profile.concurrency == settings.llamacpp_concurrency
+    assert client.profile.timeout == settings.local_llm_timeout
+
+
+def test_cerebras_is_a_backend_profile():
+    assert isinstance(create_backend("cerebras"), CerebrasClient)
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="Unknown LLM backend"):
+        create_backend("nope")
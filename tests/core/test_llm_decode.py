@@ -0,0 +1,30 @@
+import orjson
+import pytest
+from pydantic import BaseModel
+
+from core.llm_decode import decode_content, decode_envelope, response_adapter
+
+
+class Answer(BaseModel):
+    value: int
+    note: str = ""
+
+
+def test_envelope_and_content_decode_to_model():
+    body = orjson.dumps({
+        "choices": [{"message": {"content": '{"value": 3, "note": "ok"}'}}],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 4},
+    })
+
+    content, usage = decode_envelope(body)
+
+    assert decode_content(content, Answer) == Answer(value=3, note="ok")
+    assert usage == {"prompt_tokens": 10, "completion_tokens": 4}
+    assert decode_content({"value": 5}, Answer).value == 5
+    assert response_adapter(Answer) is response_adapter(Answer)
+
+
+@pytest.mark.parametrize("content", ['{"value": ', '{"note": "missing value"}'])
+def test_bad_content_raises_value_error(content):
+    with pytest.raises(ValueError):
+        decode_content(content, Answer)
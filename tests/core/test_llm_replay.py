@@ -0,0 +1,30 @@
+from datetime import datetime
+
+import pytest
+from pydantic import BaseModel
+
+from core.llm_replay import RecordingClient, ReplayClient, ReplayMissError
+
+
+class Answer(BaseModel):
+    value: int
+
+
+async def test_replay_serves_recorded_responses(tmp_path, fake_client):
+    path = tmp_path / "recording.jsonl"
+    reference_time = datetime(2026, 2, 5, 4, 0)
+    client = fake_client({"Answer": {"value": 5}}, prompt_tokens=12, completion_tokens=3)
+    recorder = RecordingClient(client, path, reference_time)
+    messages = [{"role": "user", "content": "hello"}]
+    recorded = await recorder.chat_completion(messages, Answer)
+    await recorder.close()
+
+    replay = ReplayClient(path, latency="zero")
+    assert replay.model == "fake-model"
+    assert replay.reference_time == reference_time
+    assert await replay.chat_completion(messages, Answer) == recorded
+    result = await replay.chat_completion_result(messages, Answer)
+    assert (result.prompt_tokens, result.completion_tokens) == (12, 3)
+
+    with pytest.raises(ReplayMissError):
+        await replay.chat_completion([{"role": "user", "content": "other"}], Answer)
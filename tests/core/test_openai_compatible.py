@@ -0,0 +1,71 @@
+import asyncio
+
+import httpx
+import orjson
+import pytest
+from pydantic import BaseModel
+
+from core.llm import BackendProfile, LLMCallError
+from core.openai_compatible import OpenAICompatibleClient, ReservedSlotClient
+
+
+class Answer(BaseModel):
+    value: int
+
+
+def completion(content: str) -> httpx.Response:
+    return httpx.Response(200, content=orjson.dumps({
+        "choices": [{"message": {"content": content}}],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 2},
+    }))
+
+
+def client_answering(*responses: httpx.Response) -> OpenAICompatibleClient:
+    """Client whose HTTP requests get `responses` in order."""
+    pending = list(responses)
+    client = OpenAICompatibleClient(BackendProfile(name="test", base_url="http://llm", model="m"))
+    client._http_client = httpx.AsyncClient(
+        base_url="http://llm", transport=httpx.MockTransport(lambda request: pending.pop(0))
+    )
+    return client
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    async def sleep(seconds):
+        pass
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+
+
+async def test_retries_report_attempts_and_parse_failures():
+    client = client_answering(completion("not json"), completion('{"value": 4}'))
+
+    result = await client.chat_completion_result([{"role": "user", "content": "hi"}], Answer)
+
+    assert result.response == Answer(value=4)
+    assert (result.attempts, result.parse_failures) == (2, 1)
+
+
+async def test_failed_call_carries_its_attempts_and_parse_failures():
+    client = client_answering(
+        completion("not json"), completion('{"value": "x"}'), httpx.Response(502)
+    )
+
+    with pytest.raises(LLMCallError) as raised:
+        await client.chat_completion_result([{"role": "user", "content": "hi"}], Answer)
+
+    result = raised.value.result
+    assert result.response is None
+    assert (result.attempts, result.parse_failures) == (3, 2)
+    assert (result.model, result.backend) == ("m", "test")
+    assert isinstance(raised.value.__cause__, httpx.HTTPStatusError)
+
+
+async def test_closing_the_reserved_slot_view_keeps_the_shared_client_open():
+    client = client_answering(completion('{"value": 4}'))
+
+    await ReservedSlotClient(client).close()
+    result = await client.chat_completion_result([{"role": "user", "content": "hi"}], Answer)
+
+    assert result.response == Answer(value=4)
@@ -0,0 +1,58 @@
+from features.job_processing.models.job import Job
+from features.job_processing.services.decomposed import DecomposedEvaluator
+
+JOB = Job(id="job-1", title="RAG chatbot", description="Build RAG", type="FIXED", url="u")
+
+
+async def test_decomposed_merges_concurrent_calls(fake_client):
+    client = fake_client(
+        {
+            "RelevanceResponse": {"is_ai_related": True, "tech_stack": "Python, LangChain"},
+            "TechFitResponse": {
+                "matched_expertise": [{"expertise_id": 2, "match_reason": "RAG"}],
+                "score_tech_fit": 7,
+            },
+            "RubricResponse": {
+                "score_clarity": 10, "score_budget": 10, "score_client": 10, "score_timeline": 10,
+            },
+        },
+        # Scoring calls are slower than the relevance call
+        delays={"TechFitResponse": 0.01, "RubricResponse": 0.01},
+    )
+
+    evaluation = await DecomposedEvaluator(client).evaluate(JOB)
+
+    assert client.max_in_flight == 3
+    assert evaluation.tech_stack == ["Python", "LangChain"]
+    assert evaluation.matched_expertise_ids == [2]
+    assert (evaluation.score_total, evaluation.priority) == (91, "High")
+
+
+async def test_decomposed_skips_scoring_for_non_ai_jobs(fake_client):
+    client = fake_client(
+        {"RelevanceResponse": {"is_ai_related": False, "filter_reason": "Logo design"}},
+        delays={"TechFitResponse": 0.01, "RubricResponse": 0.01},
+    )
+
+    evaluation = await DecomposedEvaluator(client).evaluate(JOB)
+
+    assert evaluation.is_ai_related == 0
+    assert evaluation.filter_reason == "Logo design"
+
+
+async def test_expertise_ids_beyond_the_seeded_profile_are_accepted(fake_client):
+    expertise = [{"id": 12, "name": "Robotics", "level": "Expert", "keywords": ["ROS"]}]
+    client = fake_client({
+        "RelevanceResponse": {"is_ai_related": True},
+        "TechFitResponse": {
+            "matched_expertise": [{"expertise_id": 12, "match_reason": "ROS"}],
+            "score_tech_fit": 9,
+        },
+        "RubricResponse": {
+            "score_clarity": 5, "score_budget": 5, "score_client": 5, "score_timeline": 5,
+        },
+    })
+
+    evaluation = await DecomposedEvaluator(client, expertise=expertise).evaluate(JOB)
+
+    assert evaluation.matched_expertise_ids == [12]
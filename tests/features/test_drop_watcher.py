@@ -0,0 +1,40 @@
+from features.job_processing.services.drop_watcher import DropWatcher
+
+
+async def test_files_are_ingested_once_complete_and_archived(tmp_path):
+    (tmp_path / "a.json").write_text("[]")
+    (tmp_path / "broken.json").write_text("[")
+    (tmp_path / "notes.txt").write_text("ignored")
+    ingested = []
+
+    async def ingest(path):
+        ingested.append(path.name)
+        if path.name == "broken.json":
+            raise ValueError("Truncated JSON array")
+        return {"total_jobs": 2, "evaluated": 1, "errors": 0}
+
+    watcher = DropWatcher(tmp_path, ingest, poll_interval=0)
+
+    # First scan only records sizes; nothing is known to be complete yet
+    assert watcher.scan() == ([], 2)
+
+    results = await watcher.run(drain=True)
+
+    assert sorted(ingested) == ["a.json", "broken.json"]
+    assert results == {"files": 1, "failed": 1, "total_jobs": 2, "evaluated": 1, "errors": 0}
+    assert (tmp_path / "processed" / "a.json").exists()
+    assert (tmp_path / "failed" / "broken.json").exists()
+    assert (tmp_path / "notes.txt").exists()
+
+
+def test_growing_file_waits_until_unchanged(tmp_path):
+    drop = tmp_path / "drop.json"
+    drop.write_text('[{"id": "1"}')
+    watcher = DropWatcher(tmp_path, None, poll_interval=0)
+
+    watcher.scan()
+    with open(drop, "a") as f:
+        f.write("]")
+
+    assert watcher.scan() == ([], 1)
+    assert watcher.scan() == ([drop], 0)
@@ -0,0 +1,177 @@
+from datetime import datetime
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import Insert
+from sqlalchemy.dialects import postgresql
+
+from core.database import get_db
+from features.job_processing.models.evaluation import JobEvaluation
+from features.job_processing.models.job import Job
+from features.job_processing.routes import endpoints
+from features.job_processing.services.job_upsert import JOB_METADATA_COLUMNS
+from features.job_processing.services.on_demand import OnDemandEvaluator
+from main import app
+
+JOB = {
+    "id": "~01abc",
+    "title": "Build a RAG chatbot",
+    "url": "https://www.upwork.com/jobs/~01abc",
+    "description": "FastAPI backend with pgvector retrieval.",
+    "ts_publish": "2026-10-19T08:00:00Z",
+}
+
+
+def evaluation(job_id, version, score_total):
+    return JobEvaluation(
+        job_id=job_id,
+        is_ai_related=1,
+        tech_stack=["RAG", "FastAPI"],
+        project_type="RAG chatbot",
+        complexity="Medium",
+        matched_expertise_ids=[2, 4],
+        score_budget=5,
+        score_client=5,
+        score_clarity=8,
+        score_tech_fit=10,
+        score_timeline=7,
+        score_total=score_total,
+        reason_budget="Budget not stated",
+        reason_client="New client",
+        reason_clarity="Clear scope",
+        reason_tech_fit="RAG and FastAPI",
+        reason_timeline="Few applicants",
+        priority="Medium",
+        evaluation_version=version,
+    )
+
+
+class StubEvaluator:
+    """JobEvaluator stand-in scoring every job 72."""
+
+    version = "sgl-000000000001"
+
+    def __init__(self):
+        self.jobs = []
+
+    async def evaluate(self, job):
+        self.jobs.append(job)
+        return evaluation(job.id, self.version, 72)
+
+
+class UpsertJobs:
+    """respond() applying jobs upserts to `db.stored` like the ON CONFLICT clause would.
+
+    New jobs are stored whole; stored jobs only get their metadata columns.
+    """
+
+    def __init__(self):
+        self.db = None
+        self.rows = []
+
+    def __call__(self, statement):
+        if not isinstance(statement, Insert) or statement.table.name != Job.__tablename__:
+            return []
+        params = statement.compile(dialect=postgresql.dialect()).params
+        row = {c.key: params[f"{c.name}_m0"] for c in Job.__table__.columns}
+        self.rows.append(row)
+        stored = self.db.stored.get((Job, row["id"]))
+        if stored is None:
+            self.db.stored[(Job, row["id"])] = Job(**row)
+            return [(row["id"], True)]
+        for name in JOB_METADATA_COLUMNS:
+            setattr(stored, name, row[name])
+        return [(row["id"], False)]
+
+
+@pytest.fixture
+def api(monkeypatch, fake_session):
+    """Client for the app with get_db and the on-demand evaluator stubbed."""
+    upserts = UpsertJobs()
+    db = upserts.db = fake_session(respond=upserts)
+    evaluator = StubEvaluator()
+    on_demand = OnDemandEvaluator(evaluator)
+
+    async def get_on_demand_evaluator(session):
+        assert session is db
+        return on_demand
+
+    monkeypatch.setattr(endpoints, "get_on_demand_evaluator", get_on_demand_evaluator)
+    app.dependency_overrides[get_db] = lambda: db
+    client = AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+    yield client, db, evaluator
+    app.dependency_overrides.pop(get_db)
+
+
+async def test_new_job_is_stored_and_evaluated(api):
+    client, db, evaluator = api
+
+    async with client:
+        response = await client.post("/jobs/evaluate", json=JOB)
+
+    assert response.status_code == 200
+    assert response.headers["X-Evaluation-Source"] == "evaluated"
+    body = response.json()
+    assert (body["job_id"], body["score_total"], body["priority"]) == ("~01abc", 72, "Medium")
+    assert body["matched_expertise_ids"] == [2, 4]
+    # The job is parsed like an export record and upserted before it is evaluated
+    job = db.stored[(Job, "~01abc")]
+    assert (job.title, job.url) == (JOB["title"], JOB["url"])
+    assert job.detected_tech == ["RAG", "FastAPI", "pgvector"]
+    assert job.metadata_hash
+    assert evaluator.jobs == [job]
+    (stored_evaluation,) = db.merged
+    assert stored_evaluation.evaluation_version == StubEvaluator.version
+    assert db.commits == 2
+
+
+async def test_stored_job_only_gets_its_metadata_refreshed(api):
+    client, db, evaluator = api
+    db.stored[(Job, "~01abc")] = Job(
+        id="~01abc", title="Old title", description="Old description",
+        url=JOB["url"], ts_publish=datetime(2026, 10, 19, 8), applicant_count=0,
+    )
+
+    async with client:
+        response = await client.post("/jobs/evaluate", json={**JOB, "applicant_count": 12})
+
+    assert response.status_code == 200
+    (job,) = evaluator.jobs
+    assert (job.title, job.description) == ("Old title", "Old description")
+    assert job.applicant_count == 12 and job.metadata_hash
+
+
+async def test_current_evaluation_is_returned_without_an_llm_call(api):
+    client, db, evaluator = api
+    db.stored[(JobEvaluation, "~01abc")] = evaluation("~01abc", StubEvaluator.version, 64)
+
+    async with client:
+        response = await client.post("/jobs/evaluate", json=JOB)
+
+    assert response.status_code == 200
+    assert response.headers["X-Evaluation-Source"] == "existing"
+    assert response.json()["score_total"] == 64
+    assert evaluator.jobs == []
+    assert db.merged == []
+
+
+async def test_stale_evaluation_is_replaced(api):
+    client, db, evaluator = api
+    db.stored[(JobEvaluation, "~01abc")] = evaluation("~01abc", "sgl-0000000000ff", 64)
+
+    async with client:
+        response = await client.post("/jobs/evaluate", json=JOB)
+
+    assert response.headers["X-Evaluation-Source"] == "evaluated"
+    assert response.json()["score_total"] == 72
+
+
+async def test_malformed_job_is_rejected(api):
+    client, db, evaluator = api
+
+    async with client:
+        response = await client.post("/jobs/evaluate", json={"id": "~01abc"})
+
+    assert response.status_code == 422
+    assert response.json()["detail"].startswith("Invalid job object")
+    assert db.statements == [] and evaluator.jobs == []
@@ -0,0 +1,126 @@
+import asyncio
+
+from sqlalchemy.dialects import postgresql
+
+from features.job_processing.models.evaluation import JobEvaluation
+from features.job_processing.services.evaluation_writer import (
+    EvaluationWriter,
+    uncount_failed_writes,
+)
+
+
+def evaluation(job_id, score=50):
+    return JobEvaluation(job_id=job_id, is_ai_related=1, score_total=score, priority="Low")
+
+
+def sql(statement) -> str:
+    return str(statement.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    ))
+
+
+class FailingWrites:
+    """Rejects multi-row batches and any statement touching a job in `bad_ids`."""
+
+    def __init__(self, bad_ids=()):
+        self.bad_ids = set(bad_ids)
+
+    def __call__(self, statement):
+        text = sql(statement)
+        if "), (" in text or any(f"'{job_id}'" in text for job_id in self.bad_ids):
+            raise RuntimeError("write rejected")
+        return []
+
+
+class SessionFactory:
+    """Hands out `sessions` in order; a session that is an exception is raised instead."""
+
+    def __init__(self, *sessions):
+        self.sessions = list(sessions)
+
+    def __call__(self):
+        session = self.sessions.pop(0)
+        if isinstance(session, Exception):
+            raise session
+        return session
+
+
+async def test_failed_batch_is_retried_per_row(fake_session):
+    session = fake_session(respond=FailingWrites(bad_ids={"j2"}))
+    writer = EvaluationWriter(session_factory=lambda: session, batch_size=100)
+
+    for job_id in ("j1", "j2", "j3"):
+        await writer.add(evaluation(job_id))
+    persisted = await writer.flush()
+
+    assert persisted == ["j1", "j3"]
+    assert writer.failed_ids == {"j2"}
+    assert writer.written == 2
+    # One rejected batch, then one statement per row
+    assert len(session.statements) == 4
+    assert session.commits == 2 and session.rollbacks == 1
+
+
+async def test_duplicate_job_ids_are_written_once(fake_session):
+    session = fake_session()
+    writer = EvaluationWriter(session_factory=lambda: session, batch_size=100)
+
+    await writer.add(evaluation("j1", score=10))
+    await writer.add(evaluation("j2"))
+    await writer.add(evaluation("j1", score=90))
+    assert await writer.flush() == ["j1", "j2"]
+
+    (statement,) = session.statements
+    text = sql(statement)
+    # ON CONFLICT DO UPDATE cannot touch the same row twice; the latest evaluation wins
+    assert text.count("'j1'") == 1
+    assert "ON CONFLICT (job_id) DO UPDATE" in text
+    assert statement.compile(dialect=postgresql.dialect()).params["score_total_m0"] == 90
+
+
+async def test_rows_are_failed_when_no_retry_session_opens(fake_session):
+    factory = SessionFactory(
+        fake_session(respond=FailingWrites()), ConnectionError("database is down")
+    )
+    writer = EvaluationWriter(session_factory=factory, batch_size=100)
+
+    await writer.add(evaluation("j1"))
+    await writer.add(evaluation("j2"))
+
+    assert await writer.flush() == []
+    assert writer.failed_ids == {"j1", "j2"}
+
+
+async def test_background_flush_survives_write_errors(fake_session):
+    factory = SessionFactory(*[ConnectionError("database is down")] * 4)
+    writer = EvaluationWriter(session_factory=factory, batch_size=100, flush_interval=0.01)
+
+    async with writer:
+        await writer.add(evaluation("j1"))
+        await asyncio.sleep(0.05)
+        assert writer.failed_ids == {"j1"}
+        assert not writer._timer.done()
+
+        await writer.add(evaluation("j2"))
+        await asyncio.sleep(0.05)
+
+    assert writer.failed_ids == {"j1", "j2"}
+
+
+async def test_failed_writes_are_moved_from_outcome_counters_to_errors(fake_session):
+    writer = EvaluationWriter(session_factory=SessionFactory(
+        fake_session(respond=FailingWrites()), fake_session(respond=FailingWrites({"j1", "j2"}))
+    ), batch_size=100)
+    await writer.add(evaluation("j1"))
+    await writer.add(JobEvaluation(
+        job_id="j2", is_ai_related=0, score_total=0, priority="Low", evaluation_version="clf-0a1b2c3d4e5f"
+    ))
+    await writer.add(JobEvaluation(job_id="j3", is_ai_related=0, score_total=0, priority="Low"))
+    await writer.flush()
+    results = {"evaluated": 3, "ai_related": 1, "not_ai_related": 2, "llm_skipped": 1, "errors": 0}
+
+    uncount_failed_writes(results, writer)
+
+    assert results == {
+        "evaluated": 1, "ai_related": 0, "not_ai_related": 1, "llm_skipped": 0, "errors": 2
+    }
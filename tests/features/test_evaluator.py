@@ -0,0 +1,52 @@
+from features.job_processing.models.profile import FreelancerProfile
+from features.job_processing.services import evaluator as evaluator_module
+from features.job_processing.services.decomposed import DecomposedEvaluator
+from features.job_processing.services.evaluator import (
+    JobEvaluator,
+    compute_evaluation_version,
+    load_default_expertise,
+)
+from features.job_processing.services.prompt_variants import DEFAULT_EXPERTISE
+
+EXPERTISE = [
+    {"id": 1, "name": "Computer Vision", "level": "Expert", "keywords": ["OpenCV", "YOLO"]},
+    {"id": 2, "name": "Robotics", "level": "Advanced", "keywords": ["ROS"]},
+]
+
+
+def test_version_covers_user_prompt_and_tech_dictionary(monkeypatch, fake_client):
+    version = JobEvaluator(fake_client()).version
+
+    assert version.startswith("sgl-") and len(version) <= 16
+    assert compute_evaluation_version("sgl", "prompt", "m") != compute_evaluation_version(
+        "sgl", "prompt", "m", expertise_hints=False
+    )
+
+    monkeypatch.setattr(evaluator_module, "DICTIONARY_VERSION", "000000000000")
+    assert JobEvaluator(fake_client()).version != version
+
+    monkeypatch.undo()
+    monkeypatch.setattr(
+        evaluator_module, "USER_PROMPT_TEMPLATE",
+        evaluator_module.USER_PROMPT_TEMPLATE.replace("Evaluate", "Score"),
+    )
+    assert JobEvaluator(fake_client()).version != version
+
+
+async def test_prompts_are_built_from_the_stored_default_profile(fake_session, fake_client):
+    db = fake_session({"default": FreelancerProfile(id="default", expertise=EXPERTISE)})
+
+    expertise = await load_default_expertise(db)
+    single = JobEvaluator(fake_client(), expertise=expertise)
+    decomposed = DecomposedEvaluator(fake_client(), expertise=expertise)
+
+    assert "1. Computer Vision (Expert): OpenCV, YOLO\n2. Robotics (Advanced): ROS\n" in single.system_prompt
+    assert "expertise_id must be 1-2" in single.system_prompt
+    assert "AI Agent Architecture" not in single.system_prompt
+    assert "1: Computer Vision [Expert]: OpenCV, YOLO" in decomposed.tech_fit_prompt
+    assert single.version != JobEvaluator(fake_client()).version
+    assert decomposed.version != DecomposedEvaluator(fake_client()).version
+
+
+async def test_seeded_expertise_is_used_without_a_stored_profile(fake_session):
+    assert await load_default_expertise(fake_session()) == DEFAULT_EXPERTISE
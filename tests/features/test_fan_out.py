@@ -0,0 +1,39 @@
+from features.job_processing.models.job import Job
+from features.job_processing.models.profile import FreelancerProfile
+from features.job_processing.services.fan_out import FanOutEvaluator
+
+
+PROFILES = [
+    FreelancerProfile(id="default", name="A", role="AI Engineer", expertise=[
+        {"id": 1, "name": "RAG", "level": "Expert", "keywords": ["RAG"]},
+    ]),
+    FreelancerProfile(id="frontend", name="B", role="Frontend Engineer", expertise=[
+        {"id": 1, "name": "React", "level": "Expert", "keywords": ["React"]},
+    ]),
+]
+
+
+async def test_fan_out_scores_every_profile_in_one_call(fake_client):
+    client = fake_client({"FanOutEvaluationResponse": {
+        "is_ai_related": True,
+        "score_budget": 10,
+        "score_client": 10,
+        "score_clarity": 10,
+        "score_timeline": 10,
+        "profile_fits": [
+            {"profile_id": "default", "matched_expertise_ids": [1, 9], "score_tech_fit": 10},
+            {"profile_id": "frontend", "score_tech_fit": 0},
+        ],
+    }})
+    evaluator = FanOutEvaluator(client, PROFILES)
+    job = Job(id="job-1", title="RAG chatbot", description="Build RAG", type="FIXED", url="u")
+
+    evaluation = await evaluator.evaluate(job)
+    by_profile = {p.profile_id: p for p in evaluation.profile_evaluations}
+
+    assert client.calls == ["FanOutEvaluationResponse"]
+    assert (by_profile["default"].score_total, by_profile["default"].priority) == (100, "High")
+    assert (by_profile["frontend"].score_total, by_profile["frontend"].priority) == (70, "Medium")
+    assert by_profile["default"].matched_expertise_ids == [1]
+    assert evaluation.score_total == 100
+    assert evaluation.evaluation_version == evaluator.version
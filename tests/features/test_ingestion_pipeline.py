@@ -0,0 +1,204 @@
+import asyncio
+
+import orjson
+
+from features.job_processing.services import ingestion
+from features.job_processing.services.ingestion import JobIngestionService
+
+
+class FakeRun:
+    def __init__(self, records_committed=0, counters=None):
+        self.id = 1
+        self.records_committed = records_committed
+        self.counters = counters or {}
+
+
+class FakeRuns:
+    """Replaces the ingestion_runs helpers used by the service."""
+
+    def __init__(self, run=None, completed=False):
+        self.run = run or FakeRun()
+        self.completed = completed
+        self.offsets = []
+        self.finished = None
+
+    def install(self, monkeypatch):
+        async def open_run(db, file_path, force=False):
+            return self.run, self.completed and not force
+
+        async def record_progress(db, run, records_committed, counters):
+            self.offsets.append(records_committed)
+
+        async def finish_run(db, run, counters, error=None):
+            self.finished = error or "completed"
+
+        monkeypatch.setattr(ingestion, "open_run", open_run)
+        monkeypatch.setattr(ingestion, "record_progress", record_progress)
+        monkeypatch.setattr(ingestion, "finish_run", finish_run)
+
+
+async def test_pipeline_overlaps_evaluations_and_routes_every_job(
+    tmp_path, monkeypatch, fake_session, fake_evaluator, fake_writer
+):
+    records = [
+        {"id": str(i), "title": f"Job {i}", "url": f"https://example.com/{i}", "description": ""}
+        for i in range(25)
+    ]
+    export = tmp_path / "export.json"
+    export.write_bytes(orjson.dumps(records + [{"id": "broken"}]))
+
+    stored = {}
+
+    async def fake_upsert(db, jobs):
+        stored.update({job.id: job for job in jobs})
+        return {job.id: "inserted" for job in jobs}
+
+    async def no_evaluations(self, db, job_ids):
+        return {"3": False} if "3" in job_ids else {}
+
+    writer = fake_writer(fail_ids={"7"})  # stored evaluation of job 7 fails
+    runs = FakeRuns()
+    runs.install(monkeypatch)
+    monkeypatch.setattr(ingestion, "upsert_jobs", fake_upsert)
+    monkeypatch.setattr(ingestion, "EvaluationWriter", lambda: writer)
+    monkeypatch.setattr(JobIngestionService, "_existing_evaluations", no_evaluations)
+
+    evaluator = fake_evaluator(delay=0.01)
+    db = fake_session(stored)
+    service = JobIngestionService(
+        evaluator,
+        concurrency=4,
+        batch_size=10,
+        queue_size=5,
+        session_factory=lambda: db,
+    )
+    results = await service.ingest_apify_json(export, db)
+
+    assert results["total_jobs"] == 26
+    assert results["errors"] == 2  # the record without a title or url, the write of job 7
+    assert results["inserted"] == 25
+    assert results["evaluated"] == 24  # 23 evaluated now, job 3 already was
+    assert (results["ai_related"], results["not_ai_related"]) == (23, 1)
+    assert len(writer.added) == 24
+    assert evaluator.peak == 4
+    assert runs.offsets == [10, 20, 26]
+    assert runs.finished == "completed"
+
+
+async def test_job_removed_before_its_evaluation_is_counted_as_an_error(
+    tmp_path, monkeypatch, fake_session, fake_evaluator, fake_writer
+):
+    records = [
+        {"id": str(i), "title": f"Job {i}", "url": f"https://example.com/{i}", "description": ""}
+        for i in range(3)
+    ]
+    export = tmp_path / "export.json"
+    export.write_bytes(orjson.dumps(records))
+
+    stored = {}
+
+    async def upsert_then_lose_job_1(db, jobs):
+        stored.update({job.id: job for job in jobs if job.id != "1"})
+        return {job.id: "inserted" for job in jobs}
+
+    async def no_evaluations(self, db, job_ids):
+        return {}
+
+    FakeRuns().install(monkeypatch)
+    monkeypatch.setattr(ingestion, "upsert_jobs", upsert_then_lose_job_1)
+    monkeypatch.setattr(ingestion, "EvaluationWriter", lambda: fake_writer())
+    monkeypatch.setattr(JobIngestionService, "_existing_evaluations", no_evaluations)
+
+    evaluator = fake_evaluator()
+    db = fake_session(stored)
+    service = JobIngestionService(evaluator, concurrency=2, session_factory=lambda: db)
+    results = await service.ingest_apify_json(export, db)
+
+    assert (results["evaluated"], results["errors"]) == (2, 1)
+    assert evaluator.calls == 2
+
+
+async def test_process_pool_parse_keeps_file_order_and_counts_errors():
+    records = [
+        {"id": str(i), "title": "RAG on postgres", "url": f"https://example.com/{i}"}
+        for i in range(12)
+    ]
+    records[4] = {"id": "4"}  # no title or url
+
+    async def parse(workers):
+        service = JobIngestionService(None, batch_size=5, parse_workers=workers)
+        batches = asyncio.Queue()
+        await service._parse_stage(iter(records), batches, resume_from=3)
+        chunks = []
+        while (chunk := batches.get_nowait()) is not None:
+            jobs = [(idx, job.id, job.detected_tech) for idx, job in chunk.jobs]
+            chunks.append((chunk.end_offset, chunk.resumed, chunk.records, chunk.errors, jobs))
+        return chunks
+
+    in_thread = await parse(0)
+    in_processes = await parse(2)
+
+    assert in_processes == in_thread
+    assert [chunk[:4] for chunk in in_thread] == [
+        (5, [(0, "0"), (1, "1"), (2, "2")], 2, 1),
+        (10, [], 5, 0),
+        (12, [], 2, 0),
+    ]
+    jobs = [job for chunk in in_thread for job in chunk[4]]
+    assert [idx for idx, _, _ in jobs] == [3, 5, 6, 7, 8, 9, 10, 11]
+    assert jobs[0][2] == ["RAG", "PostgreSQL"]
+
+
+async def test_completed_file_is_a_no_op_unless_forced(tmp_path, monkeypatch):
+    export = tmp_path / "export.json"
+    export.write_bytes(b"[]")
+    FakeRuns(FakeRun(counters={"total_jobs": 7}), completed=True).install(monkeypatch)
+    service = JobIngestionService(None)
+
+    skipped = await service.ingest_apify_json(export, None)
+    forced = await service.ingest_apify_json(export, None, force=True)
+
+    assert skipped["already_completed"] == 1 and skipped["total_jobs"] == 7
+    assert forced["already_completed"] == 0 and forced["total_jobs"] == 0
+
+
+async def test_resumed_records_are_counted_apart_from_the_run_totals(
+    tmp_path, monkeypatch, fake_session, fake_evaluator, fake_writer
+):
+    records = [
+        {"id": str(i), "title": f"Job {i}", "url": f"https://example.com/{i}", "description": ""}
+        for i in range(5)
+    ]
+    export = tmp_path / "export.json"
+    export.write_bytes(orjson.dumps(records))
+
+    stored = {}
+
+    async def fake_upsert(db, jobs):
+        stored.update({job.id: job for job in jobs})
+        return {job.id: "inserted" for job in jobs}
+
+    async def no_evaluations(self, db, job_ids):
+        return {}
+
+    # The stopped attempt stored jobs 0-2 and counted job 1 as evaluated, but
+    # its write was still buffered: job 1 is routed again
+    counters = {"total_jobs": 3, "ingested": 3, "inserted": 3, "evaluated": 3, "ai_related": 3}
+    FakeRuns(FakeRun(records_committed=3, counters=counters)).install(monkeypatch)
+    monkeypatch.setattr(ingestion, "upsert_jobs", fake_upsert)
+    monkeypatch.setattr(ingestion, "EvaluationWriter", lambda: fake_writer())
+    monkeypatch.setattr(JobIngestionService, "_existing_evaluations", no_evaluations)
+
+    evaluator = fake_evaluator()
+    stored["1"] = ingestion.Job(id="1", title="Job 1")
+    db = fake_session(stored, respond=lambda statement: [stored["1"]])
+    service = JobIngestionService(evaluator, concurrency=2, session_factory=lambda: db)
+    results = await service.ingest_apify_json(export, db)
+
+    assert evaluator.calls == 3
+    assert (results["total_jobs"], results["inserted"], results["evaluated"]) == (5, 5, 5)
+    assert results["ai_related"] == 5
+    assert results["resumed"] == {
+        "evaluated": 1, "ai_related": 1, "not_ai_related": 0, "enqueued": 0,
+        "llm_skipped": 0, "errors": 0,
+    }
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy.dialects import postgresql
+
+from features.job_processing.models import evaluation  # noqa: F401 (mapper registry)
+from features.job_processing.models.job import Job
+from features.job_processing.services import job_upsert
+from features.job_processing.services.job_upsert import copy_merge_jobs, job_row, upsert_jobs
+from features.job_processing.utils.job_normalizer import normalize_job
+
+
+def upsert_result(statement):
+    params = statement.compile(dialect=postgresql.dialect()).params
+    ids = [value for name, value in params.items() if name.startswith("id_m")]
+    # Pretend odd ids were already stored, and that multiples of 3 are unchanged
+    return [(job_id, int(job_id) % 2 == 0) for job_id in ids if int(job_id) % 3]
+
+
+def make_job(job_id):
+    return Job(id=job_id, url=f"https://example.com/{job_id}", title="RAG bot", description="")
+
+
+def test_job_row_fills_model_defaults():
+    row = job_row(make_job("1"))
+
+    assert row["applicant_count"] == 0
+    assert row["invite_only"] is False
+    assert row["detected_tech"] == []
+    assert row["source"] == "apify"
+    assert row["created_at"] is not None
+
+
+def test_metadata_hash_tracks_refreshed_columns_only():
+    job = make_job("1")
+    hash_before = job_row(job)["metadata_hash"]
+
+    job.title = "Renamed"  # not refreshed on conflict, so not fingerprinted
+    assert job_row(job)["metadata_hash"] == hash_before
+    job.applicant_count = 5
+    assert job_row(job)["metadata_hash"] != hash_before
+
+
+def test_reparsing_later_keeps_the_metadata_hash():
+    record = {
+        "id": "1", "title": "RAG bot", "url": "https://example.com/1",
+        "ts_publish": "2026-02-05T01:00:00Z", "applicant_count": 3,
+    }
+    parsed_at = datetime(2026, 2, 5, 4, 0)
+    first = job_row(Job(**normalize_job(record, parsed_at)))
+    later = job_row(Job(**normalize_job(record, parsed_at + timedelta(hours=1))))
+
+    assert first["job_age_hours"] != later["job_age_hours"]
+    assert first["metadata_hash"] == later["metadata_hash"]
+
+
+async def test_upsert_dedupes_chunks_and_reports_inserted(monkeypatch, fake_session):
+    monkeypatch.setattr(job_upsert, "MAX_BIND_PARAMETERS", 3 * len(Job.__table__.columns))
+    db = fake_session(respond=upsert_result)
+    jobs = [make_job(str(i)) for i in range(7)] + [make_job("0")]
+
+    stored = await upsert_jobs(db, jobs)
+
+    assert len(db.statements) == 3  # 7 distinct ids, 3 rows per statement
+    assert stored == {
+        "0": "unchanged", "1": "updated", "2": "inserted", "3": "unchanged",
+        "4": "inserted", "5": "updated", "6": "unchanged",
+    }
+    sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (id) DO UPDATE" in sql
+    assert "WHERE jobs.metadata_hash IS DISTINCT FROM excluded.metadata_hash" in sql
+    assert "title = excluded.title" not in sql
+    assert "applicant_count = excluded.applicant_count" in sql
+
+
+async def test_copy_merge_streams_rows_and_returns_unevaluated_ids(fake_session):
+    # The merge reports job "1" as already evaluated and job "2" as unchanged
+    db = fake_session(respond=lambda statement: [
+        ("0", True, False), ("1", False, True), ("2", None, False),
+    ])
+
+    jobs = iter([make_job("0"), make_job("1"), make_job("2")])
+    stored, unevaluated = await copy_merge_jobs(db, jobs)
+
+    assert stored == {"0": "inserted", "1": "updated", "2": "unchanged"}
+    assert unevaluated == ["0", "2"]
+    assert [row["staging_seq"] for row in db.copied] == [0, 1, 2]
+    assert db.copied[0]["detected_tech"] == "[]"  # JSONB is copied as JSON text
+    create, merge, drop = (
+        str(statement.compile(dialect=postgresql.dialect())) for statement in db.statements
+    )
+    assert create.startswith("CREATE UNLOGGED TABLE jobs_staging_")
+    assert "ON CONFLICT (id) DO UPDATE" in merge and "row_number()" in merge
+    assert "IS DISTINCT FROM excluded.metadata_hash" in merge
+    assert "LEFT OUTER JOIN merged" in merge
+    assert drop.startswith("DROP TABLE jobs_staging_")
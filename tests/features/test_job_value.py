@@ -0,0 +1,23 @@
+import features.job_processing.models.evaluation  # noqa: F401  (registers Job.evaluation target)
+from features.job_processing.models.job import Job
+from features.job_processing.utils.job_value import expected_value
+
+
+def test_fresh_well_paid_jobs_rank_above_stale_cheap_ones():
+    promising = Job(
+        fixed_budget_amount=5000,
+        job_age_hours=2,
+        applicant_count=3,
+        client_total_paid=20000,
+        client_payment_verified=True,
+    )
+    stale = Job(fixed_budget_amount=5000, job_age_hours=240, applicant_count=50)
+    cheap = Job(fixed_budget_amount=50, job_age_hours=2, applicant_count=3)
+
+    assert expected_value(promising) > expected_value(stale)
+    assert expected_value(promising) > expected_value(cheap)
+    assert 0 <= expected_value(cheap) <= 100
+
+
+def test_hourly_rate_counts_as_budget():
+    assert expected_value(Job(hourly_min=80, hourly_max=120)) > expected_value(Job(hourly_max=10))
@@ -0,0 +1,70 @@
+import gzip
+import io
+
+import orjson
+import pytest
+import zstandard
+
+from features.job_processing.utils.json_stream import (
+    EXPORT_PATTERNS,
+    iter_json_array,
+    open_export,
+)
+
+DOCUMENTS = [
+    b"[]",
+    b' [ {"id": "1", "title": "RAG bot"} , {"id": "2", "tags": ["a", "b"]} ] ',
+    b'["quote \\" and ] inside", "backslash \\\\", {"nested": [1, {"x": "}{"}]}, null, -1.5e3]',
+    b"[[1, 2], [], [3]]",
+]
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+@pytest.mark.parametrize("chunk_size", [1, 3, 64])
+def test_stream_matches_full_parse(document, chunk_size):
+    assert list(iter_json_array(io.BytesIO(document), chunk_size)) == orjson.loads(document)
+
+
+@pytest.mark.parametrize("document", [b"", b'{"id": "1"}', b'[{"id": "1"}, {"id": "2'])
+def test_invalid_or_truncated_input_raises(document):
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.BytesIO(document), 4))
+
+
+RECORDS = [{"id": "1", "title": "RAG bot"}, {"id": "2", "tags": ["a", "b"]}]
+
+
+def _write(path, data):
+    if path.suffix == ".gz":
+        data = gzip.compress(data)
+    elif path.suffix in (".zst", ".zstd"):
+        data = zstandard.ZstdCompressor().compress(data)
+    path.write_bytes(data)
+    return path
+
+
+@pytest.mark.parametrize("compression", ["", ".gz", ".zst", ".zstd"])
+@pytest.mark.parametrize(
+    "name, data",
+    [
+        ("export.json", orjson.dumps(RECORDS)),
+        ("export.jsonl", b"\n".join(orjson.dumps(r) for r in RECORDS) + b"\n\n"),
+        # No telling suffix: NDJSON is recognized by its first value
+        ("export.dat", b"\n".join(orjson.dumps(r) for r in RECORDS)),
+    ],
+)
+def test_open_export_handles_formats_and_compression(tmp_path, name, data, compression):
+    path = _write(tmp_path / f"{name}{compression}", data)
+
+    with open_export(path) as records:
+        assert list(records) == RECORDS
+    # Files the watcher picks up are files open_export can read
+    assert any(path.match(pattern) for pattern in EXPORT_PATTERNS) == (name != "export.dat")
+
+
+def test_compression_is_detected_by_magic_bytes(tmp_path):
+    path = tmp_path / "export.json"
+    path.write_bytes(gzip.compress(orjson.dumps(RECORDS)))
+
+    with open_export(path) as records:
+        assert list(records) == RECORDS
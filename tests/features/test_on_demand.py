@@ -0,0 +1,78 @@
+import asyncio
+
+from features.job_processing.models.job import Job
+from features.job_processing.models.evaluation import JobEvaluation
+from features.job_processing.models.profile import FreelancerProfile
+from features.job_processing.services import on_demand as on_demand_module
+from features.job_processing.services.on_demand import OnDemandEvaluator, get_on_demand_evaluator
+
+
+async def test_concurrent_requests_share_one_llm_call(fake_session, fake_evaluator):
+    evaluator = fake_evaluator(version="v2", delay=0.01)
+    on_demand = OnDemandEvaluator(evaluator)
+    job = Job(id="job-1")
+
+    (first, first_source), (second, second_source) = await asyncio.gather(
+        on_demand.evaluate(job, fake_session()),
+        on_demand.evaluate(job, fake_session()),
+    )
+
+    assert evaluator.calls == 1
+    assert first is second
+    assert {first_source, second_source} == {"evaluated", "coalesced"}
+
+
+async def test_current_evaluation_is_reused(fake_session, fake_evaluator):
+    evaluator = fake_evaluator(version="v2")
+    stored = JobEvaluation(job_id="job-1", evaluation_version="v2")
+
+    evaluation, source = await OnDemandEvaluator(evaluator).evaluate(
+        Job(id="job-1"), fake_session({"job-1": stored})
+    )
+
+    assert (evaluation, source, evaluator.calls) == (stored, "existing", 0)
+
+
+async def test_editing_the_default_profile_rebuilds_the_evaluator(
+    monkeypatch, fake_session, fake_client
+):
+    monkeypatch.setattr(on_demand_module, "create_backend", fake_client)
+    monkeypatch.setattr(on_demand_module, "_on_demand", None)
+    monkeypatch.setattr(on_demand_module, "_telemetry", None)
+    monkeypatch.setattr(on_demand_module, "_client", None)
+    profile = FreelancerProfile(id="default", expertise=[
+        {"id": 1, "name": "Computer Vision", "level": "Expert", "keywords": ["OpenCV"]},
+    ])
+    db = fake_session({"default": profile})
+
+    try:
+        on_demand = await get_on_demand_evaluator(db)
+        first = on_demand.evaluator
+        assert "1. Computer Vision (Expert): OpenCV" in first.system_prompt
+        assert (await get_on_demand_evaluator(db)).evaluator is first
+
+        profile.expertise = profile.expertise + [
+            {"id": 2, "name": "Robotics", "level": "Advanced", "keywords": ["ROS"]},
+        ]
+        assert await get_on_demand_evaluator(db) is on_demand
+        assert "2. Robotics (Advanced): ROS" in on_demand.evaluator.system_prompt
+        assert on_demand.evaluator.version != first.version
+    finally:
+        await on_demand_module.close_on_demand_evaluator()
+
+
+async def test_waiter_takes_over_the_call_of_a_cancelled_request(fake_session, fake_evaluator):
+    evaluator = fake_evaluator(version="v2", delay=0.02)
+    on_demand = OnDemandEvaluator(evaluator)
+    job = Job(id="job-1")
+
+    first = asyncio.create_task(on_demand.evaluate(job, fake_session()))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(on_demand.evaluate(job, fake_session()))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    evaluation, source = await second
+    assert first.cancelled()
+    assert (evaluation.job_id, source, evaluator.calls) == ("job-1", "evaluated", 2)
+    assert on_demand._in_flight == {}
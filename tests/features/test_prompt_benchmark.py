@@ -0,0 +1,121 @@
+from core.llm import ChatCompletionResult, LLMCallError
+from features.job_processing.models.evaluation import JobEvaluation
+from features.job_processing.models.job import Job
+from features.job_processing.services.prompt_benchmark import PromptBenchmark, render_markdown
+
+
+def evaluation(job_id, priority, score_total, is_ai_related=1, **scores):
+    components = {f"score_{c}": 0 for c in ("budget", "client", "clarity", "tech_fit", "timeline")}
+    return JobEvaluation(
+        job_id=job_id,
+        is_ai_related=is_ai_related,
+        priority=priority,
+        score_total=score_total,
+        **{**components, **scores},
+    )
+
+
+class VariantClient:
+    """Answers the baseline prompt after one bad attempt; every compact call fails."""
+
+    model = "fake-model"
+
+    async def chat_completion_result(self, messages, response_model):
+        if messages[0]["content"].startswith("Evaluate Upwork jobs"):
+            raise LLMCallError("LLM call failed after 3 attempts", ChatCompletionResult(
+                response=None, attempts=3, parse_failures=3,
+            ))
+        return ChatCompletionResult(
+            response=response_model(is_ai_related=True, score_total=60, priority="Medium"),
+            prompt_tokens=100,
+            completion_tokens=20,
+            latency=1.0,
+            attempts=2,
+            parse_failures=1,
+        )
+
+
+async def test_failed_calls_count_towards_the_parse_failure_rate():
+    benchmark = PromptBenchmark(VariantClient(), ["compact"])
+    jobs = [Job(id=f"j{i}", title=f"Job {i}", description="", type="HOURLY", url="u") for i in range(2)]
+
+    report = await benchmark.run(jobs)
+
+    baseline, compact = report["variants"]["baseline"], report["variants"]["compact"]
+    assert (baseline["calls"], baseline["failed_calls"], baseline["parse_failure_rate"]) == (2, 0, 0.5)
+    assert baseline["total_tokens"] == 240
+    assert (compact["calls"], compact["failed_calls"], compact["parse_failure_rate"]) == (0, 2, 1.0)
+    assert report["agreement"]["compact"]["jobs_compared"] == 0
+
+
+def test_agreement_compares_jobs_both_variants_evaluated():
+    baseline = {
+        "j1": evaluation("j1", "High", 85, score_budget=9),
+        "j2": evaluation("j2", "Medium", 60),
+        "j3": evaluation("j3", "Low", 0, is_ai_related=0),
+        "j4": evaluation("j4", "Low", 30),
+        "j5": evaluation("j5", "High", 90),  # the variant failed on j5
+    }
+    variant = {
+        "j1": evaluation("j1", "Medium", 75, score_budget=7),
+        "j2": evaluation("j2", "Medium", 66),
+        "j3": evaluation("j3", "Low", 20),
+        "j4": evaluation("j4", "Low", 30),
+        "j5": None,
+    }
+
+    agreement = PromptBenchmark(VariantClient(), [])._agreement(baseline, variant)
+
+    assert agreement["jobs_compared"] == 4
+    assert agreement["is_ai_related_agreement"] == 0.75
+    assert agreement["priority_agreement"] == 0.75
+    assert agreement["priority_confusion"] == {
+        "High": {"High": 0, "Medium": 1, "Low": 0},
+        "Medium": {"High": 0, "Medium": 1, "Low": 0},
+        "Low": {"High": 0, "Medium": 0, "Low": 2},
+    }
+    # Score deltas only cover jobs both variants call AI-related: -10, +6, 0
+    assert round(agreement["score_total_delta_mean"], 6) == round(-4 / 3, 6)
+    assert round(agreement["score_total_delta_mean_abs"], 6) == round(16 / 3, 6)
+    assert agreement["score_total_delta_max_abs"] == 10
+    assert round(agreement["component_delta_mean_abs"]["budget"], 6) == round(2 / 3, 6)
+    assert agreement["component_delta_mean_abs"]["client"] == 0
+
+
+def test_render_markdown_lists_variants_and_the_confusion_matrix():
+    stats = {
+        "system_prompt_chars": 1200, "calls": 10, "failed_calls": 1, "parse_failure_rate": 0.125,
+        "prompt_tokens_mean": 850.4, "completion_tokens_mean": 120.6, "total_tokens": 9710,
+        "latency_p50": 1.234, "latency_p95": 2.5,
+    }
+    agreement = {
+        "jobs_compared": 9,
+        "is_ai_related_agreement": 1.0,
+        "priority_agreement": 8 / 9,
+        "priority_confusion": {
+            "High": {"High": 2, "Medium": 1, "Low": 0},
+            "Medium": {"High": 0, "Medium": 3, "Low": 0},
+            "Low": {"High": 0, "Medium": 0, "Low": 3},
+        },
+        "score_total_delta_mean": -1.5,
+        "score_total_delta_mean_abs": 2.3,
+        "score_total_delta_max_abs": 12.0,
+        "component_delta_mean_abs": {"budget": 0.5, "client": 0.0},
+    }
+    report = {
+        "sample_size": 10,
+        "baseline": "baseline",
+        "variants": {"baseline": stats, "compact": stats},
+        "agreement": {"compact": agreement},
+    }
+
+    markdown = render_markdown(report)
+
+    assert "Sample: 10 jobs, baseline: `baseline`" in markdown
+    assert "| compact | 1200 | 10 | 1 | 12.5% | 850 | 121 | 1.23 | 2.50 |" in markdown
+    assert "## `compact` vs `baseline`" in markdown
+    assert "- Priority agreement: 88.9%" in markdown
+    assert "- score_total delta: mean -1.5, mean abs 2.3, max abs 12" in markdown
+    assert "- Component mean abs delta: budget 0.50, client 0.00" in markdown
+    assert "| Baseline \\ Variant | High | Medium | Low |\n|---|---|---|---|\n| High | 2 | 1 | 0 |" in markdown
+    assert markdown.endswith("| Low | 0 | 0 | 3 |\n")
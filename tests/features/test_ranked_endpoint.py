@@ -0,0 +1,27 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from core.database import get_db
+from features.job_processing.models.profile import FreelancerProfile
+from features.job_processing.services import score_cache
+from main import app
+
+
+@pytest.fixture
+def api(fake_session):
+    """Client for the app with get_db stubbed; only the "default" profile is stored."""
+    db = fake_session({"default": FreelancerProfile(id="default")})
+    app.dependency_overrides[get_db] = lambda: db
+    yield AsyncClient(transport=ASGITransport(app=app), base_url="http://test"), db
+    app.dependency_overrides.pop(get_db)
+
+
+async def test_reranking_for_an_unknown_profile_allocates_no_cache(api):
+    client, db = api
+
+    async with client:
+        response = await client.get("/jobs/ranked", params={"w_budget": 1, "profile_id": "nope"})
+
+    assert response.status_code == 404
+    assert "nope" not in score_cache._caches
+    assert db.statements == []
@@ -0,0 +1,108 @@
+import asyncio
+import re
+
+from sqlalchemy import column, create_engine, select, table
+from sqlalchemy.dialects import postgresql
+
+from features.job_processing.models.job import Job
+from features.job_processing.services import reevaluation
+from features.job_processing.services.evaluator import is_stale, stale_clause
+from features.job_processing.services.reevaluation import ReevaluationScheduler
+
+
+def sql(statement) -> str:
+    return str(statement.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    ))
+
+
+class StaleRows:
+    """Answers the scheduler's queries from a list of stale jobs, best score first.
+
+    Jobs whose evaluation the writer persisted are no longer stale; the
+    query's NOT IN and LIMIT are honoured like the database would.
+    """
+
+    def __init__(self, scores, writer):
+        self.jobs = [(Job(id=job_id, title=f"Job {job_id}"), score) for job_id, score in scores]
+        self.writer = writer
+
+    def __call__(self, statement):
+        persisted = {e.job_id for e in self.writer.added} - self.writer.failed_ids
+        stale = [(job, score) for job, score in self.jobs if job.id not in persisted]
+        text = sql(statement)
+        if text.startswith("SELECT count("):
+            return [(len(stale),)]
+        excluded = text.split("NOT IN", 1)[1] if "NOT IN" in text else ""
+        limit = int(re.search(r"LIMIT (\d+)", text).group(1))
+        return [(job, score) for job, score in stale if f"'{job.id}'" not in excluded][:limit]
+
+
+def stale_versions(current, stored):
+    """Stored versions the stale clause selects, run against in-memory SQLite."""
+    evaluations = table("job_evaluations", column("evaluation_version"))
+    with create_engine("sqlite://").connect() as conn:
+        conn.exec_driver_sql("CREATE TABLE job_evaluations (evaluation_version VARCHAR(16))")
+        conn.execute(evaluations.insert(), [{"evaluation_version": v} for v in stored])
+        query = select(evaluations.c.evaluation_version).where(
+            stale_clause(evaluations.c.evaluation_version, current)
+        )
+        return set(conn.execute(query).scalars())
+
+
+def test_stale_clause_is_limited_to_the_evaluators_kind(fake_evaluator):
+    scheduler = ReevaluationScheduler(fake_evaluator(version="sgl-aaaa"), rate_per_minute=60)
+
+    clause = sql(scheduler._stale_clause())
+
+    assert "job_evaluations.evaluation_version IS NULL" in clause
+    # % is doubled for the driver's paramstyle
+    assert "job_evaluations.evaluation_version LIKE 'sgl-%%'" in clause
+
+
+def test_decomposed_row_is_not_stale_for_a_single_mode_scheduler():
+    stored = [None, "sgl-aaaa", "sgl-bbbb", "dec-cccc", "fan-dddd", "clf-eeee", "0123456789abcdef"]
+
+    # Older single-prompt rows and rows stamped before kinds existed are redone
+    assert stale_versions("sgl-aaaa", stored) == {None, "sgl-bbbb", "0123456789abcdef"}
+    assert stale_versions("dec-ffff", stored) == {None, "dec-cccc", "0123456789abcdef"}
+    for version in stored:
+        assert is_stale(version, "sgl-aaaa") == (version in {None, "sgl-bbbb", "0123456789abcdef"})
+
+
+async def test_run_once_skips_failures_and_stops_at_limit(
+    monkeypatch, fake_session, fake_evaluator, fake_writer
+):
+    writer = fake_writer(fail_ids={"j3"})  # stored evaluation of j3 fails
+    monkeypatch.setattr(reevaluation, "EvaluationWriter", lambda: writer)
+    evaluator = fake_evaluator(fail_ids={"j1"})  # LLM call for j1 fails
+    db = fake_session(respond=StaleRows(
+        [("j1", 90), ("j2", 80), ("j3", 70), ("j4", 60), ("j5", 50), ("j6", 40)], writer
+    ))
+    scheduler = ReevaluationScheduler(evaluator, rate_per_minute=60_000, batch_size=2)
+
+    results = await scheduler.run_once(db, limit=3)
+
+    assert results == {"stale": 6, "reevaluated": 3, "errors": 2, "remaining": 3}
+    # Failed jobs are excluded from later batches instead of being retried
+    assert [e.job_id for e in writer.added] == ["j2", "j3", "j4", "j5"]
+    assert evaluator.calls == 5
+    queries = [sql(s) for s in db.statements[1:]]
+    assert "NOT IN" not in queries[0]
+    excluded = queries[2].split("NOT IN", 1)[1]
+    assert "'j1'" in excluded and "'j3'" in excluded
+    assert [re.search(r"LIMIT (\d+)", q).group(1) for q in queries] == ["2", "2", "1"]
+    assert "ORDER BY job_evaluations.score_total DESC, jobs.ts_publish DESC" in queries[0]
+
+
+async def test_wait_for_slot_paces_calls(fake_evaluator):
+    scheduler = ReevaluationScheduler(fake_evaluator(), rate_per_minute=3000)  # one per 20 ms
+    loop = asyncio.get_running_loop()
+
+    started = loop.time()
+    for _ in range(4):
+        await scheduler._wait_for_slot()
+    elapsed = loop.time() - started
+
+    # The first call goes immediately, the next three wait one interval each
+    assert 0.06 <= elapsed < 0.5
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from features.job_processing.utils.score_ranking import (
+    priorities,
+    resolve_weights,
+    top_k,
+    weighted_totals,
+)
+
+
+def test_default_weights_match_stored_totals():
+    scores = np.array([[10, 10, 10, 10, 10], [8, 6, 7, 9, 5], [0, 0, 0, 0, 0]], dtype=float)
+    totals = weighted_totals(scores, resolve_weights({}))
+
+    assert totals.tolist() == [100, 75, 0]
+    assert priorities(totals).tolist() == ["High", "Medium", "Low"]
+
+
+def test_custom_weights_rerank():
+    scores = np.array([[10, 0, 0, 0, 0], [0, 0, 0, 10, 0]], dtype=float)
+    totals = weighted_totals(scores, resolve_weights({"budget": 1.0, "tech_fit": 0.0}))
+
+    assert totals.tolist()[0] > totals.tolist()[1]
+    assert top_k(totals, np.ones(2, dtype=bool), 1).tolist() == [0]
+
+
+def test_invalid_weights_rejected():
+    with pytest.raises(ValueError):
+        resolve_weights({"budget": 0, "client": 0, "clarity": 0, "tech_fit": 0, "timeline": 0})
+    with pytest.raises(ValueError):
+        resolve_weights({"salary": 1.0})
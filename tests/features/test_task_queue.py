@@ -0,0 +1,129 @@
+import re
+from datetime import timedelta
+
+from sqlalchemy.dialects.postgresql import psycopg2
+
+from features.job_processing.models.evaluation_task import EvaluationTask
+from features.job_processing.models.job import Job
+from features.job_processing.services.task_queue import EvaluationTaskQueue
+from features.job_processing.services.worker import EvaluationWorker
+
+
+def compiled(statement):
+    return statement.compile(dialect=psycopg2.dialect())
+
+
+def sql(statement) -> str:
+    """Compiled SQL on one line, with every bound parameter shown as ?."""
+    text = re.sub(r"%\(\w+\)s|__\[POSTCOMPILE_\w+\]", "?", str(compiled(statement)))
+    return " ".join(text.split())
+
+
+async def test_enqueue_keeps_the_higher_priority_and_resets_finished_tasks(fake_session):
+    db = fake_session()
+
+    assert await EvaluationTaskQueue().enqueue(db, [("j1", 5), ("j2", 0)]) == 2
+
+    (statement,) = db.statements
+    text = sql(statement)
+    assert "ON CONFLICT (job_id) DO UPDATE SET" in text
+    assert "priority = greatest(evaluation_tasks.priority, excluded.priority)" in text
+    finished = "WHEN (evaluation_tasks.state IN (?))"
+    assert f"state = CASE {finished} THEN ? ELSE evaluation_tasks.state END" in text
+    assert f"attempts = CASE {finished} THEN ? ELSE evaluation_tasks.attempts END" in text
+    params = list(compiled(statement).params.values())
+    assert ["done", "failed"] in params and "pending" in params
+    assert db.commits == 1
+
+
+async def test_enqueue_without_jobs_does_not_touch_the_database(fake_session):
+    db = fake_session()
+
+    assert await EvaluationTaskQueue().enqueue(db, []) == 0
+    assert db.statements == []
+
+
+async def test_claim_skips_locked_rows_and_reclaims_expired_leases(fake_session):
+    task = EvaluationTask(id=1, job_id="j1", state="running", attempts=1)
+    # Only the claiming UPDATE ... RETURNING yields rows
+    db = fake_session(respond=lambda statement: [task] if "RETURNING" in sql(statement) else [])
+
+    claimed = await EvaluationTaskQueue(lease_seconds=90).claim(db, "worker-1", limit=2)
+
+    assert claimed == [task]
+    expire, claim = (sql(s) for s in db.statements)
+    lease_expired = (
+        "evaluation_tasks.state = ? AND evaluation_tasks.lease_expires_at < timezone(?, now())"
+    )
+    # Expired leases without attempts left are failed instead of staying "running"
+    assert expire.startswith("UPDATE evaluation_tasks SET state=?")
+    assert f"WHERE {lease_expired} AND evaluation_tasks.attempts >= evaluation_tasks.max_attempts" in expire
+    assert compiled(db.statements[0]).params["state"] == "failed"
+
+    assert f"WHERE (evaluation_tasks.state = ? OR {lease_expired})" in claim
+    assert "AND evaluation_tasks.attempts < evaluation_tasks.max_attempts" in claim
+    assert "ORDER BY evaluation_tasks.priority DESC, evaluation_tasks.id LIMIT ? FOR UPDATE SKIP LOCKED" in claim
+    assert "attempts=(evaluation_tasks.attempts + ?)" in claim
+    assert "RETURNING evaluation_tasks.id" in claim
+    params = compiled(db.statements[1]).params
+    assert (params["state"], params["locked_by"]) == ("running", "worker-1")
+    assert {"pending", "running", "utc", 2, timedelta(seconds=90)} <= set(params.values())
+    assert db.commits == 1
+
+
+async def test_fail_gives_up_after_max_attempts(fake_session):
+    db = fake_session()
+
+    await EvaluationTaskQueue().fail(db, EvaluationTask(id=7, job_id="j7"), "x" * 5000)
+
+    (statement,) = db.statements
+    text = sql(statement)
+    assert (
+        "state=CASE WHEN (evaluation_tasks.attempts >= evaluation_tasks.max_attempts) "
+        "THEN ? ELSE ? END"
+    ) in text
+    assert text.endswith("WHERE evaluation_tasks.id = ?")
+    params = compiled(statement).params
+    assert [v for v in params.values() if v in ("failed", "pending")] == ["failed", "pending"]
+    assert params["locked_by"] is None and params["lease_expires_at"] is None
+    assert len(params["last_error"]) == 2000
+    assert 7 in params.values()
+
+
+class FakeQueue:
+    """Hands out `tasks` one claim at a time and records failed attempts."""
+
+    def __init__(self, tasks):
+        self.tasks = list(tasks)
+        self.claims = 0
+        self.failed = []
+
+    async def claim(self, db, worker_id, limit=1):
+        self.claims += 1
+        claimed, self.tasks = self.tasks[:limit], self.tasks[limit:]
+        return claimed
+
+    async def fail(self, db, task, error):
+        self.failed.append((task.job_id, error))
+
+
+async def test_draining_worker_evaluates_every_task_and_stops_when_empty(
+    fake_session, fake_evaluator
+):
+    jobs = {f"j{i}": Job(id=f"j{i}", title=f"Job {i}") for i in range(5)}
+    queue = FakeQueue(EvaluationTask(id=i, job_id=f"j{i}") for i in range(5))
+    db = fake_session(jobs)
+    evaluator = fake_evaluator(delay=0.01, fail_ids={"j2"})
+    worker = EvaluationWorker(
+        evaluator, queue, concurrency=3, worker_id="w", session_factory=lambda: db
+    )
+
+    results = await worker.run(drain=True)
+
+    assert results == {"evaluated": 4, "ai_related": 4, "not_ai_related": 0, "errors": 1}
+    assert evaluator.peak == 3
+    assert queue.failed == [("j2", "RuntimeError: LLM call failed for j2")]
+    # Every slot stops at its first empty claim
+    assert queue.claims == 5 + 3
+    # The writer marked the stored tasks done
+    assert any("UPDATE evaluation_tasks SET state" in sql(s) for s in db.statements)
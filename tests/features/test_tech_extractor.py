@@ -0,0 +1,24 @@
+from features.job_processing.utils.tech_extractor import TECH_DICTIONARY, extract_tech
+
+
+def test_aliases_map_to_canonical_tags_in_mention_order():
+    tags, expertise_ids = extract_tech(
+        "RAG chatbot on postgres + PGVector. Python/FastAPI backend, Next.js UI, "
+        "deployed with docker-compose. Postgres again."
+    )
+
+    assert tags == ["RAG", "PostgreSQL", "pgvector", "Python", "FastAPI", "Next.js", "Docker"]
+    assert expertise_ids == [2, 4, 5, 6]
+
+
+def test_terms_inside_other_words_do_not_match():
+    tags, expertise_ids = extract_tech("Ragged reactor drag-and-drop storage, nodejs.org clone")
+
+    assert tags == []
+    assert expertise_ids == []
+
+
+def test_every_alias_matches_itself():
+    for canonical, (aliases, _) in TECH_DICTIONARY.items():
+        for alias in aliases:
+            assert extract_tech(f"We need {alias}.")[0] == [canonical], alias
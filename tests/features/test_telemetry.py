@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+from core.llm import ChatCompletionResult, LLMCallError
+from features.job_processing.models.job import Job
+from features.job_processing.services.decomposed import DecomposedEvaluator
+from features.job_processing.services.evaluator import JobEvaluator
+from features.job_processing.services.telemetry import TelemetryWriter
+
+
+async def test_calls_are_recorded_and_written_in_batches(fake_session, fake_evaluator):
+    db = fake_session()
+    telemetry = TelemetryWriter(session_factory=lambda: db, batch_size=2, flush_interval=60)
+    evaluator = fake_evaluator(version="v1")
+    seen = []
+    evaluator.on_completion = lambda job_id, result: seen.append(job_id)
+
+    async with telemetry:
+        telemetry.attach(evaluator)
+        for job_id in ("a", "b", "c"):
+            evaluator.on_completion(job_id, ChatCompletionResult(
+                response=object(),
+                prompt_tokens=1000,
+                completion_tokens=200,
+                latency=1.5,
+                attempts=2,
+                backend="cerebras",
+                cost_usd=0.003,
+            ))
+            await asyncio.sleep(0)
+
+    assert seen == ["a", "b", "c"]  # existing hook still runs
+    assert telemetry.written == 3
+    assert len(db.statements) == 2  # one full batch, the rest on close
+    row = db.statements[0].compile().params
+    assert row["model_m0"] == "fake-model"
+    assert row["evaluation_version_m0"] == "v1"
+    assert row["attempts_m0"] == 2
+    assert row["failed_m0"] is False
+
+
+def failed_call():
+    return LLMCallError("LLM call failed after 3 attempts", ChatCompletionResult(
+        response=None, latency=7.0, attempts=3, parse_failures=2, backend="cerebras",
+    ))
+
+
+@pytest.mark.parametrize("evaluator_class, response_model", [
+    (JobEvaluator, "JobEvaluationResponse"),
+    (DecomposedEvaluator, "RelevanceResponse"),
+])
+async def test_calls_failing_every_attempt_are_recorded(
+    fake_session, fake_client, evaluator_class, response_model
+):
+    db = fake_session()
+    # The decomposed evaluator cancels its other calls before they finish
+    client = fake_client(
+        {response_model: failed_call()}, delays={"TechFitResponse": 1, "RubricResponse": 1}
+    )
+    telemetry = TelemetryWriter(session_factory=lambda: db, flush_interval=60)
+
+    async with telemetry:
+        evaluator = telemetry.attach(evaluator_class(client))
+        with pytest.raises(LLMCallError):
+            await evaluator.evaluate(Job(id="job-1", title="RAG bot", description="", type="HOURLY", url="u"))
+
+    (statement,) = db.statements
+    row = statement.compile().params
+    assert (row["job_id_m0"], row["failed_m0"]) == ("job-1", True)
+    assert (row["attempts_m0"], row["parse_failures_m0"], row["latency_m0"]) == (3, 2, 7.0)
+    assert row["prompt_tokens_m0"] == 0
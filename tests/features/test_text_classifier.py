@@ -0,0 +1,43 @@
+from features.job_processing.utils.text_classifier import (
+    HashedLogisticRegression,
+    calibration_report,
+)
+
+AI_TEXTS = [
+    "Build a RAG chatbot with LangChain and a vector database",
+    "LLM agent for customer support using OpenAI embeddings",
+    "Fine-tune a local LLM with ollama for document retrieval",
+    "Voice AI assistant with speech-to-text and GPT",
+] * 5
+OTHER_TEXTS = [
+    "Logo design for a bakery brand",
+    "Bookkeeping and QuickBooks reconciliation",
+    "Translate product descriptions from German to English",
+    "Shopify theme tweaks and product photo editing",
+] * 5
+
+
+def test_classifier_separates_ai_jobs():
+    model = HashedLogisticRegression(n_features=2 ** 12).fit(
+        AI_TEXTS + OTHER_TEXTS, [1] * len(AI_TEXTS) + [0] * len(OTHER_TEXTS)
+    )
+    ai, other = model.predict_proba(["RAG pipeline with embeddings", "Bakery logo design"])
+    assert ai > 0.5 > other
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    model = HashedLogisticRegression(n_features=2 ** 12).fit(
+        AI_TEXTS + OTHER_TEXTS, [1] * len(AI_TEXTS) + [0] * len(OTHER_TEXTS)
+    )
+    path = tmp_path / "model.npz"
+    model.save(path, skip_threshold=0.05)
+
+    loaded, metadata = HashedLogisticRegression.load(path)
+    assert metadata["skip_threshold"] == 0.05
+    assert abs(loaded.predict_proba(["LLM agent"])[0] - model.predict_proba(["LLM agent"])[0]) < 1e-4
+
+
+def test_calibration_report_counts_skipped_positives():
+    report = calibration_report([0.01, 0.02, 0.9, 0.6], [0, 1, 1, 1], skip_threshold=0.03)
+    assert report["llm_calls_saved"] == 0.5
+    assert report["positives_skipped"] == 1